@@ -0,0 +1,132 @@
+"""
+Count API calls of fixed versus adaptive polling over a simulated day.
+
+A ten-vehicle fleet is simulated for 24 hours: two vehicles drive for two
+hours each, one charges for three hours and the rest stay parked. Every wake-up
+of the coordinator costs one vehicle list call plus two calls (details and
+system overview) per vehicle fetched. "Fixed" polls the whole fleet at the
+configured interval; "adaptive" uses the per-vehicle ``PollScheduler`` and
+also fetches vehicles whose listed ignition or charging state changed. The
+mean data age is sampled every second, separately for driving and charging.
+"quiet" adds quiet hours from 22:00 to 06:00; overnight calls are the calls
+made in that window.
+
+Run from the repository root:
+
+    python benchmarks/bench_adaptive_polling.py
+"""
+
+from __future__ import annotations
+
+import sys
+from datetime import UTC, datetime, time, timedelta
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.volkswagen_goconnect.scheduler import PollScheduler, is_active
+
+FLEET_SIZE = 10
+BASE_INTERVAL = timedelta(seconds=60)
+DAY = 24 * 3600
+START = datetime(2025, 12, 19, tzinfo=UTC)
+# Overnight hours, also used as the quiet hours of the "quiet" run
+NIGHT_START = 22
+NIGHT_END = 6
+# vehicle index -> (state, start second, end second)
+ACTIVITY = {
+    0: ("driving", 8 * 3600, 10 * 3600),
+    1: ("driving", 17 * 3600, 19 * 3600),
+    2: ("charging", 20 * 3600, 23 * 3600),
+}
+
+
+def _vehicle(index: int, second: int) -> dict[str, Any]:
+    """Return the state the backend reports for a vehicle at a given second."""
+    state, start, end = ACTIVITY.get(index, ("parked", 0, 0))
+    active = start <= second < end
+    vehicle: dict[str, Any] = {"ignition": {"on": active and state == "driving"}}
+    if active and state == "charging":
+        vehicle["isCharging"] = True
+        vehicle["chargingStatus"] = {
+            "timeUntil80PercentCharge": max((end - second) // 60 - 30, 0)
+        }
+    return vehicle
+
+
+def _state(index: int, second: int) -> str:
+    state, start, end = ACTIVITY.get(index, ("parked", 0, 0))
+    return state if start <= second < end else "parked"
+
+
+def _overnight(second: int) -> bool:
+    return not NIGHT_END * 3600 <= second < NIGHT_START * 3600
+
+
+def _run(
+    *, adaptive: bool, quiet_hours: tuple[time, time] | None = None
+) -> tuple[int, int, dict[str, float]]:
+    """Simulate a day; return all and overnight API calls and mean data ages."""
+    scheduler = PollScheduler(BASE_INTERVAL)
+    scheduler.quiet_hours = quiet_hours
+    fetched_at = dict.fromkeys(range(FLEET_SIZE), 0)
+    fetched_active = dict.fromkeys(range(FLEET_SIZE), False)
+    calls = overnight = 0
+    next_wakeup = 0
+    ages: dict[str, list[int]] = {"driving": [], "charging": []}
+    for second in range(DAY):
+        if second >= next_wakeup:
+            now = START + timedelta(seconds=second)
+            if scheduler.quiet(now):
+                # The coordinator fetches nothing during the quiet hours
+                next_wakeup = second + int(scheduler.next_wakeup(now).total_seconds())
+                continue
+            due = (
+                scheduler.due(range(FLEET_SIZE), now)
+                | {
+                    index
+                    for index in range(FLEET_SIZE)
+                    if is_active(_vehicle(index, second)) != fetched_active[index]
+                }
+                if adaptive
+                else set(range(FLEET_SIZE))
+            )
+            calls += 1 + 2 * len(due)
+            if _overnight(second):
+                overnight += 1 + 2 * len(due)
+            for index in due:
+                fetched_at[index] = second
+                fetched_active[index] = is_active(_vehicle(index, second))
+                scheduler.record(index, _vehicle(index, second), now)
+            interval = scheduler.next_wakeup(now) if adaptive else BASE_INTERVAL
+            next_wakeup = second + int(interval.total_seconds())
+        for index in range(FLEET_SIZE):
+            if (state := _state(index, second)) in ages:
+                ages[state].append(second - fetched_at[index])
+    return (
+        calls,
+        overnight,
+        {state: sum(age) / len(age) if age else 0.0 for state, age in ages.items()},
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(f"fleet: {FLEET_SIZE} vehicles, base interval {BASE_INTERVAL}, 24 h")
+    quiet_hours = (time(NIGHT_START), time(NIGHT_END))
+    for label, adaptive, quiet in (
+        ("fixed", False, None),
+        ("adaptive", True, None),
+        ("quiet", True, quiet_hours),
+    ):
+        calls, overnight, ages = _run(adaptive=adaptive, quiet_hours=quiet)
+        print(
+            f"{label:>8}: {calls:>6,} API calls ({overnight:>5,} overnight), "
+            f"mean data age driving {ages['driving']:5.1f} s, "
+            f"charging {ages['charging']:5.1f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
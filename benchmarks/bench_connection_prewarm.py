@@ -0,0 +1,253 @@
+"""
+Measure the time to first byte of polls after idle gaps.
+
+A local TLS server stands in for the API host. It sits behind a proxy that
+delays every chunk by ``ONE_WAY_DELAY`` in each direction (a round trip of
+twice that), and its host name resolves with a ``DNS_DELAY`` lookup. The
+server closes idle connections after ``SERVER_KEEPALIVE`` seconds (checked
+about once a second), and ``POLLS`` polls of ``REQUESTS_PER_POLL`` requests
+are spaced ``POLL_GAP`` seconds apart, longer than that. These are scaled-down
+stand-ins for the real case, where parked vehicles are polled every 15
+minutes.
+
+- "default" uses aiohttp's default connector. Its 10 s DNS cache has
+  expired by the next real poll, so it is modelled as no cache.
+- "tuned" uses ``create_connector``, whose DNS cache outlives the gap.
+- "tuned + pre-warm" also sends the client's pre-warm request
+  ``PREWARM_LEAD`` seconds before each poll.
+
+The time to first byte (TTFB) is measured with aiohttp trace hooks, from the
+request start to the received response headers.
+
+Run from the repository root:
+
+    python benchmarks/bench_connection_prewarm.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import socket
+import ssl
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+from aiohttp import web
+from aiohttp.abc import AbstractResolver
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.volkswagen_goconnect.session import create_connector
+
+HOST = "api.test"
+ONE_WAY_DELAY = 0.02
+DNS_DELAY = 0.03
+SERVER_KEEPALIVE = 0.5
+POLL_GAP = 2.5
+PREWARM_LEAD = 0.2
+POLLS = 8
+REQUESTS_PER_POLL = 3
+
+
+class _SlowResolver(AbstractResolver):
+    """Resolve the stand-in host to the local proxy after a lookup delay."""
+
+    def __init__(self, port: int) -> None:
+        self._port = port
+
+    async def resolve(
+        self,
+        host: str,
+        port: int = 0,  # noqa: ARG002
+        family: int = socket.AF_INET,
+    ) -> list[dict[str, Any]]:
+        await asyncio.sleep(DNS_DELAY)
+        return [
+            {
+                "hostname": host,
+                "host": "127.0.0.1",
+                "port": self._port,
+                "family": family,
+                "proto": 0,
+                "flags": socket.AI_NUMERICHOST,
+            }
+        ]
+
+    async def close(self) -> None:
+        """Close the resolver."""
+
+
+def _certificate(directory: Path) -> tuple[Path, Path]:
+    """Write a self-signed certificate for the stand-in host."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, HOST)])
+    now = datetime.datetime.now(datetime.UTC)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName([x509.DNSName(HOST)]), critical=False
+        )
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = directory / "cert.pem"
+    key_path = directory / "key.pem"
+    cert_path.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return cert_path, key_path
+
+
+async def _pipe(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Forward one direction of a connection, delaying every chunk."""
+    try:
+        while chunk := await reader.read(65536):
+            await asyncio.sleep(ONE_WAY_DELAY)
+            writer.write(chunk)
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def _start_proxy(target_port: int) -> asyncio.Server:
+    """Start a TCP proxy adding latency in front of the server."""
+
+    async def _handle(
+        client_reader: asyncio.StreamReader, client_writer: asyncio.StreamWriter
+    ) -> None:
+        await asyncio.sleep(ONE_WAY_DELAY)  # SYN
+        server_reader, server_writer = await asyncio.open_connection(
+            "127.0.0.1", target_port
+        )
+        await asyncio.sleep(ONE_WAY_DELAY)  # SYN-ACK
+        await asyncio.gather(
+            _pipe(client_reader, server_writer), _pipe(server_reader, client_writer)
+        )
+
+    return await asyncio.start_server(_handle, "127.0.0.1", 0)
+
+
+async def _start_server(cert_path: Path, key_path: Path) -> web.AppRunner:
+    """Start the stand-in API server."""
+
+    async def _graphql(_: web.Request) -> web.Response:
+        return web.json_response({"data": {"viewer": {"vehicles": []}}})
+
+    async def _root(_: web.Request) -> web.Response:
+        return web.Response()
+
+    app = web.Application()
+    app.router.add_post("/graphql", _graphql)
+    app.router.add_get("/", _root)
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert_path, key_path)
+    runner = web.AppRunner(app, keepalive_timeout=SERVER_KEEPALIVE)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0, ssl_context=context)
+    await site.start()
+    return runner
+
+
+def _trace(first_byte: list[float]) -> aiohttp.TraceConfig:
+    """Return trace hooks recording the time to first byte of each request."""
+    trace = aiohttp.TraceConfig()
+
+    async def _start(_: Any, context: Any, __: Any) -> None:
+        context.start = time.perf_counter()
+
+    async def _end(_: Any, context: Any, params: Any) -> None:
+        if params.method == "POST":
+            first_byte.append(time.perf_counter() - context.start)
+
+    trace.on_request_start.append(_start)
+    trace.on_request_end.append(_end)
+    return trace
+
+
+async def _run(
+    label: str, port: int, client_context: ssl.SSLContext
+) -> tuple[list[float], list[float]]:
+    """Poll the stand-in server; return TTFBs of first and later requests."""
+    resolver = _SlowResolver(port)
+    if label == "default":
+        connector = aiohttp.TCPConnector(
+            ssl=client_context, resolver=resolver, use_dns_cache=False
+        )
+    else:
+        connector = create_connector(client_context, resolver=resolver)
+    first_byte: list[float] = []
+    first: list[float] = []
+    later: list[float] = []
+    async with aiohttp.ClientSession(
+        connector=connector, trace_configs=[_trace(first_byte)]
+    ) as session:
+        for _ in range(POLLS):
+            if label == "tuned + pre-warm":
+                await asyncio.sleep(POLL_GAP - PREWARM_LEAD)
+                async with session.get(f"https://{HOST}/") as response:
+                    await response.read()
+                await asyncio.sleep(PREWARM_LEAD)
+            else:
+                await asyncio.sleep(POLL_GAP)
+            first_byte.clear()
+            for _ in range(REQUESTS_PER_POLL):
+                async with session.post(f"https://{HOST}/graphql", json={}) as response:
+                    await response.read()
+            first.append(first_byte[0])
+            later.extend(first_byte[1:])
+    return first, later
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as directory:
+        cert_path, key_path = _certificate(Path(directory))
+        runner = await _start_server(cert_path, key_path)
+        server_port = runner.addresses[0][1]
+        proxy = await _start_proxy(server_port)
+        proxy_port = proxy.sockets[0].getsockname()[1]
+        client_context = ssl.create_default_context(cafile=cert_path)
+
+        print(
+            f"RTT {2 * ONE_WAY_DELAY * 1000:.0f} ms, DNS {DNS_DELAY * 1000:.0f} ms, "
+            f"{POLLS} polls after idle gaps longer than the server keep-alive"
+        )
+        for label in ("default", "tuned", "tuned + pre-warm"):
+            first, later = await _run(label, proxy_port, client_context)
+            print(
+                f"{label:>16}: first request TTFB median "
+                f"{statistics.median(first) * 1000:6.1f} ms, later requests "
+                f"{statistics.median(later) * 1000:5.1f} ms"
+            )
+
+        # Let the proxied connections wind down before stopping
+        await asyncio.sleep(4 * ONE_WAY_DELAY)
+        proxy.close()
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,104 @@
+"""
+Compare list-order and earliest-deadline-first polling of a large fleet.
+
+A 300-vehicle account is simulated for four hours with at most
+``MAX_VEHICLES_PER_POLL`` vehicles fetched per poll. Every hour a different
+tenth of the fleet drives. "List order" fetches the due vehicles in the order
+of the vehicle list; "EDF" uses ``PollScheduler.select``, which takes the
+earliest deadlines first and boosts driving vehicles. Data age is sampled
+every second for the driving vehicles.
+
+Run from the repository root:
+
+    python benchmarks/bench_edf_fleet.py
+"""
+
+from __future__ import annotations
+
+import sys
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.volkswagen_goconnect.scheduler import (
+    MAX_VEHICLES_PER_POLL,
+    PollScheduler,
+)
+
+FLEET_SIZE = 300
+BASE_INTERVAL = timedelta(seconds=60)
+DURATION = 4 * 3600
+START = datetime(2025, 12, 19, tzinfo=UTC)
+
+
+def _driving(index: int, second: int) -> bool:
+    """Return True if a vehicle drives at a given second."""
+    return index % 10 == (second // 3600) % 10
+
+
+def _vehicle(index: int, second: int) -> dict[str, Any]:
+    return {"ignition": {"on": _driving(index, second)}}
+
+
+def _run(*, edf: bool) -> tuple[int, int, float, float]:
+    """Simulate polling; return polls, missed deadlines and driving data age."""
+    scheduler = PollScheduler(BASE_INTERVAL)
+    ids = [f"{index:03d}" for index in range(FLEET_SIZE)]
+    fetched_at = dict.fromkeys(range(FLEET_SIZE), 0)
+    polls = 0
+    next_wakeup = 0
+    ages: list[int] = []
+    for second in range(DURATION):
+        if second >= next_wakeup:
+            now = START + timedelta(seconds=second)
+            if edf:
+                selected = scheduler.select(ids, now, MAX_VEHICLES_PER_POLL)
+            else:
+                selected = sorted(scheduler.due(ids, now))[:MAX_VEHICLES_PER_POLL]
+            # The vehicle list shows who started driving, as in the coordinator
+            selected += [
+                vehicle_id
+                for vehicle_id in ids
+                if vehicle_id not in selected
+                and scheduler.next_poll(vehicle_id) is not None
+                and _driving(int(vehicle_id), second)
+                and not _driving(int(vehicle_id), fetched_at[int(vehicle_id)])
+            ]
+            polls += 1
+            for vehicle_id in selected:
+                index = int(vehicle_id)
+                fetched_at[index] = second
+                scheduler.record(vehicle_id, _vehicle(index, second), now)
+            next_wakeup = second + int(scheduler.next_wakeup(now).total_seconds())
+        ages.extend(
+            second - fetched_at[index]
+            for index in range(FLEET_SIZE)
+            if _driving(index, second)
+        )
+    ages.sort()
+    return (
+        polls,
+        scheduler.missed_deadlines,
+        sum(ages) / len(ages),
+        ages[int(len(ages) * 0.95)],
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(
+        f"fleet: {FLEET_SIZE} vehicles, {MAX_VEHICLES_PER_POLL} per poll, "
+        f"{DURATION // 3600} h"
+    )
+    for label, edf in (("list order", False), ("EDF", True)):
+        polls, missed, mean_age, p95_age = _run(edf=edf)
+        print(
+            f"{label:>10}: {polls:>5} polls, {missed:>5} missed deadlines, "
+            f"driving data age mean {mean_age:6.1f} s, p95 {p95_age:5d} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Measure data latency and wasted polls with and without phase locking.
+
+One driving vehicle is simulated for two hours. The backend updates its
+telemetry every ``UPSTREAM_PERIOD`` with a random delay of up to
+``UPSTREAM_JITTER``. "Free running" polls at the driving interval regardless
+of the telemetry times; "phase locked" lets ``PollScheduler`` move each poll to
+just after the expected upstream update. Latency is the time from an upstream
+update to the poll that first sees it; a wasted poll sees nothing new.
+
+Run from the repository root:
+
+    python benchmarks/bench_phase_lock.py
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.volkswagen_goconnect.scheduler import (
+    PollScheduler,
+    vehicle_poll_interval,
+)
+
+BASE_INTERVAL = timedelta(seconds=60)
+UPSTREAM_PERIOD = 75
+UPSTREAM_JITTER = 3
+DURATION = 2 * 3600
+START = datetime(2025, 12, 19, tzinfo=UTC)
+SEED = 33
+
+
+def _upstream_updates(rng: random.Random) -> list[int]:
+    """Return the seconds at which the backend updates the vehicle."""
+    return [
+        second + rng.randint(0, UPSTREAM_JITTER)
+        for second in range(23, DURATION, UPSTREAM_PERIOD)
+    ]
+
+
+def _run(*, locked: bool) -> tuple[int, int, float]:
+    """Simulate polling and return polls, wasted polls and mean latency."""
+    updates = _upstream_updates(random.Random(SEED))
+    scheduler = PollScheduler(BASE_INTERVAL)
+    polls = wasted = 0
+    latencies: list[int] = []
+    seen = -1
+    second = 0
+    while second < DURATION:
+        published = [update for update in updates if update <= second]
+        polls += 1
+        if published and published[-1] != seen:
+            latencies.append(second - published[-1])
+            seen = published[-1]
+        else:
+            wasted += 1
+
+        now = START + timedelta(seconds=second)
+        vehicle = {"ignition": {"on": True}}
+        if published:
+            vehicle["ignition"]["time"] = (
+                START + timedelta(seconds=published[-1])
+            ).isoformat()
+        if locked:
+            scheduler.record("vehicle", vehicle, now)
+            next_poll = scheduler.next_poll("vehicle")
+        else:
+            next_poll = now + vehicle_poll_interval(vehicle, BASE_INTERVAL)
+        second = int((next_poll - START).total_seconds())
+    return polls, wasted, sum(latencies) / len(latencies)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(
+        f"upstream period {UPSTREAM_PERIOD} s (+0..{UPSTREAM_JITTER} s), "
+        f"{DURATION // 3600} h driving"
+    )
+    for label, locked in (("free running", False), ("phase locked", True)):
+        polls, wasted, latency = _run(locked=locked)
+        print(
+            f"{label:>12}: {polls:>4} polls, {wasted:>4} wasted, "
+            f"mean latency {latency:5.1f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Measure request bursts of several accounts with and without staggered polls.
+
+Ten accounts with five vehicles each are simulated for one hour. Every poll
+sends one vehicle list request plus two requests per vehicle, one after the
+other, through the shared per-host limiter (one request every
+``MIN_REQUEST_INTERVAL_SECONDS``); each request takes ``LATENCY`` seconds.
+"aligned" starts every account at the same moment, as at Home Assistant
+startup; "staggered" delays the first poll of each account by its
+``stagger_offset``; "staggered + jitter" also lengthens every interval by up to
+``JITTER``. Outstanding requests are those waiting for the limiter or in
+flight.
+
+Run from the repository root:
+
+    python benchmarks/bench_poll_stagger.py
+"""
+
+from __future__ import annotations
+
+import heapq
+import random
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.volkswagen_goconnect.limiter import (
+    MIN_REQUEST_INTERVAL_SECONDS,
+)
+from custom_components.volkswagen_goconnect.scheduler import jittered, stagger_offset
+
+ACCOUNTS = 10
+VEHICLES_PER_ACCOUNT = 5
+REQUESTS_PER_POLL = 1 + 2 * VEHICLES_PER_ACCOUNT
+INTERVAL = timedelta(seconds=60)
+JITTER = timedelta(seconds=5)
+LATENCY = 0.3
+DURATION = 3600
+SEED = 38
+
+
+def _poll_starts(account: int, *, staggered: bool, jitter: timedelta) -> list[float]:
+    """Return the start times of the polls of one account."""
+    start = (
+        stagger_offset(account, ACCOUNTS, INTERVAL).total_seconds() if staggered else 0
+    )
+    starts = []
+    while start < DURATION:
+        starts.append(start)
+        start += jittered(INTERVAL, jitter).total_seconds()
+    return starts
+
+
+def _run(*, staggered: bool, jitter: timedelta) -> tuple[int, float, float]:
+    """Simulate an hour; return peak outstanding requests and poll durations."""
+    random.seed(SEED)
+    # (ready time, poll start, requests left) of the next request of each poll
+    ready: list[tuple[float, float, int]] = [
+        (start, start, REQUESTS_PER_POLL)
+        for account in range(ACCOUNTS)
+        for start in _poll_starts(account, staggered=staggered, jitter=jitter)
+    ]
+    heapq.heapify(ready)
+    last_grant = -MIN_REQUEST_INTERVAL_SECONDS
+    events: list[tuple[float, int]] = []
+    durations: list[float] = []
+    while ready:
+        ready_at, poll_start, left = heapq.heappop(ready)
+        last_grant = max(ready_at, last_grant + MIN_REQUEST_INTERVAL_SECONDS)
+        done = last_grant + LATENCY
+        events += [(ready_at, 1), (done, -1)]
+        if left > 1:
+            heapq.heappush(ready, (done, poll_start, left - 1))
+        else:
+            durations.append(done - poll_start)
+
+    outstanding = peak = 0
+    for _, change in sorted(events):
+        outstanding += change
+        peak = max(peak, outstanding)
+    return peak, sum(durations) / len(durations), max(durations)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(
+        f"{ACCOUNTS} accounts x {REQUESTS_PER_POLL} requests per poll, "
+        f"interval {INTERVAL}, 1 h"
+    )
+    for label, staggered, jitter in (
+        ("aligned", False, timedelta(0)),
+        ("staggered", True, timedelta(0)),
+        ("staggered + jitter", True, JITTER),
+    ):
+        peak, mean_duration, max_duration = _run(staggered=staggered, jitter=jitter)
+        print(
+            f"{label:>18}: peak {peak:>2} outstanding requests, "
+            f"poll duration mean {mean_duration:5.1f} s, max {max_duration:5.1f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
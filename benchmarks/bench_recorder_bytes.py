@@ -0,0 +1,176 @@
+"""
+Estimate recorder payload per poll for a synthetic fleet.
+
+Builds every sensor entity for a 40-vehicle fleet and serialises what the
+recorder would receive for each written state: the state string plus the JSON
+of the recorded attributes (including the attributes Home Assistant adds, such
+as friendly_name and unit_of_measurement). Two scenarios are measured:
+
+- full write: every entity is written, as happens at startup, on reload and
+  after an availability flap;
+- steady poll: only entities whose recorded state or attributes changed since
+  the previous poll are written.
+
+"Before" records every attribute; "after" honours ``_unrecorded_attributes``.
+
+Run from the repository root:
+
+    python benchmarks/bench_recorder_bytes.py
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.volkswagen_goconnect.const import ATTRIBUTION
+from custom_components.volkswagen_goconnect.sensor import (
+    ENTITY_DESCRIPTIONS,
+    SENSOR_CLASSES,
+    WEEKDAYS,
+    VolkswagenGoConnectSensor,
+)
+
+FLEET_SIZE = 40
+POLLS = 20
+SEED = 26
+
+
+def _vehicle(index: int) -> dict[str, Any]:
+    """Return a fully populated synthetic vehicle."""
+    return {
+        "id": f"vehicle-{index}",
+        "vin": f"WVWZZZ{index:011d}",
+        "name": f"Fleet car {index}",
+        "licensePlate": f"FLT{index:03d}",
+        "make": "Volkswagen",
+        "model": "ID.4",
+        "year": 2023,
+        "fuelType": "electric",
+        "odometer": {"id": f"odo-{index}", "odometer": 10000 + index},
+        "chargePercentage": {"id": f"pct-{index}", "pct": 50},
+        "ignition": {"id": f"ign-{index}", "on": False},
+        "rangeTotalKm": {"id": f"range-{index}", "km": 300},
+        "highVoltageBatteryUsableCapacityKwh": {"id": f"kwh-{index}", "kwh": 77},
+        "chargingStatus": {
+            "startChargePercentage": 40,
+            "startTime": "2025-12-19T08:00:00Z",
+            "endedAt": "2025-12-19T09:00:00Z",
+            "chargedPercentage": 10,
+        },
+        "workshop": {
+            "id": f"workshop-{index % 5}",
+            "number": f"WS{index % 5:03d}",
+            "name": f"Workshop {index % 5}",
+            "address": "123 Service Lane",
+            "zip": "2600",
+            "city": "Canberra",
+            "timeZone": {"offset": "+10:00"},
+            "phone": "+61200000000",
+            "emergencyContactPhoneNumber": "+61200000001",
+            "latitude": -35.2809,
+            "longitude": 149.1300,
+            "brand": "volkswagen",
+            "mobileBookingUrl": "https://example.com/workshop/booking",
+            "openingHours": [
+                {"day": day, "from": "07:30", "to": "17:00"} for day in WEEKDAYS
+            ],
+        },
+        "brandContactInfo": {
+            "webshopUrl": "https://shop.example.com",
+            "webshopName": "Volkswagen Shop",
+            "roadsideAssistancePhoneNumber": "1800000000",
+            "roadsideAssistanceName": "Volkswagen Roadside Assistance",
+            "roadsideAssistanceUrl": "https://example.com/roadside",
+            "roadsideEmergencyAssistanceUrl": "https://example.com/emergency",
+            "roadsideAssistancePaid": False,
+        },
+    }
+
+
+def _advance(data: dict[str, Any], rng: random.Random) -> None:
+    """Mutate telemetry the way a real poll would for part of the fleet."""
+    for entry in data["data"]["viewer"]["vehicles"]:
+        vehicle = entry["vehicle"]
+        if rng.random() < 0.3:  # noqa: PLR2004
+            vehicle["odometer"]["odometer"] += rng.randint(1, 20)
+            vehicle["rangeTotalKm"]["km"] -= rng.randint(1, 10)
+            vehicle["chargePercentage"]["pct"] -= 1
+
+
+def _record(entity: VolkswagenGoConnectSensor, *, honour_unrecorded: bool) -> str:
+    """Serialise the state row the recorder would store for an entity."""
+    attributes: dict[str, Any] = {
+        "attribution": ATTRIBUTION,
+        "friendly_name": entity.name,
+        "icon": entity.entity_description.icon,
+    }
+    if entity.entity_description.native_unit_of_measurement:
+        attributes["unit_of_measurement"] = (
+            entity.entity_description.native_unit_of_measurement
+        )
+    attributes.update(entity.extra_state_attributes or {})
+    if honour_unrecorded:
+        for key in entity._unrecorded_attributes:  # noqa: SLF001
+            attributes.pop(key, None)
+    return f"{entity.native_value}|{json.dumps(attributes, sort_keys=True)}"
+
+
+def main() -> None:
+    """Run the benchmark."""
+    coordinator = MagicMock()
+    baseline = {
+        "data": {
+            "viewer": {
+                "vehicles": [
+                    {"vehicle": _vehicle(index)} for index in range(FLEET_SIZE)
+                ]
+            }
+        }
+    }
+    coordinator.data = baseline
+    entities = [
+        SENSOR_CLASSES.get(description.key, VolkswagenGoConnectSensor)(
+            coordinator=coordinator,
+            entity_description=description,
+            vehicle=copy.deepcopy(entry),
+        )
+        for entry in baseline["data"]["viewer"]["vehicles"]
+        for description in ENTITY_DESCRIPTIONS
+        if description.key not in {"fuelPercentage", "fuelLevel", "data_age"}
+    ]
+
+    print(f"fleet: {FLEET_SIZE} vehicles, {len(entities)} sensor entities")
+    for label, honour in (("before", False), ("after", True)):
+        rng = random.Random(SEED)
+        data = copy.deepcopy(baseline)
+        coordinator.data = data
+        rows = [_record(entity, honour_unrecorded=honour) for entity in entities]
+        full = sum(len(row.encode()) for row in rows)
+
+        previous = rows
+        written = 0
+        for _ in range(POLLS):
+            _advance(data, rng)
+            current = [_record(entity, honour_unrecorded=honour) for entity in entities]
+            written += sum(
+                len(row.encode())
+                for row, old in zip(current, previous, strict=True)
+                if row != old
+            )
+            previous = current
+        print(
+            f"{label:>6}: full write {full:>9,} B, "
+            f"steady poll {written // POLLS:>7,} B/poll"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,34 +7,53 @@ https://github.com/amoisis/volkswagen_goconnect
 
 from __future__ import annotations
 
-from datetime import timedelta
 from typing import TYPE_CHECKING
 
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, Platform
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers import config_validation as cv
 from homeassistant.loader import async_get_integration
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.device_registry import DeviceEntry
+    from homeassistant.helpers.typing import ConfigType
 
 from .api import VolkswagenGoConnectApiClient
-from .const import CONF_POLLING_INTERVAL, DOMAIN
-from .coordinator import VolkswagenGoConnectDataUpdateCoordinator
+from .const import DOMAIN
+from .coordinator import (
+    VolkswagenGoConnectDataUpdateCoordinator,
+    get_poll_offset,
+    get_polling_interval,
+    vehicle_ids,
+)
 from .data import VolkswagenGoConnectData
+from .hub import async_get_hub
+from .services import async_setup_services
+from .session import async_get_session
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 PLATFORMS: list[Platform] = [
     Platform.SENSOR,
     Platform.BINARY_SENSOR,
+    Platform.BUTTON,
     Platform.DEVICE_TRACKER,
+    Platform.SWITCH,
 ]
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa: ARG001
+    """Set up the integration services."""
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up this integration using UI."""
     integration = await async_get_integration(hass, DOMAIN)
     client = VolkswagenGoConnectApiClient(
-        session=async_get_clientsession(hass),
+        session=async_get_session(hass),
         email=entry.data.get(CONF_EMAIL),
         password=entry.data.get(CONF_PASSWORD),
         device_token=entry.data.get("device_token"),
@@ -43,12 +62,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator = VolkswagenGoConnectDataUpdateCoordinator(
         hass=hass,
         client=client,
-        update_interval=timedelta(
-            seconds=entry.options.get(
-                CONF_POLLING_INTERVAL, entry.data.get(CONF_POLLING_INTERVAL, 60)
-            )
-        ),
+        update_interval=get_polling_interval(entry),
+        poll_offset=get_poll_offset(hass, entry),
+        hub=(hub := async_get_hub(hass)),
     )
+    coordinator.async_apply_options()
+    entry.async_on_unload(hub.async_register(entry.entry_id, coordinator))
 
     # This will trigger the first refresh and authentication check
     await coordinator.async_config_entry_first_refresh()
@@ -57,10 +76,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         client=client,
         coordinator=coordinator,
         integration=integration,
+        credentials=_credentials(entry),
     )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(entry.add_update_listener(async_update_listener))
 
     return True
 
@@ -70,6 +90,37 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
+async def async_remove_config_entry_device(
+    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    entry: ConfigEntry,
+    device_entry: DeviceEntry,
+) -> bool:
+    """Allow removing a vehicle device once the vehicle left the account."""
+    current_ids = vehicle_ids(entry.runtime_data.coordinator.data)
+    return not any(
+        domain == DOMAIN and identifier in current_ids
+        for domain, identifier in device_entry.identifiers
+    )
+
+
+def _credentials(entry: ConfigEntry) -> tuple[str | None, ...]:
+    """Return the entry data the API client was built from."""
+    return (
+        entry.data.get(CONF_EMAIL),
+        entry.data.get(CONF_PASSWORD),
+        entry.data.get("device_token"),
+    )
+
+
+async def async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply option changes live; only credential changes reload the entry."""
+    if entry.runtime_data.credentials != _credentials(entry):
+        await async_reload_entry(hass, entry)
+        return
+
+    entry.runtime_data.coordinator.async_apply_options()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
     await hass.config_entries.async_reload(entry.entry_id)
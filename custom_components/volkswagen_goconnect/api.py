@@ -4,21 +4,26 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import copy
 import json
 import logging
 import os
+import random
 import socket
 import time
-from typing import Any
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, TypeVar
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 import aiohttp
 import async_timeout
 
+from .breaker import BreakerState, CircuitBreaker
 from .const import (
     AUTH_TOKEN_URL,
     AUTH_URL,
     BASE_URL_API,
+    BASE_URL_AUTH_LOGIN,
     HTTP_HEADERS_APP_VERSION,
     HTTP_HEADERS_ORGANIZATION_NAMESPACE,
     HTTP_HEADERS_USER_AGENT,
@@ -27,20 +32,78 @@ from .const import (
     QUERY_VEHICLE_SYSTEM_OVERVIEW,
     REGISTER_DEVICE_URL,
 )
+from .latency import AdaptiveTimeouts
+from .limiter import Priority, get_limiter
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+    from .limiter import RequestLimiter
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 # Toggle verbose HTTP debug logging (sanitized). Set VWGC_HTTP_DEBUG=1 to enable.
 HTTP_DEBUG = os.getenv("VWGC_HTTP_DEBUG", "").lower() in {"1", "true", "yes", "on"}
 
-# Single source of truth for request timeout (seconds)
+# Timeout of requests that do not go through the adaptive timeouts (seconds)
 REQUEST_TIMEOUT_SECONDS = 10
 
+# Requests are not started with less time than this left until the deadline
+MIN_REQUEST_SECONDS = 0.5
+
 # Client-side throttling and backoff settings
-MIN_REQUEST_INTERVAL_SECONDS = 0.2  # ensure spacing between requests
 THROTTLE_MAX_RETRIES = 3  # retries on 429/503
 THROTTLE_BASE_DELAY_SECONDS = 1.0  # base backoff when no Retry-After
 
+# Monotonic deadline of the poll in progress, seen by all of its requests
+_POLL_DEADLINE: ContextVar[float | None] = ContextVar(
+    "volkswagen_goconnect_poll_deadline", default=None
+)
+
+# Retries of queries that failed in transit (connection resets, DNS failures,
+# timeouts): per request, and shared by all requests of a poll so that an
+# outage does not multiply the traffic
+NETWORK_MAX_RETRIES = 2
+NETWORK_BASE_DELAY_SECONDS = 0.5
+POLL_RETRY_BUDGET = 4
+
+
+class _RetryBudget:
+    """Retries left to the requests of one poll."""
+
+    def __init__(self, retries: int) -> None:
+        self.retries = retries
+
+    def take(self) -> bool:
+        """Use up one retry; return False when none is left."""
+        if self.retries <= 0:
+            return False
+        self.retries -= 1
+        return True
+
+
+class _InFlight:
+    """A query in flight, shared with the identical queries waiting for it."""
+
+    def __init__(self, future: asyncio.Future[Any], priority: Priority) -> None:
+        self.future = future
+        self.priority = priority
+        self.waiters = 0
+
+
+_POLL_RETRIES: ContextVar[_RetryBudget | None] = ContextVar(
+    "volkswagen_goconnect_poll_retries", default=None
+)
+
+# Priority set by the caller for all requests of a call, such as a refresh the
+# user asked for. Otherwise requests are telemetry: the vehicle list, details
+# and system overview all carry the live vehicle state.
+_REQUEST_PRIORITY: ContextVar[Priority | None] = ContextVar(
+    "volkswagen_goconnect_request_priority", default=None
+)
+
 SENSITIVE_KEYS = {
     "authorization",
     "password",
@@ -118,6 +181,113 @@ class VolkswagenGoConnectApiClientAuthenticationError(
     """Exception to indicate an authentication error."""
 
 
+class VolkswagenGoConnectApiClientDeadlineError(
+    VolkswagenGoConnectApiClientCommunicationError,
+):
+    """Exception to indicate a request would overrun the poll deadline."""
+
+
+class VolkswagenGoConnectApiClientCircuitOpenError(
+    VolkswagenGoConnectApiClientCommunicationError,
+):
+    """Exception to indicate a request was not sent as the API is failing."""
+
+
+def _remaining(deadline: float | None) -> float | None:
+    """Return the seconds left until a deadline; raise if too few are left."""
+    if deadline is None:
+        return None
+    remaining = deadline - time.monotonic()
+    if remaining < MIN_REQUEST_SECONDS:
+        msg = "Poll deadline exceeded"
+        raise VolkswagenGoConnectApiClientDeadlineError(msg)
+    return remaining
+
+
+async def _acquire_by(
+    limiter: RequestLimiter, account: Any, priority: Priority, deadline: float | None
+) -> None:
+    """Wait for a limiter slot; running out of poll time is a deadline error."""
+    try:
+        async with async_timeout.timeout(_remaining(deadline)):
+            await limiter.acquire(account, priority)
+    except TimeoutError as exception:
+        msg = "Poll deadline reached waiting for the request limiter"
+        raise VolkswagenGoConnectApiClientDeadlineError(msg) from exception
+
+
+def _operation(url: str, data: dict | None) -> str:
+    """Return the name under which the latency of a request is tracked."""
+    if isinstance(data, dict) and "operationName" in data:
+        return str(data["operationName"])
+    if url.startswith(BASE_URL_AUTH_LOGIN):
+        return "login"
+    return urlparse(url).path
+
+
+def _request_priority() -> Priority:
+    """Return the limiter priority of a request of the current call."""
+    if (priority := _REQUEST_PRIORITY.get()) is None:
+        return Priority.TELEMETRY
+    return priority
+
+
+def _coalesce_key(data: dict | None) -> tuple[str, str] | None:
+    """Return the key identical in-flight queries share, None for others."""
+    if not (
+        isinstance(data, dict)
+        and str(data.get("query", "")).lstrip().startswith("query")
+    ):
+        return None
+    return (
+        str(data.get("operationName")),
+        json.dumps(data.get("variables"), sort_keys=True),
+    )
+
+
+def _network_retry_delay(
+    data: dict | None, retries: int, deadline: float | None
+) -> float | None:
+    """
+    Return how long to wait before retrying a request that failed in transit.
+
+    Only GraphQL queries are retried, as they are idempotent. Returns None
+    when the request or its poll is out of retries, or when the retry could
+    not finish before the deadline. The delay is drawn from the whole
+    exponential backoff window so that accounts do not retry in lockstep.
+    """
+    if not (
+        isinstance(data, dict)
+        and str(data.get("query", "")).lstrip().startswith("query")
+        and retries < NETWORK_MAX_RETRIES
+    ):
+        return None
+    delay = random.uniform(0, NETWORK_BASE_DELAY_SECONDS * 2**retries)  # noqa: S311
+    if deadline is not None and (
+        delay > deadline - time.monotonic() - MIN_REQUEST_SECONDS
+    ):
+        return None
+    budget = _POLL_RETRIES.get()
+    if budget is not None and not budget.take():
+        return None
+    return delay
+
+
+def _merge_listed_vehicle(listed: dict, detailed: dict) -> dict:
+    """
+    Return the vehicle details completed with its vehicle list entry.
+
+    Only the list returns the work hours of the primary fleet, so the fleet
+    objects are merged; for everything else the details win.
+    """
+    merged = {**listed, **detailed}
+    listed_fleet = listed.get("primaryFleet")
+    detailed_fleet = detailed.get("primaryFleet")
+    if isinstance(listed_fleet, dict) and isinstance(detailed_fleet, dict):
+        merged["primaryFleet"] = {**listed_fleet, **detailed_fleet}
+    return merged
+
+
 def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
     """Verify that the response is valid."""
     if response.status in (401, 403):
@@ -147,9 +317,13 @@ class VolkswagenGoConnectApiClient:
         self._session = session
         self._device_token = device_token
         self._token: str | None = None
-        # Throttling state
-        self._rate_lock = asyncio.Lock()
-        self._last_request_at = 0.0
+        # Running total of HTTP requests sent, including retries
+        self.request_count = 0
+        self.timeouts = AdaptiveTimeouts()
+        self.breaker = CircuitBreaker()
+        # Calls served by an identical query already in flight
+        self.coalesced_count = 0
+        self._in_flight: dict[tuple[str, str], _InFlight] = {}
 
     async def login(self) -> None:
         """Login to the API."""
@@ -204,64 +378,184 @@ class VolkswagenGoConnectApiClient:
             include_auth_token=True,
         )
 
-    async def async_get_data(self) -> dict:
-        """Get data from the API."""
+    async def async_get_data(
+        self,
+        skip: Callable[[dict], bool] | None = None,
+        *,
+        extras: bool = True,
+        deadline: float | None = None,
+        on_vehicle: Callable[[dict], None] | None = None,
+    ) -> dict:
+        """
+        Get data from the API.
+
+        Vehicles of the vehicle list for which ``skip`` returns True are returned
+        as their bare list entry without fetching their details. Without
+        ``extras`` the low-value fields are left out of the vehicle details.
+
+        ``deadline`` is a ``time.monotonic()`` value that every request, retry
+        and backoff of this call must finish by. A vehicle whose details could
+        not be fetched in time is returned as its list entry, like any other
+        vehicle whose details failed.
+
+        ``on_vehicle`` is called with every vehicle entry as soon as it is
+        complete, before the others are fetched.
+        """
+        vehicles = []
+        async for vehicle_entry in self.stream_vehicle_data(
+            skip, extras=extras, deadline=deadline
+        ):
+            if on_vehicle is not None:
+                on_vehicle(vehicle_entry)
+            vehicles.append(vehicle_entry)
+
+        # Construct a response structure similar to the original one
+        return {"data": {"viewer": {"vehicles": vehicles}}}
+
+    async def stream_vehicle_data(
+        self,
+        skip: Callable[[dict], bool] | None = None,
+        *,
+        extras: bool = True,
+        deadline: float | None = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Yield the entry of every vehicle of the vehicle list once it is complete.
+
+        Vehicles are yielded in list order, each as soon as its details are
+        fetched, so the first ones need not wait for the slowest. ``skip``,
+        ``extras`` and ``deadline`` work as for ``async_get_data``.
+        """
+        budget = _RetryBudget(POLL_RETRY_BUDGET)
         # First get the list of vehicles
-        vehicles_response = await self.get_vehicles()
+        vehicles_response = await self._in_poll(deadline, budget, self.get_vehicles())
 
         vehicles_data = (
             vehicles_response.get("data", {}).get("viewer", {}).get("vehicles", [])
         )
 
-        detailed_vehicles = []
         for vehicle_entry in vehicles_data:
             vehicle = vehicle_entry.get("vehicle")
             if not vehicle or "id" not in vehicle:
                 continue
 
             vehicle_id = vehicle["id"]
+            if skip is not None and skip(vehicle):
+                yield vehicle_entry
+                continue
             try:
                 # Fetch details for each vehicle
-                details = await self.get_vehicle_details(vehicle_id)
-                system_overview = await self.get_vehicle_system_overview(vehicle_id)
+                vehicle_data = await self._in_poll(
+                    deadline,
+                    budget,
+                    self.async_get_vehicle(vehicle_id, extras=extras),
+                )
+            except (
+                VolkswagenGoConnectApiClientDeadlineError,
+                VolkswagenGoConnectApiClientCircuitOpenError,
+            ) as exception:
+                # Expected when the poll runs out of time or the API is down
+                _LOGGER.debug(
+                    "Skipping details of vehicle %s: %s", vehicle_id, exception
+                )
+                yield vehicle_entry
+                continue
+            except Exception:
+                _LOGGER.exception("Error fetching details for vehicle %s", vehicle_id)
+                yield vehicle_entry
+                continue
+            if vehicle_data is None:
+                # Keep the list entry so the vehicle does not disappear
+                _LOGGER.warning("Failed to get details for vehicle %s", vehicle_id)
+                yield vehicle_entry
+                continue
+            yield {"vehicle": _merge_listed_vehicle(vehicle, vehicle_data)}
 
-                if details and "data" in details and "vehicle" in details["data"]:
-                    vehicle_data = details["data"]["vehicle"]
+    async def _in_poll(
+        self, deadline: float | None, budget: _RetryBudget, call: Awaitable[_T]
+    ) -> _T:
+        """
+        Await a call of a poll with the poll's deadline and retry budget.
 
-                    # Merge system overview data
-                    if (
-                        system_overview
-                        and "data" in system_overview
-                        and "vehicle" in system_overview["data"]
-                    ):
-                        system_data = system_overview["data"]["vehicle"]
-                        # Deep merge: only update top-level keys that don't
-                        # have nested objects or update nested objects without
-                        # overwriting complete data with partial data
-                        for key, value in system_data.items():
-                            # Skip updating keys that are complex objects from details
-                            # to avoid overwriting complete data with partial data
-                            if key not in [
-                                "brandContactInfo",
-                            ]:
-                                vehicle_data[key] = value
-
-                    detailed_vehicles.append({"vehicle": vehicle_data})
-                else:
-                    # Fallback or just append original if detail fetch fails?
-                    # Let's append original but warn? Or just skip?
-                    # For now, let's keep the original entry if detail fetch fails,
-                    # but maybe it's better to just skip to avoid inconsistencies.
-                    # Or we can just log error.
-                    _LOGGER.warning("Failed to get details for vehicle %s", vehicle_id)
-                    detailed_vehicles.append(vehicle_entry)
+        They are set around each call rather than around the whole stream, as
+        a generator runs in its consumer's context between values.
+        """
+        token = _POLL_DEADLINE.set(deadline)
+        retries_token = _POLL_RETRIES.set(budget)
+        try:
+            return await call
+        finally:
+            _POLL_RETRIES.reset(retries_token)
+            _POLL_DEADLINE.reset(token)
 
-            except Exception:
-                _LOGGER.exception("Error fetching details for vehicle %s", vehicle_id)
-                detailed_vehicles.append(vehicle_entry)
+    async def async_get_vehicle(
+        self,
+        vehicle_id: str,
+        *,
+        extras: bool = True,
+        priority: Priority | None = None,
+    ) -> dict | None:
+        """
+        Get the details of one vehicle merged with its system overview.
 
-        # Construct a response structure similar to the original one
-        return {"data": {"viewer": {"vehicles": detailed_vehicles}}}
+        Returns None when the details response holds no vehicle. With a
+        ``priority``, all requests wait for the limiter at that priority
+        instead of the one of their operation.
+        """
+        token = _REQUEST_PRIORITY.set(priority)
+        try:
+            details = await self.get_vehicle_details(vehicle_id, extras=extras)
+            system_overview = await self.get_vehicle_system_overview(
+                vehicle_id, extras=extras
+            )
+        finally:
+            _REQUEST_PRIORITY.reset(token)
+
+        if not (details and "data" in details and "vehicle" in details["data"]):
+            return None
+        vehicle_data = details["data"]["vehicle"]
+
+        # Merge system overview data
+        if (
+            system_overview
+            and "data" in system_overview
+            and "vehicle" in system_overview["data"]
+        ):
+            system_data = system_overview["data"]["vehicle"]
+            # Deep merge: only update top-level keys that don't
+            # have nested objects or update nested objects without
+            # overwriting complete data with partial data
+            for key, value in system_data.items():
+                # Skip updating keys that are complex objects from details
+                # to avoid overwriting complete data with partial data
+                if key not in [
+                    "brandContactInfo",
+                ]:
+                    vehicle_data[key] = value
+
+        return vehicle_data
+
+    async def async_prewarm(self) -> None:
+        """
+        Open a connection to the API host ahead of the next poll.
+
+        A GET request to the host root resolves the host name and completes
+        the TCP and TLS handshakes, leaving an idle connection in the pool for
+        the poll. Its body is read so the connection can be reused; a HEAD
+        response without a length would close it. It is not an API call, so
+        it is not counted; failures are only logged as the poll reports real
+        errors.
+        """
+        url = urlunparse(urlparse(BASE_URL_API)._replace(path="/", query=""))
+        try:
+            await get_limiter(urlparse(url).netloc).acquire(self, Priority.ANALYTICS)
+            async with (
+                async_timeout.timeout(REQUEST_TIMEOUT_SECONDS),
+                self._session.get(url, headers=self._get_headers()) as response,
+            ):
+                await response.read()
+        except (TimeoutError, aiohttp.ClientError, socket.gaierror) as exception:
+            _LOGGER.debug("Pre-warming the API connection failed: %s", exception)
 
     # No metadata caching: GraphQL selection sets are already efficient.
 
@@ -280,11 +574,13 @@ class VolkswagenGoConnectApiClient:
             include_auth_token=True,
         )
 
-    async def get_vehicle_details(self, vehicle_id: str) -> dict:
+    async def get_vehicle_details(
+        self, vehicle_id: str, *, extras: bool = True
+    ) -> dict:
         """Get vehicle details."""
         query = {
             "operationName": "Vehicle",
-            "variables": {"id": vehicle_id},
+            "variables": {"id": vehicle_id, "extras": extras},
             "query": QUERY_VEHICLE_DETAILS,
         }
         return await self._request_json(
@@ -295,11 +591,13 @@ class VolkswagenGoConnectApiClient:
             include_auth_token=True,
         )
 
-    async def get_vehicle_system_overview(self, vehicle_id: str) -> dict:
+    async def get_vehicle_system_overview(
+        self, vehicle_id: str, *, extras: bool = True
+    ) -> dict:
         """Get vehicle system overview."""
         query = {
             "operationName": "VehicleSystemOverview",
-            "variables": {"id": vehicle_id, "statuses": ["open"]},
+            "variables": {"id": vehicle_id, "statuses": ["open"], "extras": extras},
             "query": QUERY_VEHICLE_SYSTEM_OVERVIEW,
         }
         return await self._request_json(
@@ -319,6 +617,99 @@ class VolkswagenGoConnectApiClient:
         data: dict | None = None,
         include_app_version: bool = False,
         include_auth_token: bool = False,
+    ) -> Any:
+        """
+        Call API, sharing the result of an identical query already in flight.
+
+        A query with the same operation and variables as one in flight is not
+        sent again: the caller waits for the first one and gets a copy of its
+        result, or its error. A caller does not join a request queued at a
+        lower priority than its own, and waits no longer than its own poll
+        deadline. Should the first caller be cancelled or run out of its poll's
+        time, the waiting ones send their own request instead.
+        """
+        if (key := _coalesce_key(data)) is None:
+            return await self._send_json(
+                method=method,
+                url=url,
+                data=data,
+                include_app_version=include_app_version,
+                include_auth_token=include_auth_token,
+            )
+
+        priority = _request_priority()
+        while (pending := self._in_flight.get(key)) is not None and (
+            pending.priority <= priority
+        ):
+            shared, result = await self._await_in_flight(pending)
+            if shared:
+                return result
+
+        in_flight = _InFlight(asyncio.get_running_loop().create_future(), priority)
+        future = in_flight.future
+        self._in_flight[key] = in_flight
+        try:
+            result = await self._send_json(
+                method=method,
+                url=url,
+                data=data,
+                include_app_version=include_app_version,
+                include_auth_token=include_auth_token,
+            )
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exception:
+            future.set_exception(exception)
+            # Retrieved here so that a query nobody waited for is not logged
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            # Callers own their result, so the shared one is kept pristine
+            if in_flight.waiters:
+                return copy.deepcopy(result)
+            return result
+        finally:
+            # A request of higher priority may have taken over the key
+            if self._in_flight.get(key) is in_flight:
+                del self._in_flight[key]
+
+    async def _await_in_flight(self, pending: _InFlight) -> tuple[bool, Any]:
+        """
+        Wait for an identical query in flight and return a copy of its result.
+
+        The flag is False if the query ended without a result for this caller,
+        who then sends its own request.
+        """
+        pending.waiters += 1
+        try:
+            async with async_timeout.timeout(_remaining(_POLL_DEADLINE.get())):
+                result = copy.deepcopy(await asyncio.shield(pending.future))
+        except asyncio.CancelledError:
+            task = asyncio.current_task()
+            if not pending.future.cancelled() or (task and task.cancelling()):
+                raise
+            return False, None
+        except TimeoutError as exception:
+            msg = "Poll deadline reached waiting for an identical request"
+            raise VolkswagenGoConnectApiClientDeadlineError(msg) from exception
+        except VolkswagenGoConnectApiClientDeadlineError:
+            # The first caller's deadline, not necessarily this caller's
+            return False, None
+        finally:
+            pending.waiters -= 1
+        self.coalesced_count += 1
+        return True, result
+
+    async def _send_json(
+        self,
+        *,
+        method: str,
+        url: str,
+        data: dict | None = None,
+        include_app_version: bool = False,
+        include_auth_token: bool = False,
     ) -> Any:
         """
         Call API and transparently retry once on auth error.
@@ -371,111 +762,188 @@ class VolkswagenGoConnectApiClient:
             headers["X-App-Version"] = HTTP_HEADERS_APP_VERSION
         return headers
 
-    async def _api_wrapper(  # noqa: PLR0912, PLR0915
+    async def _api_wrapper(
         self,
         method: str,
         url: str,
         data: dict | None = None,
         headers: dict | None = None,
     ) -> Any:
-        """Get information from the API."""
+        """
+        Get information from the API, unless the circuit breaker is open.
+
+        Failures other than authentication errors and the poll deadline count
+        towards opening the breaker.
+        """
+        if not self.breaker.allow(time.monotonic()):
+            msg = "API is failing, request not sent"
+            raise VolkswagenGoConnectApiClientCircuitOpenError(msg)
+        # Only the probe is let through while the breaker is not closed
+        probe = self.breaker.state is BreakerState.HALF_OPEN
+        try:
+            result = await self._api_request(method, url, data, headers)
+        except (
+            VolkswagenGoConnectApiClientAuthenticationError,
+            VolkswagenGoConnectApiClientDeadlineError,
+            asyncio.CancelledError,
+        ):
+            self.breaker.release(probe=probe)
+            raise
+        except VolkswagenGoConnectApiClientError:
+            self.breaker.record_failure(time.monotonic())
+            raise
+        self.breaker.record_success()
+        return result
+
+    async def _api_request(  # noqa: PLR0912, PLR0915
+        self,
+        method: str,
+        url: str,
+        data: dict | None = None,
+        headers: dict | None = None,
+    ) -> Any:
+        """Send a request, retrying throttled and failed-in-transit ones."""
         if self._session is None:
             msg = "Session not initialized"
             raise VolkswagenGoConnectApiClientCommunicationError(msg)
+        deadline = _POLL_DEADLINE.get()
+        operation = _operation(url, data)
+        priority = _request_priority()
+        # Start of the request in flight whose timeout is the adaptive one
+        started: float | None = None
         try:
             attempt = 0
+            # Retries of transient network errors, apart from throttling
+            retries = 0
             while True:
-                # Basic rate limiting: ensure minimal spacing between requests
-                now = time.monotonic()
-                async with self._rate_lock:
-                    elapsed = now - self._last_request_at
-                    if elapsed < MIN_REQUEST_INTERVAL_SECONDS:
-                        to_sleep = MIN_REQUEST_INTERVAL_SECONDS - elapsed
-                    else:
-                        to_sleep = 0.0
-                    if to_sleep > 0:
-                        await asyncio.sleep(to_sleep)
-                    self._last_request_at = time.monotonic()
-
-                async with async_timeout.timeout(REQUEST_TIMEOUT_SECONDS):
-                    _LOGGER.debug("Method: %s", method)
-                    _LOGGER.debug("URL: %s", _sanitize_url(url))
-                    _LOGGER.debug("Headers: %s", _sanitize_headers(headers))
-
-                    if isinstance(data, dict):
-                        # Do not log full request bodies or sensitive keys
-                        # to avoid leaking sensitive data
-                        total_keys = len(data)
-                        _LOGGER.debug(
-                            "Request data keys: %d total (body content not logged)",
-                            total_keys,
-                        )
-                    elif data is not None:
-                        _LOGGER.debug(
-                            "Request has non-dict JSON body (content not logged)"
-                        )
-
-                    response = await self._session.request(
-                        method=method,
-                        url=url,
-                        headers=headers,
-                        json=data,
-                    )
-
-                    # Handle throttling responses (429) and transient 503
-                    if response.status in (429, 503):
-                        retry_after = response.headers.get("Retry-After")
-                        delay = None
-                        if retry_after:
-                            try:
-                                delay = float(retry_after)
-                            except ValueError:
-                                delay = None
-                        if delay is None:
-                            delay = THROTTLE_BASE_DELAY_SECONDS * (2**attempt)
-                        _LOGGER.warning(
-                            "Received %s, backing off for %.2fs (attempt %d)",
-                            response.status,
-                            delay,
-                            attempt + 1,
-                        )
-                        # consume body to release connection
-                        with contextlib.suppress(Exception):
-                            await response.release()
-                        if attempt >= THROTTLE_MAX_RETRIES:
-                            msg = (
-                                f"Exceeded retry attempts after "
-                                f"status {response.status}"
+                # Rate limiting shared with every other account on this host
+                limiter = get_limiter(urlparse(url).netloc)
+                await _acquire_by(limiter, self, priority, deadline)
+
+                timeout = self.timeouts.timeout(operation)
+                remaining = _remaining(deadline)
+                # A timeout cut short by the deadline says nothing of latency
+                measured = remaining is None or remaining >= timeout
+                try:
+                    async with async_timeout.timeout(
+                        timeout if measured else remaining
+                    ):
+                        _LOGGER.debug("Method: %s", method)
+                        _LOGGER.debug("URL: %s", _sanitize_url(url))
+                        _LOGGER.debug("Headers: %s", _sanitize_headers(headers))
+
+                        if isinstance(data, dict):
+                            # Do not log full request bodies or sensitive keys
+                            # to avoid leaking sensitive data
+                            total_keys = len(data)
+                            _LOGGER.debug(
+                                "Request data keys: %d total (body content not logged)",
+                                total_keys,
                             )
-                            raise VolkswagenGoConnectApiClientCommunicationError(  # noqa: TRY301
-                                msg
+                        elif data is not None:
+                            _LOGGER.debug(
+                                "Request has non-dict JSON body (content not logged)"
                             )
-                        attempt += 1
-                        await asyncio.sleep(delay)
-                        continue
 
-                    text = await response.text()
-                    _LOGGER.debug("Response Status: %s", response.status)
-                    if HTTP_DEBUG:
-                        try:
+                        self.request_count += 1
+                        started = time.monotonic() if measured else None
+                        response = await self._session.request(
+                            method=method,
+                            url=url,
+                            headers=headers,
+                            json=data,
+                        )
+
+                        # Handle throttling responses (429) and transient 503
+                        if response.status in (429, 503):
+                            limiter.record_throttled()
+                            retry_after = response.headers.get("Retry-After")
+                            delay = None
+                            if retry_after:
+                                try:
+                                    delay = float(retry_after)
+                                except ValueError:
+                                    delay = None
+                            if delay is None:
+                                delay = THROTTLE_BASE_DELAY_SECONDS * (2**attempt)
+                            _LOGGER.warning(
+                                "Received %s, backing off for %.2fs (attempt %d)",
+                                response.status,
+                                delay,
+                                attempt + 1,
+                            )
+                            # consume body to release connection
+                            with contextlib.suppress(Exception):
+                                await response.release()
+                            if (remaining := _remaining(deadline)) is not None and (
+                                delay > remaining - MIN_REQUEST_SECONDS
+                            ):
+                                msg = "Backoff would overrun the poll deadline"
+                                raise VolkswagenGoConnectApiClientDeadlineError(msg)
+                            if attempt >= THROTTLE_MAX_RETRIES:
+                                msg = (
+                                    f"Exceeded retry attempts after "
+                                    f"status {response.status}"
+                                )
+                                raise VolkswagenGoConnectApiClientCommunicationError(
+                                    msg
+                                )
+                            started = None
+                            attempt += 1
+                            await asyncio.sleep(delay)
+                            continue
+
+                        text = await response.text()
+                        if started is not None:
+                            self.timeouts.observe(operation, time.monotonic() - started)
+                            started = None
+                        _LOGGER.debug("Response Status: %s", response.status)
+                        if HTTP_DEBUG:
+                            try:
+                                _LOGGER.debug(
+                                    "Response Body: %s",
+                                    _sanitize_mapping(json.loads(text)),
+                                )
+                            except Exception:  # noqa: BLE001
+                                # Fallback to truncated raw text when not JSON
+                                _LOGGER.debug("Response Body (raw): %.200s", text)
+                        else:
                             _LOGGER.debug(
-                                "Response Body: %s", _sanitize_mapping(json.loads(text))
+                                "Response body omitted (set VWGC_HTTP_DEBUG=1 to log)"
                             )
-                        except Exception:  # noqa: BLE001
-                            # Fallback to truncated raw text when not JSON
-                            _LOGGER.debug("Response Body (raw): %.200s", text)
-                    else:
-                        _LOGGER.debug(
-                            "Response body omitted (set VWGC_HTTP_DEBUG=1 to log)"
-                        )
 
-                    _verify_response_or_raise(response)
+                        _verify_response_or_raise(response)
 
-                    try:
-                        return json.loads(text)
-                    except json.JSONDecodeError as exc:
-                        _LOGGER.exception("Failed to decode json")
-                        raise VolkswagenGoConnectApiClientError from exc
+                        try:
+                            return json.loads(text)
+                        except json.JSONDecodeError as exc:
+                            _LOGGER.exception("Failed to decode json")
+                            raise VolkswagenGoConnectApiClientError from exc
+                except (
+                    TimeoutError,
+                    aiohttp.ClientConnectionError,
+                    socket.gaierror,
+                ) as exception:
+                    if isinstance(exception, TimeoutError):
+                        if not measured:
+                            msg = "Poll deadline reached waiting for the response"
+                            raise VolkswagenGoConnectApiClientDeadlineError(
+                                msg
+                            ) from exception
+                        if started is not None:
+                            self.timeouts.observe(operation, time.monotonic() - started)
+                    started = None
+                    delay = _network_retry_delay(data, retries, deadline)
+                    if delay is None:
+                        raise
+                    _LOGGER.debug(
+                        "Retrying %s after %s in %.2fs",
+                        operation,
+                        type(exception).__name__,
+                        delay,
+                    )
+                    retries += 1
+                    await asyncio.sleep(delay)
 
         except TimeoutError as exception:
             msg = f"Timeout error fetching information - {exception}"
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
+from homeassistant.const import EntityCategory
 
-from .entity import VolkswagenGoConnectEntity
+from .breaker import BreakerState
+from .entity import VolkswagenGoConnectEntity, async_add_vehicle_entities
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -39,6 +41,24 @@ ENTITY_DESCRIPTIONS = (
 )
 
 
+# Binary sensors of the account rather than of a vehicle
+ACCOUNT_ENTITY_DESCRIPTIONS = (
+    BinarySensorEntityDescription(
+        key="circuit_breaker",
+        name="API Circuit Breaker",
+        icon="mdi:electric-switch",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    BinarySensorEntityDescription(
+        key="degraded_mode",
+        name="Degraded Mode",
+        icon="mdi:speedometer-slow",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
     entry: ConfigEntry,
@@ -46,20 +66,25 @@ async def async_setup_entry(
 ) -> None:
     """Set up the binary_sensor platform."""
     coordinator = entry.runtime_data.coordinator
-    data = coordinator.data or {}
-    vehicles = data.get("data", {}).get("viewer", {}).get("vehicles", [])
 
     async_add_entities(
-        [
+        VolkswagenGoConnectAccountBinarySensor(
+            coordinator=coordinator,
+            entity_description=entity_description,
+        )
+        for entity_description in ACCOUNT_ENTITY_DESCRIPTIONS
+    )
+    async_add_vehicle_entities(
+        entry,
+        async_add_entities,
+        lambda vehicle: [
             VolkswagenGoConnectBinarySensor(
                 coordinator=coordinator,
                 entity_description=entity_description,
                 vehicle=vehicle,
             )
-            for vehicle in vehicles
-            if vehicle and vehicle.get("vehicle")
             for entity_description in ENTITY_DESCRIPTIONS
-        ]
+        ],
     )
 
 
@@ -103,3 +128,46 @@ class VolkswagenGoConnectBinarySensor(VolkswagenGoConnectEntity, BinarySensorEnt
                         return bool(value)
             return False
         return False
+
+
+class VolkswagenGoConnectAccountBinarySensor(
+    VolkswagenGoConnectEntity, BinarySensorEntity
+):
+    """Binary sensor reporting problems of the account's API connection."""
+
+    def __init__(
+        self,
+        coordinator: VolkswagenGoConnectDataUpdateCoordinator,
+        entity_description: BinarySensorEntityDescription,
+    ) -> None:
+        """Initialize the binary_sensor class."""
+        super().__init__(coordinator)
+        self.entity_description = entity_description
+        name = entity_description.name
+        self._attr_name = name if isinstance(name, str) else None
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_{entity_description.key}"
+        )
+
+    @property
+    def is_on(self) -> bool:
+        """
+        Return true while the account is held back.
+
+        That is while the circuit breaker keeps requests from being sent, or
+        while degraded mode skips low-value fields.
+        """
+        if self.entity_description.key == "degraded_mode":
+            return self.coordinator.degraded_reason is not None
+        return self.coordinator.client.breaker.state is not BreakerState.CLOSED
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return why degraded mode is on, or the breaker state and failure rate."""
+        if self.entity_description.key == "degraded_mode":
+            return {"reason": self.coordinator.degraded_reason}
+        breaker = self.coordinator.client.breaker
+        return {
+            "state": breaker.state.value,
+            "failure_rate": round(breaker.failure_rate, 2),
+        }
@@ -0,0 +1,96 @@
+"""Circuit breaker that stops calling the API while it is failing."""
+
+from __future__ import annotations
+
+from collections import deque
+from enum import StrEnum
+
+# Outcomes of the most recent requests the failure rate is taken over
+FAILURE_WINDOW = 10
+# Requests needed in the window before the breaker can open
+MIN_REQUESTS = 4
+FAILURE_RATE_THRESHOLD = 0.5
+# How long the breaker stays open before a probe request tests recovery
+OPEN_SECONDS = 120.0
+
+
+class BreakerState(StrEnum):
+    """State of the circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Track the recent failure rate of the API and stop calling it while high.
+
+    Closed, every request goes through. Once at least half of the recent
+    requests failed, the breaker opens and rejects requests without sending
+    them. After ``open_seconds`` it turns half-open and lets a single probe
+    request through: success closes it, failure opens it again.
+
+    Times are ``time.monotonic()`` values passed in by the caller.
+    """
+
+    def __init__(self, open_seconds: float = OPEN_SECONDS) -> None:
+        """Initialize the breaker, closed."""
+        self.open_seconds = open_seconds
+        self.state = BreakerState.CLOSED
+        self.opened_at: float | None = None
+        self._outcomes: deque[bool] = deque(maxlen=FAILURE_WINDOW)
+        self._probing = False
+
+    @property
+    def failure_rate(self) -> float:
+        """Return the share of failed requests in the window."""
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def allow(self, now: float) -> bool:
+        """Return whether a request may be sent; the probe when half-open."""
+        if self.state is BreakerState.CLOSED:
+            return True
+        if (
+            self.state is BreakerState.OPEN
+            and self.opened_at is not None
+            and now - self.opened_at >= self.open_seconds
+        ):
+            self.state = BreakerState.HALF_OPEN
+        if self.state is BreakerState.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful request; a successful probe closes the breaker."""
+        if self.state is not BreakerState.CLOSED:
+            self.state = BreakerState.CLOSED
+            self.opened_at = None
+            self._outcomes.clear()
+        self._probing = False
+        self._outcomes.append(True)
+
+    def record_failure(self, now: float) -> None:
+        """Record a failed request; open the breaker if the rate is too high."""
+        self._probing = False
+        self._outcomes.append(False)
+        if self.state is BreakerState.HALF_OPEN or (
+            self.state is BreakerState.CLOSED
+            and len(self._outcomes) >= MIN_REQUESTS
+            and self.failure_rate >= FAILURE_RATE_THRESHOLD
+        ):
+            self.state = BreakerState.OPEN
+            self.opened_at = now
+
+    def release(self, *, probe: bool) -> None:
+        """
+        Record a request that says nothing of the API, such as a cancelled one.
+
+        Only the probe itself lets another probe through; a request sent
+        before the breaker opened must not.
+        """
+        if probe:
+            self._probing = False
@@ -0,0 +1,72 @@
+"""Button platform for volkswagen_goconnect."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
+
+from .entity import VolkswagenGoConnectEntity, async_add_vehicle_entities
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .coordinator import VolkswagenGoConnectDataUpdateCoordinator
+
+
+ENTITY_DESCRIPTIONS = (
+    ButtonEntityDescription(
+        key="refresh",
+        name="Refresh",
+        icon="mdi:refresh",
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the button platform."""
+    coordinator = entry.runtime_data.coordinator
+
+    async_add_vehicle_entities(
+        entry,
+        async_add_entities,
+        lambda vehicle: [
+            VolkswagenGoConnectButton(
+                coordinator=coordinator,
+                entity_description=entity_description,
+                vehicle=vehicle,
+            )
+            for entity_description in ENTITY_DESCRIPTIONS
+        ],
+    )
+
+
+class VolkswagenGoConnectButton(VolkswagenGoConnectEntity, ButtonEntity):
+    """Button that refreshes a single vehicle."""
+
+    def __init__(
+        self,
+        coordinator: VolkswagenGoConnectDataUpdateCoordinator,
+        entity_description: ButtonEntityDescription,
+        vehicle: dict,
+    ) -> None:
+        """Initialize the button class."""
+        super().__init__(coordinator, vehicle)
+        self.entity_description = entity_description
+        self.vehicle_id = vehicle["vehicle"]["id"]
+
+        plate = getattr(self, "_license_plate", self.vehicle_id)
+        self._attr_unique_id = f"vwgc_{plate}_{entity_description.key}"
+        if isinstance(entity_description.name, str):
+            self._attr_name = entity_description.name
+        self._attr_suggested_object_id = f"vwgc_{plate}_{entity_description.key}"
+
+    async def async_press(self) -> None:
+        """Refresh this vehicle only."""
+        await self.coordinator.async_request_vehicle_refresh(self.vehicle_id)
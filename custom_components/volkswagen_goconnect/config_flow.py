@@ -22,7 +22,26 @@ from .api import (
     VolkswagenGoConnectApiClientCommunicationError,
     VolkswagenGoConnectApiClientError,
 )
-from .const import CONF_POLLING_INTERVAL, DOMAIN, LOGGER
+from .const import (
+    CONF_FAST_POLL_DURATION,
+    CONF_MAX_STALENESS,
+    CONF_POLL_JITTER,
+    CONF_POLLING_INTERVAL,
+    CONF_QUIET_HOURS_END,
+    CONF_QUIET_HOURS_START,
+    CONF_REQUEST_BUDGET,
+    CONF_REQUEST_BUDGET_PERIOD,
+    CONF_TRACKER_MIN_DISTANCE,
+    DEFAULT_FAST_POLL_DURATION,
+    DEFAULT_MAX_STALENESS,
+    DEFAULT_POLL_JITTER,
+    DEFAULT_REQUEST_BUDGET,
+    DEFAULT_REQUEST_BUDGET_PERIOD,
+    DEFAULT_TRACKER_MIN_DISTANCE,
+    DOMAIN,
+    LOGGER,
+)
+from .scheduler import BUDGET_PERIODS
 
 
 class VolkswagenGoConnectFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
@@ -235,6 +254,108 @@ class VolkswagenGoConnectOptionsFlowHandler(config_entries.OptionsFlow):
                                 mode=selector.NumberSelectorMode.SLIDER,
                             )
                         ),
+                        vol.Required(
+                            CONF_POLL_JITTER,
+                            default=self._config_entry.options.get(
+                                CONF_POLL_JITTER,
+                                DEFAULT_POLL_JITTER,
+                            ),
+                        ): selector.NumberSelector(
+                            selector.NumberSelectorConfig(
+                                min=0,
+                                max=60,
+                                step=1,
+                                unit_of_measurement="s",
+                                mode=selector.NumberSelectorMode.SLIDER,
+                            )
+                        ),
+                        vol.Required(
+                            CONF_MAX_STALENESS,
+                            default=self._config_entry.options.get(
+                                CONF_MAX_STALENESS,
+                                DEFAULT_MAX_STALENESS,
+                            ),
+                        ): selector.NumberSelector(
+                            selector.NumberSelectorConfig(
+                                min=0,
+                                max=1440,
+                                step=5,
+                                unit_of_measurement="min",
+                                mode=selector.NumberSelectorMode.BOX,
+                            )
+                        ),
+                        vol.Required(
+                            CONF_TRACKER_MIN_DISTANCE,
+                            default=self._config_entry.options.get(
+                                CONF_TRACKER_MIN_DISTANCE,
+                                DEFAULT_TRACKER_MIN_DISTANCE,
+                            ),
+                        ): selector.NumberSelector(
+                            selector.NumberSelectorConfig(
+                                min=0,
+                                max=500,
+                                step=5,
+                                unit_of_measurement="m",
+                                mode=selector.NumberSelectorMode.SLIDER,
+                            )
+                        ),
+                        vol.Required(
+                            CONF_FAST_POLL_DURATION,
+                            default=self._config_entry.options.get(
+                                CONF_FAST_POLL_DURATION,
+                                DEFAULT_FAST_POLL_DURATION,
+                            ),
+                        ): selector.NumberSelector(
+                            selector.NumberSelectorConfig(
+                                min=5,
+                                max=240,
+                                step=5,
+                                unit_of_measurement="min",
+                                mode=selector.NumberSelectorMode.SLIDER,
+                            )
+                        ),
+                        vol.Required(
+                            CONF_REQUEST_BUDGET,
+                            default=self._config_entry.options.get(
+                                CONF_REQUEST_BUDGET,
+                                DEFAULT_REQUEST_BUDGET,
+                            ),
+                        ): selector.NumberSelector(
+                            selector.NumberSelectorConfig(
+                                min=0,
+                                max=100000,
+                                step=10,
+                                mode=selector.NumberSelectorMode.BOX,
+                            )
+                        ),
+                        vol.Required(
+                            CONF_REQUEST_BUDGET_PERIOD,
+                            default=self._config_entry.options.get(
+                                CONF_REQUEST_BUDGET_PERIOD,
+                                DEFAULT_REQUEST_BUDGET_PERIOD,
+                            ),
+                        ): selector.SelectSelector(
+                            selector.SelectSelectorConfig(
+                                options=list(BUDGET_PERIODS),
+                                translation_key=CONF_REQUEST_BUDGET_PERIOD,
+                            )
+                        ),
+                        vol.Optional(
+                            CONF_QUIET_HOURS_START,
+                            description={
+                                "suggested_value": self._config_entry.options.get(
+                                    CONF_QUIET_HOURS_START
+                                )
+                            },
+                        ): selector.TimeSelector(),
+                        vol.Optional(
+                            CONF_QUIET_HOURS_END,
+                            description={
+                                "suggested_value": self._config_entry.options.get(
+                                    CONF_QUIET_HOURS_END
+                                )
+                            },
+                        ): selector.TimeSelector(),
                     }
                 ),
             ),
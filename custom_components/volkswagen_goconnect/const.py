@@ -13,13 +13,39 @@ AUTH_URL = BASE_URL_AUTH_LOGIN + "/email/password"
 AUTH_TOKEN_URL = BASE_URL_AUTH_LOGIN + "/deviceToken"
 REGISTER_DEVICE_URL = BASE_URL_AUTH + "/user/registerDevice"
 CONF_POLLING_INTERVAL = "polling_interval"
+CONF_TRACKER_MIN_DISTANCE = "tracker_min_distance"
+DEFAULT_TRACKER_MIN_DISTANCE = 25  # metres
+CONF_FAST_POLL_DURATION = "fast_poll_duration"
+DEFAULT_FAST_POLL_DURATION = 30  # minutes
+CONF_REQUEST_BUDGET = "request_budget"
+DEFAULT_REQUEST_BUDGET = 0  # requests per period, 0 = unlimited
+CONF_REQUEST_BUDGET_PERIOD = "request_budget_period"
+DEFAULT_REQUEST_BUDGET_PERIOD = "day"
+CONF_POLL_JITTER = "poll_jitter"
+DEFAULT_POLL_JITTER = 0  # seconds
+CONF_MAX_STALENESS = "max_staleness"
+DEFAULT_MAX_STALENESS = 0  # minutes, 0 = entities go unavailable on failure
+CONF_QUIET_HOURS_START = "quiet_hours_start"
+CONF_QUIET_HOURS_END = "quiet_hours_end"
+# Static metadata and system overview extras skipped in degraded mode, when
+# the API throttles or the request budget runs low
+LOW_VALUE_FIELDS = (
+    "workshop",
+    "insurance",
+    "leasing",
+    "service",
+    "brandContactInfo",
+    "leads",
+    "recentBatteryVoltages",
+)
 QUERY_API_VEHICLETYPE = (
     "query VehiclesType { viewer { id vehicles { vehicle { ...VehicleType "
     "__typename } __typename } __typename }} fragment VehicleType on Vehicle { "
-    "id fuelType primaryUser { id __typename } primaryFleet { id isLightFleet "
+    "id fuelType isCharging ignition { id on time __typename } "
+    "primaryUser { id __typename } primaryFleet { id isLightFleet "
     "workHours { day __typename } name featureFlags __typename }  __typename}"
 )
-QUERY_VEHICLE_DETAILS = """query Vehicle($id: ID!) {
+QUERY_VEHICLE_DETAILS = """query Vehicle($id: ID!, $extras: Boolean = true) {
   vehicle(id: $id) {
     ...Vehicle
     __typename
@@ -68,7 +94,7 @@ fragment Vehicle on Vehicle {
   class
   updateTime
   absoluteImageUrl
-  service {
+  service @include(if: $extras) {
     ...VehicleServiceData
     __typename
   }
@@ -84,15 +110,15 @@ fragment Vehicle on Vehicle {
     __typename
   }
   licensePlate
-  leads(types: [service_reminder]) {
+  leads(types: [service_reminder]) @include(if: $extras) {
     id
     __typename
   }
-  insurance {
+  insurance @include(if: $extras) {
     ...Insurance
     __typename
   }
-  leasing {
+  leasing @include(if: $extras) {
     ...Leasing
     __typename
   }
@@ -106,11 +132,11 @@ fragment Vehicle on Vehicle {
   year
   hasFleet
   make
-  workshop {
+  workshop @include(if: $extras) {
     ...MobileWorkshop
     __typename
   }
-  brandContactInfo {
+  brandContactInfo @include(if: $extras) {
     ...NamespaceBrandContactInfo
     __typename
   }
@@ -257,12 +283,16 @@ fragment NamespaceBrandContactInfo on OrganizationNamespaceBrandContactInfo {
   roadsideAssistancePaid
   __typename
 }"""
-QUERY_VEHICLE_SYSTEM_OVERVIEW = """query VehicleSystemOverview($id: ID!, $statuses: [LeadStatus!] = [open]) {
+QUERY_VEHICLE_SYSTEM_OVERVIEW = """query VehicleSystemOverview(
+  $id: ID!
+  $statuses: [LeadStatus!] = [open]
+  $extras: Boolean = true
+) {
   vehicle(id: $id) {
     id
     productFeatures
     licensePlate
-    leads(statuses: $statuses) {
+    leads(statuses: $statuses) @include(if: $extras) {
       id
       status
       dismissed
@@ -323,19 +353,19 @@ QUERY_VEHICLE_SYSTEM_OVERVIEW = """query VehicleSystemOverview($id: ID!, $status
       ...BatteryVoltage
       __typename
     }
-    recentBatteryVoltages {
+    recentBatteryVoltages @include(if: $extras) {
       ...BatteryVoltage
       __typename
     }
-    service {
+    service @include(if: $extras) {
       ...VehicleSystemOverviewServiceData
       __typename
     }
-    insurance {
+    insurance @include(if: $extras) {
       ...Insurance
       __typename
     }
-    leasing {
+    leasing @include(if: $extras) {
       ...Leasing
       __typename
     }
@@ -2,26 +2,137 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from time import monotonic
 from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
 
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 if TYPE_CHECKING:
-    from datetime import timedelta
-
     from homeassistant.config_entries import ConfigEntry
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+    from .hub import VolkswagenGoConnectHub
 
 from .api import (
     VolkswagenGoConnectApiClient,
     VolkswagenGoConnectApiClientAuthenticationError,
+    VolkswagenGoConnectApiClientCircuitOpenError,
     VolkswagenGoConnectApiClientError,
 )
-from .const import DOMAIN, LOGGER
+from .breaker import BreakerState
+from .const import (
+    BASE_URL_API,
+    CONF_FAST_POLL_DURATION,
+    CONF_MAX_STALENESS,
+    CONF_POLL_JITTER,
+    CONF_POLLING_INTERVAL,
+    CONF_QUIET_HOURS_END,
+    CONF_QUIET_HOURS_START,
+    CONF_REQUEST_BUDGET,
+    CONF_REQUEST_BUDGET_PERIOD,
+    DEFAULT_FAST_POLL_DURATION,
+    DEFAULT_MAX_STALENESS,
+    DEFAULT_POLL_JITTER,
+    DEFAULT_REQUEST_BUDGET,
+    DEFAULT_REQUEST_BUDGET_PERIOD,
+    DOMAIN,
+    LOGGER,
+    LOW_VALUE_FIELDS,
+)
+from .limiter import Priority, get_limiter
+from .scheduler import (
+    MAX_VEHICLES_PER_POLL,
+    REQUESTS_PER_VEHICLE,
+    PollScheduler,
+    RequestBudget,
+    is_active,
+    jittered,
+    outage_backoff,
+    stagger_offset,
+)
+from .session import KEEPALIVE_TIMEOUT_SECONDS
+
+# Window after a vehicle refresh in which further requests are coalesced
+VEHICLE_REFRESH_COOLDOWN_SECONDS = 2.0
+# Refresh interval of a vehicle in fast poll mode
+FAST_POLL_INTERVAL = timedelta(seconds=15)
+# How long before a poll a connection is pre-warmed after a long idle gap
+PREWARM_LEAD = timedelta(seconds=5)
+# Share of the polling interval a poll may take, so it never overlaps the next
+POLL_DEADLINE_SHARE = 0.8
+MIN_POLL_DEADLINE = timedelta(seconds=10)
+# Time kept in hand to fetch one more vehicle before the poll deadline
+VEHICLE_FETCH_RESERVE = timedelta(seconds=2)
+# Degraded mode is entered once the API throttled this many requests within
+# the window, and left once it throttled none for a whole window
+DEGRADE_THROTTLED_REQUESTS = 3
+DEGRADE_THROTTLE_WINDOW = timedelta(minutes=10)
+API_HOST = urlparse(BASE_URL_API).netloc
+
+
+def get_polling_interval(entry: ConfigEntry) -> timedelta:
+    """Return the polling interval configured for a config entry."""
+    return timedelta(
+        seconds=entry.options.get(
+            CONF_POLLING_INTERVAL, entry.data.get(CONF_POLLING_INTERVAL, 60)
+        )
+    )
+
+
+def get_poll_offset(hass: HomeAssistant, entry: ConfigEntry) -> timedelta:
+    """
+    Return the delay of the first scheduled poll of a config entry.
+
+    The accounts of this integration are spread evenly over the polling
+    interval, so accounts set up together at startup never poll in step.
+    """
+    entry_ids = sorted(
+        other.entry_id
+        for other in hass.config_entries.async_entries(
+            DOMAIN, include_ignore=False, include_disabled=False
+        )
+    )
+    if entry.entry_id not in entry_ids:
+        return timedelta(0)
+    return stagger_offset(
+        entry_ids.index(entry.entry_id), len(entry_ids), get_polling_interval(entry)
+    )
+
+
+def get_quiet_hours(entry: ConfigEntry) -> tuple[time, time] | None:
+    """Return the quiet hours configured for a config entry, if any."""
+    start = dt_util.parse_time(entry.options.get(CONF_QUIET_HOURS_START) or "")
+    end = dt_util.parse_time(entry.options.get(CONF_QUIET_HOURS_END) or "")
+    if start is None or end is None or start == end:
+        return None
+    return start, end
 
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
+@dataclass
+class _Poll:
+    """State of a poll, shared by the callbacks the client calls during it."""
+
+    now: datetime
+    previous: dict[str, dict]
+    due: set[str]
+    deadline: float
+    extras: bool
+    # Vehicles keeping their previous data, taken from the hub, and as listed
+    skip: set[str]
+    shared: dict[str, tuple[dict, datetime]]
+    listed: dict[str, dict]
+
+
 class VolkswagenGoConnectDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the API."""
 
@@ -32,9 +143,37 @@ class VolkswagenGoConnectDataUpdateCoordinator(DataUpdateCoordinator):
         hass: HomeAssistant,
         client: VolkswagenGoConnectApiClient,
         update_interval: timedelta,
+        poll_offset: timedelta = timedelta(0),
+        hub: VolkswagenGoConnectHub | None = None,
     ) -> None:
         """Initialize."""
         self.client = client
+        self.hub = hub
+        self.data = None
+        # Whether the data is the last snapshot kept while the API is failing
+        self.stale = False
+        # Why low-value fields are skipped, or None in normal operation
+        self.degraded_reason: str | None = None
+        self._last_success: datetime | None = None
+        # Failed polls in a row, while the API is out
+        self._outage_polls = 0
+        self._max_staleness = timedelta(0)
+        self._poll_offset = poll_offset
+        self._poll_jitter = timedelta(0)
+        self._scheduler = PollScheduler(update_interval)
+        self.budget = RequestBudget()
+        self._vehicle_ids: set[str] | None = None
+        self._pending_vehicle_refresh: set[str] = set()
+        self._pending_interactive_refresh: set[str] = set()
+        self._fast_polls: dict[str, tuple[datetime, CALLBACK_TYPE]] = {}
+        self._cancel_prewarm: CALLBACK_TYPE | None = None
+        self._vehicle_refresh_debouncer = Debouncer(
+            hass,
+            LOGGER,
+            cooldown=VEHICLE_REFRESH_COOLDOWN_SECONDS,
+            immediate=True,
+            function=self._async_refresh_pending_vehicles,
+        )
         super().__init__(
             hass,
             LOGGER,
@@ -42,11 +181,590 @@ class VolkswagenGoConnectDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=update_interval,
         )
 
+    async def async_shutdown(self) -> None:
+        """Cancel pending vehicle refreshes and shut down the coordinator."""
+        for _, cancel in self._fast_polls.values():
+            cancel()
+        self._fast_polls.clear()
+        if self._cancel_prewarm is not None:
+            self._cancel_prewarm()
+            self._cancel_prewarm = None
+        self._vehicle_refresh_debouncer.async_shutdown()
+        await super().async_shutdown()
+
     async def _async_update_data(self) -> Any:
-        """Update data via library."""
+        """
+        Update data via library.
+
+        Only the vehicles that are due, or that started or stopped driving or
+        charging, have their details fetched, each patched in as soon as it is
+        complete; the others keep their previous data. The coordinator then
+        sleeps until the next vehicle is due. Nothing is fetched during the
+        quiet hours.
+        """
+        now = dt_util.now()
+        if self.data is not None and self._scheduler.quiet(now):
+            self.update_interval = self._scheduler.next_wakeup(now)
+            LOGGER.debug("Quiet hours, next poll in %s", self.update_interval)
+            self._async_schedule_prewarm()
+            return self.data
+
+        poll = self._start_poll(now)
         try:
-            return await self.client.async_get_data()
+            data = await self.client.async_get_data(
+                skip=lambda listed: self._skip_vehicle(poll, listed),
+                extras=poll.extras,
+                deadline=poll.deadline,
+                on_vehicle=lambda entry: self._async_on_vehicle(poll, entry),
+            )
         except VolkswagenGoConnectApiClientAuthenticationError as exception:
             raise ConfigEntryAuthFailed(exception) from exception
         except VolkswagenGoConnectApiClientError as exception:
+            return self._serve_stale(exception, now)
+
+        if self._outage_polls:
+            LOGGER.info(
+                "API recovered after %d failed polls, back to normal polling",
+                self._outage_polls,
+            )
+            self._outage_polls = 0
+        self.stale = False
+        self._last_success = now
+
+        data = self._keep_previous_vehicles(poll, data)
+        current = vehicles_by_id(data)
+        fetched = {
+            vehicle_id: vehicle
+            for vehicle_id, vehicle in current.items()
+            if vehicle_id not in poll.skip and vehicle_id not in poll.shared
+        }
+        for vehicle_id, vehicle in fetched.items():
+            if not poll.extras and vehicle_id in poll.previous:
+                keep_low_value_fields(vehicle, poll.previous[vehicle_id])
+            self._scheduler.record(vehicle_id, vehicle, now)
+        for vehicle_id, (vehicle, fetched_at) in poll.shared.items():
+            self._scheduler.record(vehicle_id, vehicle, fetched_at)
+        self._scheduler.retain(current)
+        if self.hub is not None:
+            self.hub.async_update_listing(self.config_entry.entry_id, set(current))
+            self.hub.async_publish(self.config_entry.entry_id, fetched, now)
+
+        self.budget.record(self.client.request_count, now)
+        self.update_interval = (
+            jittered(
+                self.budget.stretch(self._scheduler.next_wakeup(now), now),
+                self._poll_jitter,
+            )
+            + self._poll_offset
+        )
+        # The offset only shifts the first scheduled poll; later polls keep it
+        self._poll_offset = timedelta(0)
+        LOGGER.debug(
+            "Polled %d of %d vehicles%s, %d requests used, next poll in %s",
+            len(fetched),
+            len(current),
+            "" if poll.extras else " without low-value fields",
+            self.budget.used,
+            self.update_interval,
+        )
+
+        self._async_schedule_prewarm()
+        self._async_remove_departed_vehicles(set(current))
+        return data
+
+    def _start_poll(self, now: datetime) -> _Poll:
+        """
+        Plan a poll: which vehicles are due, and by when it must finish.
+
+        With a request budget set, fewer vehicles are due as it runs low, and
+        low-value fields are skipped in degraded mode. Vehicles fetched for
+        this account through the hub are never due.
+        """
+        self.budget.record(self.client.request_count, now)
+        self._update_degraded(now)
+        previous = vehicles_by_id(self.data)
+        due = self._scheduler.select(
+            [
+                vehicle_id
+                for vehicle_id in previous
+                if not self._fetched_elsewhere(vehicle_id, now)
+            ],
+            now,
+            self.budget.affordable(MAX_VEHICLES_PER_POLL, REQUESTS_PER_VEHICLE),
+        )
+        deadline = (
+            monotonic()
+            + max(
+                self._scheduler.base_interval * POLL_DEADLINE_SHARE, MIN_POLL_DEADLINE
+            ).total_seconds()
+        )
+        return _Poll(
+            now=now,
+            previous=previous,
+            due=set(due),
+            deadline=deadline,
+            extras=self.degraded_reason is None,
+            skip=set(),
+            shared={},
+            listed={},
+        )
+
+    def _skip_vehicle(self, poll: _Poll, listed: dict) -> bool:
+        """Return True if the details of a listed vehicle are not fetched."""
+        vehicle_id = listed["id"]
+        poll.listed[vehicle_id] = listed
+        if (
+            self.hub is not None
+            and self._fetched_elsewhere(vehicle_id, poll.now)
+            and (snapshot := self.hub.snapshot(vehicle_id)) is not None
+        ):
+            poll.shared[vehicle_id] = snapshot
+            return True
+        in_time = monotonic() + VEHICLE_FETCH_RESERVE.total_seconds() < poll.deadline
+        if vehicle_id not in poll.previous:
+            # Left out of this poll, like below, when out of time
+            return not in_time
+        if in_time and (
+            vehicle_id in poll.due
+            or (
+                self._scheduler.watched(vehicle_id)
+                and is_active(listed) != is_active(poll.previous[vehicle_id])
+            )
+        ):
+            return False
+        poll.skip.add(vehicle_id)
+        return True
+
+    @callback
+    def _async_on_vehicle(self, poll: _Poll, entry: dict) -> None:
+        """Patch a fetched vehicle into the snapshot and update its entities."""
+        vehicle = entry["vehicle"]
+        vehicle_id = vehicle["id"]
+        if (
+            self.data is None
+            or vehicle_id not in poll.previous
+            or vehicle_id in poll.skip
+            or vehicle_id in poll.shared
+            # A vehicle whose details failed comes back as its list entry
+            or vehicle is poll.listed.get(vehicle_id)
+        ):
+            return
+        if not poll.extras:
+            keep_low_value_fields(vehicle, poll.previous[vehicle_id])
+        self.data = patch_vehicles(self.data, {vehicle_id: vehicle})
+        self.async_update_vehicle_listeners(vehicle_id)
+
+    def _serve_stale(
+        self, exception: VolkswagenGoConnectApiClientError, now: datetime
+    ) -> Any:
+        """
+        Return the previous snapshot, marked stale, after a failed poll.
+
+        It is served while the client's circuit breaker is open, including
+        after a failed probe, or while the last successful poll is no older
+        than the configured maximum staleness; otherwise the poll fails. The
+        interval doubles with every failed poll in a row, up to a cap.
+        """
+        self._outage_polls += 1
+        if self._outage_polls == 1:
+            LOGGER.warning(
+                "Error fetching data (%s), backing off until the API recovers",
+                exception,
+            )
+        self.update_interval = outage_backoff(
+            self._scheduler.base_interval, self._outage_polls
+        )
+        if self.data is None or not (
+            isinstance(exception, VolkswagenGoConnectApiClientCircuitOpenError)
+            or self.client.breaker.state is not BreakerState.CLOSED
+            or self._within_max_staleness(now)
+        ):
             raise UpdateFailed(exception) from exception
+        self.stale = True
+        return self.data
+
+    def _keep_previous_vehicles(self, poll: _Poll, data: dict) -> dict:
+        """
+        Patch the vehicles not fetched by a poll into its data.
+
+        Skipped vehicles, and those whose details failed, keep their previous
+        data, or the data a refresh got them while the poll ran. Shared ones
+        get the hub's snapshot. New vehicles without details are left out.
+        """
+        # A vehicle whose details failed comes back as the very list entry
+        without_details: set[str] = set()
+        for vehicle_id, vehicle in vehicles_by_id(data).items():
+            if vehicle_id in poll.skip or vehicle is not poll.listed.get(vehicle_id):
+                continue
+            if vehicle_id in poll.previous:
+                LOGGER.debug("Keeping the previous data of vehicle %s", vehicle_id)
+                poll.skip.add(vehicle_id)
+            elif vehicle_id not in poll.shared:
+                without_details.add(vehicle_id)
+        if without_details:
+            # Entities built from the bare list entry would be named after the
+            # vehicle id, so new vehicles wait for their details
+            LOGGER.debug("Waiting for the details of new vehicles %s", without_details)
+            data = drop_vehicles(data, without_details)
+        if not poll.skip and not poll.shared:
+            return data
+        latest = vehicles_by_id(self.data)
+        return patch_vehicles(
+            data,
+            {
+                vehicle_id: latest.get(vehicle_id, poll.previous[vehicle_id])
+                for vehicle_id in poll.skip
+            }
+            | {vehicle_id: vehicle for vehicle_id, (vehicle, _) in poll.shared.items()},
+        )
+
+    async def async_request_vehicle_refresh(
+        self, vehicle_id: str, *, interactive: bool = True
+    ) -> None:
+        """
+        Request a refresh of a single vehicle.
+
+        The first request is fetched right away. Those arriving within the
+        cooldown window after it are coalesced, so refreshing several vehicles
+        at once results in a single further fetch of just those vehicles.
+        Interactive refreshes, asked for by the user, jump ahead of the requests
+        of background polls.
+        """
+        self._pending_vehicle_refresh.add(vehicle_id)
+        if interactive:
+            self._pending_interactive_refresh.add(vehicle_id)
+        await self._vehicle_refresh_debouncer.async_call()
+
+    async def _async_refresh_pending_vehicles(self) -> None:
+        """Fetch the vehicles with a pending refresh and patch them in."""
+        pending = self._pending_vehicle_refresh
+        interactive = self._pending_interactive_refresh
+        self._pending_vehicle_refresh = set()
+        self._pending_interactive_refresh = set()
+
+        refreshed: dict[str, dict] = {}
+        for vehicle_id in sorted(pending & vehicle_ids(self.data)):
+            try:
+                vehicle_data = await self.client.async_get_vehicle(
+                    vehicle_id,
+                    priority=(
+                        Priority.INTERACTIVE if vehicle_id in interactive else None
+                    ),
+                )
+            except VolkswagenGoConnectApiClientError as exception:
+                LOGGER.warning("Error refreshing vehicle %s: %s", vehicle_id, exception)
+                continue
+            if vehicle_data is not None:
+                refreshed[vehicle_id] = vehicle_data
+
+        if not refreshed:
+            return
+
+        now = dt_util.now()
+        for vehicle_id, vehicle_data in refreshed.items():
+            self._scheduler.record(vehicle_id, vehicle_data, now)
+        self.budget.record(self.client.request_count, now)
+
+        # Patch the snapshot without resetting the schedule of the full poll
+        self.data = patch_vehicles(self.data, refreshed)
+        for vehicle_id in refreshed:
+            self.async_update_vehicle_listeners(vehicle_id)
+        if self.hub is not None:
+            self.hub.async_publish(self.config_entry.entry_id, refreshed, now)
+
+    @callback
+    def async_update_vehicle_listeners(self, vehicle_id: str) -> None:
+        """Update the listeners of the entities of one vehicle."""
+        for update_callback, context in list(self._listeners.values()):
+            if context == vehicle_id:
+                update_callback()
+
+    @callback
+    def async_receive_shared_vehicles(
+        self, vehicles: dict[str, dict], fetched_at: datetime
+    ) -> None:
+        """Patch in vehicles that another account fetched through the hub."""
+        received = {
+            vehicle_id: vehicle
+            for vehicle_id, vehicle in vehicles.items()
+            if vehicle_id in vehicle_ids(self.data)
+        }
+        if not received:
+            return
+        for vehicle_id, vehicle in received.items():
+            self._scheduler.record(vehicle_id, vehicle, fetched_at)
+        self.data = patch_vehicles(self.data, received)
+        self.async_update_listeners()
+
+    def owns(self, vehicle_id: str) -> bool:
+        """Return True if this account creates the entities of a vehicle."""
+        if self.hub is None:
+            return True
+        return self.hub.owner(vehicle_id) in (None, self.config_entry.entry_id)
+
+    def _fetched_elsewhere(self, vehicle_id: str, now: datetime) -> bool:
+        """Return True if another account fetches a vehicle for this one."""
+        if self.hub is None:
+            return False
+        entry_id = self.config_entry.entry_id
+        return self.hub.fetcher(vehicle_id, entry_id, now) != entry_id
+
+    @property
+    def data_age_seconds(self) -> int | None:
+        """Return the age of the data while stale data is served, else None."""
+        if not self.stale or self._last_success is None:
+            return None
+        return int((dt_util.now() - self._last_success).total_seconds())
+
+    def _update_degraded(self, now: datetime) -> None:
+        """Enter or leave degraded mode, in which low-value fields are skipped."""
+        throttled = get_limiter(API_HOST).throttled(
+            DEGRADE_THROTTLE_WINDOW.total_seconds()
+        )
+        if self.budget.economy(now):
+            reason = "request_budget"
+        elif throttled >= DEGRADE_THROTTLED_REQUESTS or (
+            throttled and self.degraded_reason == "throttling"
+        ):
+            reason = "throttling"
+        else:
+            reason = None
+        if reason == self.degraded_reason:
+            return
+        if reason is None:
+            LOGGER.info("Leaving degraded mode, fetching all fields again")
+        else:
+            LOGGER.warning(
+                "Entering degraded mode (%s), skipping low-value fields", reason
+            )
+        self.degraded_reason = reason
+
+    def _within_max_staleness(self, now: datetime) -> bool:
+        """Return whether the last snapshot may still be served after a failure."""
+        return (
+            self._last_success is not None
+            and now - self._last_success <= self._max_staleness
+        )
+
+    @property
+    def missed_deadlines(self) -> int:
+        """Return how many vehicle polls came well after their deadline."""
+        return self._scheduler.missed_deadlines
+
+    def vehicle_data_age(self, vehicle_id: str) -> float | None:
+        """Return the seconds since a vehicle was last fetched."""
+        age = self._scheduler.data_age(vehicle_id, dt_util.now())
+        return round(age.total_seconds()) if age is not None else None
+
+    def fast_poll_ends_at(self, vehicle_id: str) -> datetime | None:
+        """Return when fast polling of a vehicle ends, or None if inactive."""
+        fast_poll = self._fast_polls.get(vehicle_id)
+        return fast_poll[0] if fast_poll else None
+
+    @callback
+    def async_start_fast_poll(self, vehicle_id: str) -> None:
+        """
+        Poll a single vehicle at a high rate for the configured duration.
+
+        The rest of the fleet stays on the normal polling interval. Fast polling
+        switches itself off once the duration has elapsed.
+        """
+        self._async_cancel_fast_poll(vehicle_id)
+        ends_at = dt_util.utcnow() + timedelta(
+            minutes=self.config_entry.options.get(
+                CONF_FAST_POLL_DURATION, DEFAULT_FAST_POLL_DURATION
+            )
+        )
+
+        @callback
+        def _async_fast_poll_tick(now: datetime) -> None:
+            if now >= ends_at:
+                LOGGER.debug("Fast polling of vehicle %s ended", vehicle_id)
+                self.async_stop_fast_poll(vehicle_id)
+                return
+            self._async_schedule_vehicle_refresh(vehicle_id, interactive=False)
+
+        self._fast_polls[vehicle_id] = (
+            ends_at,
+            async_track_time_interval(
+                self.hass, _async_fast_poll_tick, FAST_POLL_INTERVAL
+            ),
+        )
+        LOGGER.debug("Fast polling vehicle %s until %s", vehicle_id, ends_at)
+        self._async_schedule_vehicle_refresh(vehicle_id, interactive=True)
+        self.async_update_listeners()
+
+    @callback
+    def async_stop_fast_poll(self, vehicle_id: str) -> None:
+        """Return a vehicle to the normal polling interval."""
+        if self._async_cancel_fast_poll(vehicle_id):
+            self.async_update_listeners()
+
+    @callback
+    def _async_cancel_fast_poll(self, vehicle_id: str) -> bool:
+        """Cancel the fast poll timer of a vehicle; return True if one ran."""
+        fast_poll = self._fast_polls.pop(vehicle_id, None)
+        if fast_poll is None:
+            return False
+        fast_poll[1]()
+        return True
+
+    @callback
+    def _async_schedule_vehicle_refresh(
+        self, vehicle_id: str, *, interactive: bool
+    ) -> None:
+        """Request a vehicle refresh from a callback."""
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self.async_request_vehicle_refresh(vehicle_id, interactive=interactive),
+            f"{DOMAIN} refresh vehicle {vehicle_id}",
+        )
+
+    @callback
+    def _async_schedule_prewarm(self) -> None:
+        """
+        Pre-warm a connection shortly before the next poll after a long gap.
+
+        Pooled connections outlive short intervals, so only polls further away
+        than the keep-alive timeout need a fresh connection opened in advance.
+        """
+        if self._cancel_prewarm is not None:
+            self._cancel_prewarm()
+            self._cancel_prewarm = None
+        if self.update_interval is None or self.update_interval <= timedelta(
+            seconds=KEEPALIVE_TIMEOUT_SECONDS
+        ):
+            return
+
+        @callback
+        def _async_prewarm(_: datetime) -> None:
+            self._cancel_prewarm = None
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self.client.async_prewarm(),
+                f"{DOMAIN} pre-warm connection",
+            )
+
+        self._cancel_prewarm = async_call_later(
+            self.hass, self.update_interval - PREWARM_LEAD, _async_prewarm
+        )
+
+    @callback
+    def async_apply_options(self) -> None:
+        """Apply the config entry options to the running coordinator."""
+        options = self.config_entry.options
+        self.budget.configure(
+            int(options.get(CONF_REQUEST_BUDGET, DEFAULT_REQUEST_BUDGET)),
+            options.get(CONF_REQUEST_BUDGET_PERIOD, DEFAULT_REQUEST_BUDGET_PERIOD),
+        )
+        self._scheduler.quiet_hours = get_quiet_hours(self.config_entry)
+        self._poll_jitter = timedelta(
+            seconds=options.get(CONF_POLL_JITTER, DEFAULT_POLL_JITTER)
+        )
+        self._max_staleness = timedelta(
+            minutes=options.get(CONF_MAX_STALENESS, DEFAULT_MAX_STALENESS)
+        )
+
+        update_interval = get_polling_interval(self.config_entry)
+        if update_interval == self._scheduler.base_interval:
+            return
+
+        LOGGER.debug("Polling interval changed to %s", update_interval)
+        self._scheduler.base_interval = update_interval
+        self._scheduler.reset()
+        self.update_interval = update_interval
+        if self._listeners:
+            self._schedule_refresh()
+
+    @callback
+    def _async_remove_departed_vehicles(self, current_ids: set[str]) -> None:
+        """
+        Remove the devices of vehicles that are no longer on the account.
+
+        Removing the device also removes its entities, so the rest of the fleet
+        keeps running without a reload. An empty vehicle list is not trusted as
+        "every vehicle left"; stale devices can still be deleted from the UI.
+        """
+        previous_ids = self._vehicle_ids
+        self._vehicle_ids = current_ids
+        if not previous_ids or not current_ids:
+            return
+
+        device_registry = dr.async_get(self.hass)
+        for vehicle_id in previous_ids - current_ids:
+            self._async_cancel_fast_poll(vehicle_id)
+            device = device_registry.async_get_device(
+                identifiers={(DOMAIN, vehicle_id)}
+            )
+            if device is None:
+                continue
+            LOGGER.info("Vehicle %s left the account, removing its device", vehicle_id)
+            device_registry.async_update_device(
+                device.id, remove_config_entry_id=self.config_entry.entry_id
+            )
+
+
+def patch_vehicles(data: dict, vehicles: dict[str, dict]) -> dict:
+    """Return a copy of a snapshot with some vehicles replaced."""
+    entries = data.get("data", {}).get("viewer", {}).get("vehicles", [])
+    return {
+        "data": {
+            "viewer": {
+                "vehicles": [
+                    {"vehicle": vehicles[entry["vehicle"]["id"]]}
+                    if entry
+                    and entry.get("vehicle")
+                    and entry["vehicle"].get("id") in vehicles
+                    else entry
+                    for entry in entries
+                ]
+            }
+        }
+    }
+
+
+def drop_vehicles(data: dict, vehicle_ids: set[str]) -> dict:
+    """Return a copy of a snapshot without some vehicles."""
+    entries = data.get("data", {}).get("viewer", {}).get("vehicles", [])
+    return {
+        "data": {
+            "viewer": {
+                "vehicles": [
+                    entry
+                    for entry in entries
+                    if not (
+                        entry
+                        and entry.get("vehicle")
+                        and entry["vehicle"].get("id") in vehicle_ids
+                    )
+                ]
+            }
+        }
+    }
+
+
+def keep_low_value_fields(vehicle: dict, previous: dict) -> None:
+    """Fill the low-value fields skipped by a fetch from the previous data."""
+    for field in LOW_VALUE_FIELDS:
+        if field not in vehicle and field in previous:
+            vehicle[field] = previous[field]
+
+
+def vehicles_by_id(data: dict | None) -> dict[str, dict]:
+    """Return the vehicles of a coordinator snapshot keyed by their id."""
+    vehicles = (data or {}).get("data", {}).get("viewer", {}).get("vehicles", [])
+    return {
+        vehicle["vehicle"]["id"]: vehicle["vehicle"]
+        for vehicle in vehicles
+        if vehicle and vehicle.get("vehicle") and vehicle["vehicle"].get("id")
+    }
+
+
+def vehicle_ids(data: dict | None) -> set[str]:
+    """Return the ids of the vehicles in a coordinator snapshot."""
+    vehicles = (data or {}).get("data", {}).get("viewer", {}).get("vehicles", [])
+    return {
+        vehicle["vehicle"]["id"]
+        for vehicle in vehicles
+        if vehicle and vehicle.get("vehicle") and vehicle["vehicle"].get("id")
+    }
@@ -19,3 +19,4 @@ class VolkswagenGoConnectData:
     client: VolkswagenGoConnectApiClient
     coordinator: VolkswagenGoConnectDataUpdateCoordinator
     integration: Integration
+    credentials: tuple[str | None, ...]
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.device_tracker.config_entry import TrackerEntity
 from homeassistant.components.device_tracker.const import SourceType
+from homeassistant.core import callback
 
-from .entity import VolkswagenGoConnectEntity
+from .const import CONF_TRACKER_MIN_DISTANCE, DEFAULT_TRACKER_MIN_DISTANCE
+from .entity import VolkswagenGoConnectEntity, async_add_vehicle_entities
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -16,6 +19,23 @@ if TYPE_CHECKING:
 
     from .coordinator import VolkswagenGoConnectDataUpdateCoordinator
 
+EARTH_RADIUS_METRES = 6_371_000
+
+
+def haversine_distance(
+    latitude1: float, longitude1: float, latitude2: float, longitude2: float
+) -> float:
+    """Return the great-circle distance between two coordinates in metres."""
+    phi1 = math.radians(latitude1)
+    phi2 = math.radians(latitude2)
+    delta_phi = math.radians(latitude2 - latitude1)
+    delta_lambda = math.radians(longitude2 - longitude1)
+    a = (
+        math.sin(delta_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_METRES * math.asin(math.sqrt(a))
+
 
 async def async_setup_entry(
     hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
@@ -24,23 +44,28 @@ async def async_setup_entry(
 ) -> None:
     """Set up the device_tracker platform."""
     coordinator = entry.runtime_data.coordinator
-    data = coordinator.data or {}
-    vehicles = data.get("data", {}).get("viewer", {}).get("vehicles", [])
-
-    async_add_entities(
-        [
-            VolkswagenGoConnectDeviceTracker(
-                coordinator=coordinator,
-                vehicle=vehicle,
-            )
-            for vehicle in vehicles
-            if vehicle and vehicle.get("vehicle", {}).get("position")
-        ]
+
+    # Vehicles without a position yet are picked up once they report one
+    async_add_vehicle_entities(
+        entry,
+        async_add_entities,
+        lambda vehicle: (
+            [VolkswagenGoConnectDeviceTracker(coordinator=coordinator, vehicle=vehicle)]
+            if vehicle["vehicle"].get("position")
+            else []
+        ),
     )
 
 
 class VolkswagenGoConnectDeviceTracker(VolkswagenGoConnectEntity, TrackerEntity):
-    """Device tracker representing vehicle position."""
+    """
+    Device tracker representing vehicle position.
+
+    While the ignition is off the car is treated as parked: reported positions
+    within the configured movement threshold of the last published position are
+    GPS jitter and do not write state. Any position reported with the ignition
+    on, or further away than the threshold, is published immediately.
+    """
 
     _attr_source_type = SourceType.GPS
     _attr_should_poll = False
@@ -53,6 +78,7 @@ class VolkswagenGoConnectDeviceTracker(VolkswagenGoConnectEntity, TrackerEntity)
         """Initialize the device tracker."""
         super().__init__(coordinator, vehicle)
         self.vehicle_id = vehicle["vehicle"]["id"] if vehicle else None
+        self._published_position: dict[str, Any] | None = None
         if self.vehicle_id:
             plate = getattr(self, "_license_plate", self.vehicle_id)
             self._attr_unique_id = f"vwgc_{plate}_tracker"
@@ -74,26 +100,72 @@ class VolkswagenGoConnectDeviceTracker(VolkswagenGoConnectEntity, TrackerEntity)
                 return vehicle_data
         return None
 
+    def _get_position(self) -> dict[str, Any] | None:
+        """Return the published position, falling back to the latest report."""
+        if self._published_position is not None:
+            return self._published_position
+        vehicle_data = self._get_vehicle_data()
+        position = vehicle_data.get("position") if vehicle_data else None
+        return position if isinstance(position, dict) else None
+
+    def _is_jitter(self, vehicle_data: dict[str, Any] | None) -> bool:
+        """Return True if the reported position is jitter around a parked car."""
+        published = self._published_position
+        position = vehicle_data.get("position") if vehicle_data else None
+        if published is None or not isinstance(position, dict):
+            return False
+
+        ignition = vehicle_data.get("ignition") if vehicle_data else None
+        if isinstance(ignition, dict) and ignition.get("on"):
+            return False
+
+        coordinates = (
+            published.get("latitude"),
+            published.get("longitude"),
+            position.get("latitude"),
+            position.get("longitude"),
+        )
+        if any(value is None for value in coordinates):
+            return False
+
+        min_distance = self.coordinator.config_entry.options.get(
+            CONF_TRACKER_MIN_DISTANCE, DEFAULT_TRACKER_MIN_DISTANCE
+        )
+        return haversine_distance(*coordinates) < min_distance
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """
+        Publish the new position unless it is parked GPS jitter.
+
+        The state is written either way, so availability and the other
+        attributes follow the coordinator; an unchanged state is not recorded.
+        """
+        vehicle_data = self._get_vehicle_data()
+        if not self._is_jitter(vehicle_data):
+            position = vehicle_data.get("position") if vehicle_data else None
+            self._published_position = (
+                dict(position) if isinstance(position, dict) else None
+            )
+        super()._handle_coordinator_update()
+
     @property
     def latitude(self) -> float | None:
         """Return vehicle latitude."""
-        vehicle_data = self._get_vehicle_data()
-        position = vehicle_data.get("position") if vehicle_data else None
-        return position.get("latitude") if isinstance(position, dict) else None
+        position = self._get_position()
+        return position.get("latitude") if position else None
 
     @property
     def longitude(self) -> float | None:
         """Return vehicle longitude."""
-        vehicle_data = self._get_vehicle_data()
-        position = vehicle_data.get("position") if vehicle_data else None
-        return position.get("longitude") if isinstance(position, dict) else None
+        position = self._get_position()
+        return position.get("longitude") if position else None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional attributes for the tracker."""
-        vehicle_data = self._get_vehicle_data()
-        position = vehicle_data.get("position") if vehicle_data else None
-        if not isinstance(position, dict):
+        position = self._get_position()
+        if position is None:
             return None
 
         # Only expose attributes that add value beyond lat/lon
@@ -0,0 +1,47 @@
+"""Diagnostics support for Volkswagen GoConnect."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+
+from .coordinator import vehicle_ids
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+TO_REDACT = {CONF_EMAIL, CONF_PASSWORD, "device_token"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,  # noqa: ARG001
+    entry: ConfigEntry,
+) -> dict[str, Any]:
+    """Return how the client and coordinator of a config entry are doing."""
+    client = entry.runtime_data.client
+    coordinator = entry.runtime_data.coordinator
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "client": {
+            "requests": client.request_count,
+            "coalesced_requests": client.coalesced_count,
+            "timeouts": client.timeouts.as_dict(),
+            "circuit_breaker": {
+                "state": client.breaker.state.value,
+                "failure_rate": round(client.breaker.failure_rate, 2),
+            },
+        },
+        "coordinator": {
+            "vehicles": len(vehicle_ids(coordinator.data)),
+            "stale": coordinator.stale,
+            "data_age_seconds": coordinator.data_age_seconds,
+            "degraded_reason": coordinator.degraded_reason,
+            "missed_deadlines": coordinator.missed_deadlines,
+        },
+    }
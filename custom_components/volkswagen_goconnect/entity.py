@@ -2,12 +2,69 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import ATTRIBUTION, DOMAIN
 from .coordinator import VolkswagenGoConnectDataUpdateCoordinator
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.helpers.entity import Entity
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+
+@callback
+def async_add_vehicle_entities(
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    entity_factory: Callable[[dict], Iterable[Entity]],
+) -> None:
+    """
+    Add entities for every vehicle, now and whenever a new one appears.
+
+    ``entity_factory`` builds the entities for one vehicle entry. A vehicle
+    for which it returns nothing is retried on the next coordinator update.
+    Vehicles that leave the account are forgotten so they are added again if
+    they come back; their devices are removed by the coordinator. A vehicle
+    shared with another account only gets entities from the account owning it.
+    """
+    coordinator = entry.runtime_data.coordinator
+    known_vehicle_ids: set[str] = set()
+
+    @callback
+    def _async_add_new_vehicles() -> None:
+        data = coordinator.data or {}
+        vehicles = [
+            vehicle
+            for vehicle in data.get("data", {}).get("viewer", {}).get("vehicles", [])
+            if vehicle and vehicle.get("vehicle") and vehicle["vehicle"].get("id")
+        ]
+        current_ids = {vehicle["vehicle"]["id"] for vehicle in vehicles}
+        if current_ids:
+            known_vehicle_ids.intersection_update(current_ids)
+
+        entities: list[Entity] = []
+        for vehicle in vehicles:
+            vehicle_id = vehicle["vehicle"]["id"]
+            if vehicle_id in known_vehicle_ids or not coordinator.owns(vehicle_id):
+                continue
+            new_entities = list(entity_factory(vehicle))
+            if new_entities:
+                known_vehicle_ids.add(vehicle_id)
+                entities.extend(new_entities)
+
+        if entities:
+            async_add_entities(entities)
+
+    _async_add_new_vehicles()
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_vehicles))
+
 
 class VolkswagenGoConnectEntity(
     CoordinatorEntity[VolkswagenGoConnectDataUpdateCoordinator]
@@ -21,8 +78,8 @@ class VolkswagenGoConnectEntity(
         coordinator: VolkswagenGoConnectDataUpdateCoordinator,
         vehicle: dict | None = None,
     ) -> None:
-        """Initialize."""
-        super().__init__(coordinator)
+        """Initialize; the entities of a vehicle listen with its id as context."""
+        super().__init__(coordinator, vehicle["vehicle"]["id"] if vehicle else None)
         self.vehicle = vehicle
         if vehicle:
             vehicle_data = vehicle["vehicle"]
@@ -34,6 +91,7 @@ class VolkswagenGoConnectEntity(
                 name=vehicle_data.get("licensePlate") or vehicle_data["id"],
                 manufacturer=vehicle_data.get("make"),
                 model=vehicle_data.get("name"),
+                serial_number=vehicle_data.get("vin"),
             )
         else:
             self._license_plate = None
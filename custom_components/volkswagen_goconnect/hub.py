@@ -2,58 +2,137 @@
 
 from __future__ import annotations
 
-import logging
-from datetime import timedelta
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.core import callback
 
-from .api import VolkswagenGoConnectApiClient
+from .const import DOMAIN
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from datetime import datetime
 
-_LOGGER = logging.getLogger(__name__)
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+    from .coordinator import VolkswagenGoConnectDataUpdateCoordinator
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> VolkswagenGoConnectHub:
+    """Return the hub shared by all config entries, creating it on first use."""
+    return hass.data.setdefault(DOMAIN, VolkswagenGoConnectHub())
 
 
 class VolkswagenGoConnectHub:
-    """A hub to manage the Volkswagen GoConnect integration."""
-
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        *,
-        email: str,
-        password: str,
-        polling_interval: int,
-    ) -> None:
+    """
+    Coordinate the vehicles that several accounts share.
+
+    A car can be listed by a personal and a fleet account at the same time.
+    The hub makes sure such a vehicle is fetched by one account only and hands
+    the result to every other account that lists it. The account that first
+    listed a vehicle owns it and is the only one to create its entities.
+    """
+
+    def __init__(self) -> None:
         """Initialize."""
-        self._hass = hass
-        self._email = email
-        self._password = password
-        self._polling_interval = polling_interval
-
-        self._api_client = VolkswagenGoConnectApiClient(
-            email=self._email,
-            password=self._password,
-            session=async_get_clientsession(hass),
-        )
-
-        self.coordinator = DataUpdateCoordinator(
-            hass,
-            _LOGGER,
-            name=self._email,
-            update_method=self.update,
-            update_interval=timedelta(seconds=self._polling_interval),
-        )
-
-    async def update(self) -> dict[str, Any]:
-        """Update all devices."""
-        # In a real integration, you would fetch data from the API here
-        # For now, we'll just return some dummy data
-        return {"dummy": "data"}
-
-    async def authenticate(self) -> None:
-        """Authenticate with the API."""
-        await self._api_client.login()
+        self._coordinators: dict[str, VolkswagenGoConnectDataUpdateCoordinator] = {}
+        self._listed: dict[str, set[str]] = {}
+        self._owners: dict[str, str] = {}
+        self._snapshots: dict[str, tuple[dict, datetime]] = {}
+
+    @callback
+    def async_register(
+        self, entry_id: str, coordinator: VolkswagenGoConnectDataUpdateCoordinator
+    ) -> CALLBACK_TYPE:
+        """Register the coordinator of a config entry; return its unregister."""
+        self._coordinators[entry_id] = coordinator
+        self._listed.setdefault(entry_id, set())
+
+        @callback
+        def _async_unregister() -> None:
+            self._coordinators.pop(entry_id, None)
+            self.async_update_listing(entry_id, set())
+            self._listed.pop(entry_id, None)
+
+        return _async_unregister
+
+    @callback
+    def async_update_listing(self, entry_id: str, vehicle_ids: set[str]) -> None:
+        """
+        Record which vehicles an account lists.
+
+        Vehicles the owner no longer lists pass to another account listing
+        them, which then adds their entities on its next update.
+        """
+        self._listed[entry_id] = set(vehicle_ids)
+        for vehicle_id in vehicle_ids:
+            self._owners.setdefault(vehicle_id, entry_id)
+        for vehicle_id, owner in list(self._owners.items()):
+            if owner != entry_id or vehicle_id in vehicle_ids:
+                continue
+            listers = self._listers(vehicle_id)
+            if listers:
+                self._owners[vehicle_id] = listers[0]
+            else:
+                del self._owners[vehicle_id]
+                self._snapshots.pop(vehicle_id, None)
+
+    def owner(self, vehicle_id: str) -> str | None:
+        """Return the config entry that creates the entities of a vehicle."""
+        return self._owners.get(vehicle_id)
+
+    def fetcher(self, vehicle_id: str, entry_id: str, now: datetime) -> str:
+        """
+        Return the config entry that should fetch a vehicle listed by ``entry_id``.
+
+        The owner fetches while it has request budget to spare; otherwise the
+        first other account with budget left does.
+        """
+        listers = self._listers(vehicle_id)
+        if entry_id not in listers:
+            listers.append(entry_id)
+        if len(listers) == 1:
+            return entry_id
+        owner = self._owners.get(vehicle_id, entry_id)
+        candidates = [owner, *(lister for lister in listers if lister != owner)]
+        for candidate in candidates:
+            coordinator = self._coordinators.get(candidate)
+            if coordinator is not None and not coordinator.budget.economy(now):
+                return candidate
+        return owner if owner in self._coordinators else entry_id
+
+    def snapshot(self, vehicle_id: str) -> tuple[dict, datetime] | None:
+        """Return the latest shared data of a vehicle and when it was fetched."""
+        return self._snapshots.get(vehicle_id)
+
+    @callback
+    def async_publish(
+        self, entry_id: str, vehicles: dict[str, dict], fetched_at: datetime
+    ) -> None:
+        """Store freshly fetched vehicles and hand them to the other accounts."""
+        for vehicle_id, vehicle in vehicles.items():
+            self._snapshots[vehicle_id] = (vehicle, fetched_at)
+        shared = {
+            vehicle_id: vehicle
+            for vehicle_id, vehicle in vehicles.items()
+            if len(self._listers(vehicle_id)) > 1
+        }
+        if not shared:
+            return
+        for other_id, coordinator in self._coordinators.items():
+            if other_id == entry_id:
+                continue
+            received = {
+                vehicle_id: vehicle
+                for vehicle_id, vehicle in shared.items()
+                if vehicle_id in self._listed.get(other_id, ())
+            }
+            if received:
+                coordinator.async_receive_shared_vehicles(received, fetched_at)
+
+    def _listers(self, vehicle_id: str) -> list[str]:
+        """Return the registered config entries listing a vehicle."""
+        return [
+            entry_id
+            for entry_id, vehicle_ids in self._listed.items()
+            if vehicle_id in vehicle_ids and entry_id in self._coordinators
+        ]
@@ -0,0 +1,138 @@
+"""Request timeouts adapted to the observed latency of each API operation."""
+
+from __future__ import annotations
+
+import math
+from bisect import insort
+
+# Timeout used until an operation has enough latency samples
+DEFAULT_TIMEOUT_SECONDS = 10.0
+# Timeouts are this multiple of the latency quantile, within the bounds below
+TIMEOUT_QUANTILE = 0.99
+TIMEOUT_FACTOR = 3.0
+MIN_TIMEOUT_SECONDS = 2.0
+MAX_TIMEOUT_SECONDS = 30.0
+# Samples needed before an operation gets an adaptive timeout
+MIN_SAMPLES = 20
+
+
+class P2Quantile:
+    """
+    Estimate a quantile of a stream without storing it (the P² algorithm).
+
+    Five markers track the minimum, the maximum, the quantile and two points
+    halfway to it; their heights are adjusted with a piecewise-parabolic
+    formula as observations arrive. Memory and time per observation are
+    constant.
+    """
+
+    def __init__(self, quantile: float) -> None:
+        """Initialize the estimator for a quantile between 0 and 1."""
+        self.quantile = quantile
+        self.count = 0
+        self._heights: list[float] = []
+        self._positions = [1.0, 2.0, 3.0, 4.0, 5.0]
+        self._desired = [
+            1.0,
+            1 + 2 * quantile,
+            1 + 4 * quantile,
+            3 + 2 * quantile,
+            5.0,
+        ]
+        self._increments = [0.0, quantile / 2, quantile, (1 + quantile) / 2, 1.0]
+
+    @property
+    def value(self) -> float | None:
+        """Return the current estimate, or None before any observation."""
+        if not self._heights:
+            return None
+        if self.count < len(self._positions):
+            index = round(self.quantile * (len(self._heights) - 1))
+            return self._heights[index]
+        return self._heights[2]
+
+    def observe(self, value: float) -> None:
+        """Add an observation."""
+        self.count += 1
+        heights = self._heights
+        if self.count <= len(self._positions):
+            insort(heights, value)
+            return
+
+        positions = self._positions
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = next(i for i in range(4) if heights[i] <= value < heights[i + 1])
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in (1, 2, 3):
+            offset = self._desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or (
+                offset <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                step = int(math.copysign(1, offset))
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self._linear(i, step)
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        heights = self._heights
+        positions = self._positions
+        return heights[i] + step / (positions[i + 1] - positions[i - 1]) * (
+            (positions[i] - positions[i - 1] + step)
+            * (heights[i + 1] - heights[i])
+            / (positions[i + 1] - positions[i])
+            + (positions[i + 1] - positions[i] - step)
+            * (heights[i] - heights[i - 1])
+            / (positions[i] - positions[i - 1])
+        )
+
+    def _linear(self, i: int, step: int) -> float:
+        heights = self._heights
+        positions = self._positions
+        return heights[i] + step * (heights[i + step] - heights[i]) / (
+            positions[i + step] - positions[i]
+        )
+
+
+class AdaptiveTimeouts:
+    """Derive a timeout per API operation from its latency distribution."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._latencies: dict[str, P2Quantile] = {}
+
+    def timeout(self, operation: str) -> float:
+        """Return the timeout of the next request of an operation."""
+        latency = self._latencies.get(operation)
+        if latency is None or latency.count < MIN_SAMPLES or latency.value is None:
+            return DEFAULT_TIMEOUT_SECONDS
+        return min(
+            max(latency.value * TIMEOUT_FACTOR, MIN_TIMEOUT_SECONDS),
+            MAX_TIMEOUT_SECONDS,
+        )
+
+    def observe(self, operation: str, seconds: float) -> None:
+        """
+        Record how long a request of an operation took.
+
+        Timed-out requests are recorded with their timeout, so a slowing API
+        raises the timeout instead of timing out forever.
+        """
+        if (latency := self._latencies.get(operation)) is None:
+            latency = self._latencies[operation] = P2Quantile(TIMEOUT_QUANTILE)
+        latency.observe(seconds)
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the current timeout of every operation seen so far."""
+        return {operation: self.timeout(operation) for operation in self._latencies}
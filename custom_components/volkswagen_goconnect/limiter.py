@@ -0,0 +1,151 @@
+"""Request limiter shared by all accounts that talk to the same host."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from enum import IntEnum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+# Minimum spacing between two requests to the same host, across all accounts
+MIN_REQUEST_INTERVAL_SECONDS = 0.2
+# Throttled responses remembered per host
+THROTTLE_HISTORY = 32
+
+_LIMITERS: dict[str, RequestLimiter] = {}
+
+
+class Priority(IntEnum):
+    """Priority of a request; waiting requests of lower values go first."""
+
+    # Refreshes the user asked for
+    INTERACTIVE = 0
+    # Vehicle list and live vehicle state
+    TELEMETRY = 1
+    # Background work that can wait, such as pre-warming connections
+    ANALYTICS = 2
+
+
+def get_limiter(host: str) -> RequestLimiter:
+    """Return the process-wide limiter of a host, creating it on first use."""
+    if (limiter := _LIMITERS.get(host)) is None:
+        limiter = _LIMITERS[host] = RequestLimiter()
+    return limiter
+
+
+class RequestLimiter:
+    """
+    Space the requests to one host and share the slots fairly between accounts.
+
+    Every free slot goes to a waiting request of the highest priority, so an
+    interactive refresh waits at most one slot whatever the background load.
+    Within a priority every account has its own queue of waiting requests,
+    and slots are handed out round-robin, one request per account, so a large
+    fleet polled by one account cannot starve the others.
+    """
+
+    def __init__(self, min_interval: float = MIN_REQUEST_INTERVAL_SECONDS) -> None:
+        """Initialize the limiter."""
+        self.min_interval = min_interval
+        self._queues: dict[Priority, dict[Hashable, deque[asyncio.Future[None]]]] = {
+            priority: {} for priority in Priority
+        }
+        self._turns: dict[Priority, deque[Hashable]] = {
+            priority: deque() for priority in Priority
+        }
+        self._last_grant: float | None = None
+        self._handle: asyncio.TimerHandle | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._throttled: deque[float] = deque(maxlen=THROTTLE_HISTORY)
+
+    @property
+    def waiting(self) -> int:
+        """Return the number of requests waiting for a slot."""
+        return sum(
+            len(queue) for queues in self._queues.values() for queue in queues.values()
+        )
+
+    def record_throttled(self) -> None:
+        """Record that the host throttled a request (HTTP 429 or 503)."""
+        self._throttled.append(time.monotonic())
+
+    def throttled(self, window: float) -> int:
+        """Return how many requests the host throttled in the last ``window`` s."""
+        since = time.monotonic() - window
+        return sum(1 for throttled_at in self._throttled if throttled_at >= since)
+
+    async def acquire(
+        self, account: Hashable, priority: Priority = Priority.TELEMETRY
+    ) -> None:
+        """Wait until the account may send its next request."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # A new event loop (e.g. after a restart in tests) starts afresh
+            self._reset(loop)
+
+        now = loop.time()
+        if self._handle is None and (
+            self._last_grant is None or now - self._last_grant >= self.min_interval
+        ):
+            self._last_grant = now
+            return
+
+        waiter: asyncio.Future[None] = loop.create_future()
+        queues = self._queues[priority]
+        if account not in queues:
+            queues[account] = deque()
+            self._turns[priority].append(account)
+        queues[account].append(waiter)
+        if self._handle is None:
+            self._schedule()
+        await waiter
+
+    def _schedule(self) -> None:
+        """Wake up when the next slot becomes free."""
+        loop = asyncio.get_running_loop()
+        last = self._last_grant if self._last_grant is not None else loop.time()
+        self._handle = loop.call_at(last + self.min_interval, self._grant)
+
+    def _grant(self) -> None:
+        """Hand the free slot to the account whose turn it is."""
+        self._handle = None
+        for priority in Priority:
+            if self._grant_turn(priority):
+                break
+        if any(self._turns.values()):
+            self._schedule()
+
+    def _grant_turn(self, priority: Priority) -> bool:
+        """Hand the free slot to a request of a priority; return if one got it."""
+        turns = self._turns[priority]
+        queues = self._queues[priority]
+        while turns:
+            account = turns.popleft()
+            queue = queues[account]
+            waiter = queue.popleft()
+            if queue:
+                turns.append(account)
+            else:
+                del queues[account]
+            if waiter.done():
+                # Cancelled while waiting; give the slot to the next request
+                continue
+            waiter.set_result(None)
+            self._last_grant = asyncio.get_running_loop().time()
+            return True
+        return False
+
+    def _reset(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+        for queues in self._queues.values():
+            queues.clear()
+        for turns in self._turns.values():
+            turns.clear()
+        self._last_grant = None
+        self._handle = None
+        self._loop = loop
@@ -0,0 +1,503 @@
+"""Per-vehicle poll scheduling for volkswagen_goconnect."""
+
+from __future__ import annotations
+
+import random
+import statistics
+from collections import deque
+from datetime import UTC, datetime, time, timedelta
+from itertools import pairwise
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Poll interval of a vehicle with the ignition on
+DRIVING_INTERVAL = timedelta(seconds=30)
+# Poll interval of a charging vehicle far from 80 percent
+CHARGING_INTERVAL = timedelta(minutes=5)
+# Poll interval of a parked vehicle
+PARKED_INTERVAL = timedelta(minutes=15)
+# Shortest time between two wake-ups of the coordinator
+MIN_WAKEUP_INTERVAL = timedelta(seconds=15)
+# Vehicles due within this window are polled with the current wake-up
+DUE_SLACK = timedelta(seconds=5)
+# Telemetry objects whose time shows when the backend last updated a vehicle
+TELEMETRY_KEYS = (
+    "odometer",
+    "fuelLevel",
+    "fuelPercentage",
+    "chargePercentage",
+    "ignition",
+    "rangeTotalKm",
+)
+# Number of upstream update times kept to estimate the update period
+CADENCE_HISTORY = 8
+# Gaps between upstream updates outside this range are not a period estimate
+MIN_UPSTREAM_PERIOD = timedelta(seconds=10)
+MAX_UPSTREAM_PERIOD = timedelta(minutes=30)
+# Delay after an expected upstream update before polling for it
+PHASE_MARGIN = timedelta(seconds=10)
+# Most vehicles fetched in one poll; the others roll over to the next one
+MAX_VEHICLES_PER_POLL = 25
+# Requests needed to fetch one vehicle (details and system overview)
+REQUESTS_PER_VEHICLE = 2
+# Driving or charging vehicles are fetched as if their deadline was this early
+ACTIVE_PRIORITY_BOOST = timedelta(seconds=10)
+# A vehicle fetched later than this after its deadline missed the deadline
+MISSED_DEADLINE_GRACE = timedelta(seconds=30)
+# Minimum poll interval of a fleet vehicle outside its fleet's work days
+OFF_HOURS_INTERVAL = timedelta(hours=2)
+# Recheck interval of a vehicle snoozed without a known end
+SNOOZE_RECHECK_INTERVAL = timedelta(hours=1)
+WEEKDAY_NAMES = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+# Length of the windows a request budget can be set for
+BUDGET_PERIODS = {"hour": timedelta(hours=1), "day": timedelta(days=1)}
+# Share of a budget window used to extrapolate the request rate at its start
+BUDGET_MIN_ELAPSED = 1 / 12
+# Low-value fields are skipped once less than this share of the budget is left
+BUDGET_ECONOMY_SHARE = 0.25
+# Longest interval polls back off to while the API keeps failing
+MAX_OUTAGE_INTERVAL = timedelta(minutes=30)
+
+
+def is_active(vehicle: dict[str, Any]) -> bool:
+    """Return True if a vehicle is driving or charging."""
+    return bool((vehicle.get("ignition") or {}).get("on") or vehicle.get("isCharging"))
+
+
+def vehicle_poll_interval(vehicle: dict[str, Any], base: timedelta) -> timedelta:
+    """
+    Return how long to wait before polling a vehicle again.
+
+    The configured polling interval is the upper bound while driving and the
+    lower bound otherwise. A charging vehicle is polled more often as the time
+    until 80 percent (in minutes) runs out.
+    """
+    driving = min(base, DRIVING_INTERVAL)
+    if (vehicle.get("ignition") or {}).get("on"):
+        return driving
+
+    if vehicle.get("isCharging"):
+        interval = max(base, CHARGING_INTERVAL)
+        remaining = (vehicle.get("chargingStatus") or {}).get(
+            "timeUntil80PercentCharge"
+        )
+        if isinstance(remaining, (int, float)) and remaining >= 0:
+            interval = min(interval, timedelta(minutes=remaining) / 4)
+        return max(interval, driving)
+
+    return max(base, PARKED_INTERVAL)
+
+
+def _parse_datetime(value: Any) -> datetime | None:
+    """Return an ISO 8601 timestamp as a datetime, or None if it is not one."""
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def telemetry_time(vehicle: dict[str, Any]) -> datetime | None:
+    """Return when the backend last updated the telemetry of a vehicle."""
+    times = [
+        parsed
+        for key in TELEMETRY_KEYS
+        if (parsed := _parse_datetime((vehicle.get(key) or {}).get("time")))
+    ]
+    return max(times, default=None)
+
+
+def _weekday(day: Any) -> int | None:
+    """Return the weekday (Monday is 0) of a work hours day name or ISO number."""
+    if isinstance(day, int) and 0 <= day <= 7:  # noqa: PLR2004
+        return (day - 1) % 7
+    if isinstance(day, str) and day[:3].lower() in WEEKDAY_NAMES:
+        return WEEKDAY_NAMES.index(day[:3].lower())
+    return None
+
+
+def outside_work_hours(vehicle: dict[str, Any], now: datetime) -> bool:
+    """
+    Return True if a fleet vehicle is outside its fleet's work hours.
+
+    Work hours are days of the week in ``now``'s time zone. Vehicles without
+    a fleet or work hours are never outside them.
+    """
+    work_hours = (vehicle.get("primaryFleet") or {}).get("workHours") or []
+    days = {
+        weekday
+        for entry in work_hours
+        if isinstance(entry, dict)
+        and (weekday := _weekday(entry.get("day"))) is not None
+    }
+    return bool(days) and now.weekday() not in days
+
+
+def snoozed_until(vehicle: dict[str, Any], now: datetime) -> datetime | None:
+    """
+    Return until when a vehicle is snoozed, or None if it is not.
+
+    A snooze flagged active without a known end is rechecked periodically.
+    """
+    ends = []
+    for snooze in vehicle.get("snoozes") or []:
+        if not isinstance(snooze, dict):
+            continue
+        start = _parse_datetime(snooze.get("start"))
+        end = _parse_datetime(snooze.get("end"))
+        if end is not None and end <= now:
+            continue
+        if snooze.get("active") or (start is not None and start <= now):
+            ends.append(end or now + SNOOZE_RECHECK_INTERVAL)
+    return max(ends, default=None)
+
+
+def stagger_offset(position: int, count: int, interval: timedelta) -> timedelta:
+    """
+    Return the start offset of one of ``count`` accounts.
+
+    The offsets spread the first polls of all accounts evenly over one
+    interval, so accounts started together do not poll in the same second.
+    """
+    if count <= 1:
+        return timedelta(0)
+    return interval * (position % count) / count
+
+
+def jittered(interval: timedelta, jitter: timedelta) -> timedelta:
+    """Return an interval lengthened by a random share of ``jitter``."""
+    if jitter <= timedelta(0):
+        return interval
+    return interval + jitter * random.random()  # noqa: S311
+
+
+def outage_backoff(interval: timedelta, failures: int) -> timedelta:
+    """
+    Return the interval to the next poll after ``failures`` failed polls in a row.
+
+    The interval doubles with every failure up to ``MAX_OUTAGE_INTERVAL``, or
+    the normal interval if that is longer.
+    """
+    if failures <= 0:
+        return interval
+    return max(interval, min(interval * 2 ** min(failures, 16), MAX_OUTAGE_INTERVAL))
+
+
+def in_quiet_hours(quiet_hours: tuple[time, time] | None, now: datetime) -> bool:
+    """Return True if ``now`` falls in the quiet hours, which may span midnight."""
+    if quiet_hours is None:
+        return False
+    start, end = quiet_hours
+    moment = now.time().replace(tzinfo=None)
+    if start <= end:
+        return start <= moment < end
+    return moment >= start or moment < end
+
+
+def quiet_hours_end(quiet_hours: tuple[time, time], now: datetime) -> datetime:
+    """Return when the quiet hours that ``now`` falls in end."""
+    end = datetime.combine(now.date(), quiet_hours[1], tzinfo=now.tzinfo)
+    return end if end > now else end + timedelta(days=1)
+
+
+class UpstreamCadence:
+    """Estimate the period and phase of the upstream updates of a vehicle."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._updates: deque[datetime] = deque(maxlen=CADENCE_HISTORY)
+
+    @property
+    def last_update(self) -> datetime | None:
+        """Return the latest upstream update seen."""
+        return self._updates[-1] if self._updates else None
+
+    @property
+    def period(self) -> timedelta | None:
+        """Return the median gap between upstream updates, if known."""
+        gaps = [
+            gap
+            for earlier, later in pairwise(self._updates)
+            if MIN_UPSTREAM_PERIOD <= (gap := later - earlier) <= MAX_UPSTREAM_PERIOD
+        ]
+        if len(gaps) < 2:  # noqa: PLR2004
+            return None
+        return statistics.median_low(gaps)
+
+    def observe(self, update: datetime) -> None:
+        """Record an upstream update time; repeated times are ignored."""
+        if self._updates and update <= self._updates[-1]:
+            return
+        self._updates.append(update)
+
+    def phase_lock(self, now: datetime, target: datetime) -> datetime:
+        """
+        Move a poll planned for ``target`` to just after an upstream update.
+
+        The poll is moved to the last expected update before the target, or to
+        the first one after it when no update is expected in between. While an
+        expected update is overdue the target is kept, so a late or changed
+        cadence cannot delay polls by a full period.
+        """
+        period = self.period
+        last_update = self.last_update
+        if period is None or last_update is None:
+            return target
+        if now - last_update >= period + PHASE_MARGIN:
+            return target
+
+        first = last_update + period + PHASE_MARGIN
+        if first >= target:
+            return first
+        return first + ((target - first) // period) * period
+
+
+class PollScheduler:
+    """
+    Track when each vehicle of an account is due for its next poll.
+
+    Times passed in are expected in the local time zone, which work hours and
+    quiet hours refer to.
+    """
+
+    def __init__(self, base_interval: timedelta) -> None:
+        """Initialize."""
+        self.base_interval = base_interval
+        self.quiet_hours: tuple[time, time] | None = None
+        self._next_poll: dict[str, datetime] = {}
+        self._cadences: dict[str, UpstreamCadence] = {}
+        self._active: dict[str, bool] = {}
+        self._watched: dict[str, bool] = {}
+        self._fetched_at: dict[str, datetime] = {}
+        self.missed_deadlines = 0
+
+    def next_poll(self, vehicle_id: str) -> datetime | None:
+        """Return when a vehicle is due, or None if it was never polled."""
+        return self._next_poll.get(vehicle_id)
+
+    def quiet(self, now: datetime) -> bool:
+        """Return True if polling is paused for the quiet hours."""
+        return in_quiet_hours(self.quiet_hours, now)
+
+    def watched(self, vehicle_id: str) -> bool:
+        """Return True if a vehicle's state changes should trigger a poll."""
+        return self._watched.get(vehicle_id, True)
+
+    def due(self, vehicle_ids: Iterable[str], now: datetime) -> set[str]:
+        """Return the vehicles to poll now; unknown vehicles are always due."""
+        if self.quiet(now):
+            return set()
+        return {
+            vehicle_id
+            for vehicle_id in vehicle_ids
+            if (next_poll := self._next_poll.get(vehicle_id)) is None
+            or next_poll <= now + DUE_SLACK
+        }
+
+    def select(
+        self, vehicle_ids: Iterable[str], now: datetime, capacity: int
+    ) -> list[str]:
+        """
+        Return up to ``capacity`` due vehicles, earliest deadline first.
+
+        Vehicles never fetched come first, and driving or charging vehicles
+        are boosted ahead of parked ones with a similar deadline. Vehicles
+        left out stay due and are picked up by the next poll.
+        """
+        return sorted(self.due(vehicle_ids, now), key=self._deadline)[:capacity]
+
+    def _deadline(self, vehicle_id: str) -> tuple[datetime, str]:
+        """Return the effective deadline of a vehicle, ties broken by id."""
+        next_poll = self._next_poll.get(vehicle_id)
+        if next_poll is None:
+            next_poll = datetime.min.replace(tzinfo=UTC)
+        elif self._active.get(vehicle_id):
+            next_poll -= ACTIVE_PRIORITY_BOOST
+        return next_poll, vehicle_id
+
+    def data_age(self, vehicle_id: str, now: datetime) -> timedelta | None:
+        """Return how long ago a vehicle was last fetched."""
+        fetched_at = self._fetched_at.get(vehicle_id)
+        return now - fetched_at if fetched_at else None
+
+    def upstream_period(self, vehicle_id: str) -> timedelta | None:
+        """Return the estimated upstream update period of a vehicle."""
+        cadence = self._cadences.get(vehicle_id)
+        return cadence.period if cadence else None
+
+    def record(self, vehicle_id: str, vehicle: dict[str, Any], now: datetime) -> None:
+        """
+        Schedule the next poll of a vehicle that was just fetched.
+
+        The poll is phase-locked to the upstream update cadence estimated from
+        the telemetry times. The estimate restarts whenever the vehicle starts
+        or stops driving or charging, as the backend cadence changes with it.
+        Fleet vehicles are polled slowly outside their work hours and not at
+        all while snoozed. A fetch well after the vehicle's deadline counts as
+        a missed deadline, unless the deadline fell in the quiet hours.
+        """
+        deadline = self._next_poll.get(vehicle_id)
+        if (
+            deadline is not None
+            and now - deadline > MISSED_DEADLINE_GRACE
+            and not in_quiet_hours(self.quiet_hours, deadline)
+        ):
+            self.missed_deadlines += 1
+        self._fetched_at[vehicle_id] = now
+
+        active = is_active(vehicle)
+        if self._active.get(vehicle_id) != active:
+            self._cadences[vehicle_id] = UpstreamCadence()
+        self._active[vehicle_id] = active
+        cadence = self._cadences[vehicle_id]
+        if (update := telemetry_time(vehicle)) is not None:
+            cadence.observe(update)
+
+        interval = vehicle_poll_interval(vehicle, self.base_interval)
+        off_hours = outside_work_hours(vehicle, now)
+        if off_hours:
+            interval = max(interval, OFF_HOURS_INTERVAL)
+        next_poll = cadence.phase_lock(now, now + interval)
+
+        snoozed = snoozed_until(vehicle, now)
+        if snoozed is not None:
+            next_poll = max(next_poll, snoozed)
+        self._next_poll[vehicle_id] = next_poll
+        self._watched[vehicle_id] = not off_hours and snoozed is None
+
+    def next_wakeup(self, now: datetime) -> timedelta:
+        """
+        Return the delay until the earliest vehicle is due.
+
+        While any vehicle is watched for state changes the delay never exceeds
+        the base interval, so the cheap vehicle list is still fetched often
+        enough to notice a parked vehicle waking up. Nothing is polled during
+        the quiet hours.
+        """
+        if not self._next_poll:
+            delay = self.base_interval
+        else:
+            delay = min(self._next_poll.values()) - now
+            if any(self._watched.values()):
+                delay = min(delay, self.base_interval)
+        if self.quiet(now) and self.quiet_hours is not None:
+            delay = max(delay, quiet_hours_end(self.quiet_hours, now) - now)
+        return max(delay, MIN_WAKEUP_INTERVAL)
+
+    def retain(self, vehicle_ids: Iterable[str]) -> None:
+        """Forget the vehicles that are no longer on the account."""
+        keep = set(vehicle_ids)
+        for state in (
+            self._next_poll,
+            self._cadences,
+            self._active,
+            self._watched,
+            self._fetched_at,
+        ):
+            for vehicle_id in state.keys() - keep:
+                del state[vehicle_id]
+
+    def reset(self) -> None:
+        """Make every vehicle due on the next wake-up."""
+        self._next_poll.clear()
+
+
+class RequestBudget:
+    """
+    Track the API requests of an account against a per-hour or per-day budget.
+
+    Windows start on the hour or at midnight of the ``now`` passed in. A limit
+    of 0 only counts requests.
+    """
+
+    def __init__(self, limit: int = 0, period: str = "day") -> None:
+        """Initialize."""
+        self.limit = limit
+        self.period = period
+        self.used = 0
+        self.window_start: datetime | None = None
+        self._total: int | None = None
+
+    @property
+    def window(self) -> timedelta:
+        """Return the length of a budget window."""
+        return BUDGET_PERIODS[self.period]
+
+    def configure(self, limit: int, period: str) -> None:
+        """Change the limit or period; a new period restarts the window."""
+        if period != self.period:
+            self.window_start = None
+        self.limit = limit
+        self.period = period
+
+    def record(self, total: int, now: datetime) -> None:
+        """Count the requests made since the last call from a running total."""
+        self._roll(now)
+        if self._total is not None:
+            self.used += max(total - self._total, 0)
+        self._total = total
+
+    def _roll(self, now: datetime) -> None:
+        """Start a new window once the current one has ended."""
+        if self.window_start is not None and now < self.window_start + self.window:
+            return
+        if self.period == "hour":
+            self.window_start = now.replace(minute=0, second=0, microsecond=0)
+        else:
+            self.window_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        self.used = 0
+
+    def _projected_use(self, now: datetime) -> float:
+        """Return the requests the window will see at the current rate."""
+        if self.window_start is None:
+            return 0.0
+        elapsed = max(now - self.window_start, self.window * BUDGET_MIN_ELAPSED)
+        return self.used * (self.window / elapsed)
+
+    def exhausted(self) -> bool:
+        """Return True if no requests are left in this window."""
+        return bool(self.limit) and self.used >= self.limit
+
+    def projected_exhaustion(self, now: datetime) -> datetime | None:
+        """Return when the budget runs out at the current rate, if this window."""
+        if not self.limit or self.window_start is None or not self.used:
+            return None
+        if self.exhausted():
+            return now
+        window_end = self.window_start + self.window
+        rate = self._projected_use(now) / self.window.total_seconds()
+        exhaustion = now + timedelta(seconds=(self.limit - self.used) / rate)
+        return exhaustion if exhaustion < window_end else None
+
+    def affordable(self, count: int, cost: int) -> int:
+        """Return how many of ``count`` items of ``cost`` requests still fit."""
+        if not self.limit:
+            return count
+        # Keep one request for the vehicle list of the poll
+        return max(min(count, (self.limit - self.used - 1) // cost), 0)
+
+    def economy(self, now: datetime) -> bool:
+        """Return True if low-value fields should be skipped to save budget."""
+        if not self.limit:
+            return False
+        return (
+            self.limit - self.used < self.limit * BUDGET_ECONOMY_SHARE
+            or self._projected_use(now) > self.limit
+        )
+
+    def stretch(self, interval: timedelta, now: datetime) -> timedelta:
+        """
+        Stretch a poll interval so the budget lasts until the window ends.
+
+        The interval grows by the factor the projected use exceeds the limit;
+        once the budget is spent, polling waits for the next window.
+        """
+        if not self.limit or self.window_start is None:
+            return interval
+        window_end = self.window_start + self.window
+        if self.exhausted():
+            return max(interval, window_end - now)
+        return interval * max(1.0, self._projected_use(now) / self.limit)
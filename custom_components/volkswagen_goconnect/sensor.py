@@ -4,9 +4,15 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, ClassVar
 
-from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+)
+from homeassistant.const import EntityCategory
+from homeassistant.util import dt as dt_util
 
-from .entity import VolkswagenGoConnectEntity
+from .entity import VolkswagenGoConnectEntity, async_add_vehicle_entities
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -23,6 +29,7 @@ ENTITY_DESCRIPTIONS = (
         key="id",
         name="Vehicle ID",
         icon="mdi:identifier",
+        entity_category=EntityCategory.DIAGNOSTIC,
     ),
     SensorEntityDescription(
         key="fuelType",
@@ -38,21 +45,25 @@ ENTITY_DESCRIPTIONS = (
         key="make",
         name="Make",
         icon="mdi:car",
+        entity_category=EntityCategory.DIAGNOSTIC,
     ),
     SensorEntityDescription(
         key="model",
         name="Model",
         icon="mdi:car-side",
+        entity_category=EntityCategory.DIAGNOSTIC,
     ),
     SensorEntityDescription(
         key="year",
         name="Year",
         icon="mdi:calendar",
+        entity_category=EntityCategory.DIAGNOSTIC,
     ),
     SensorEntityDescription(
         key="vin",
         name="VIN",
         icon="mdi:identifier",
+        entity_category=EntityCategory.DIAGNOSTIC,
     ),
     SensorEntityDescription(
         key="odometer",
@@ -116,6 +127,95 @@ ENTITY_DESCRIPTIONS = (
         name="Brand Contact Info",
         icon="mdi:phone",
     ),
+    SensorEntityDescription(
+        key="data_age",
+        name="Data Age",
+        icon="mdi:clock-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement="s",
+        state_class="measurement",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+)
+
+# Sensors of the account rather than of a vehicle
+ACCOUNT_ENTITY_DESCRIPTIONS = (
+    SensorEntityDescription(
+        key="request_budget_used",
+        name="API Requests Used",
+        icon="mdi:counter",
+        native_unit_of_measurement="requests",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="request_budget_exhaustion",
+        name="API Budget Exhaustion",
+        icon="mdi:timer-sand-empty",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="missed_deadlines",
+        name="Missed Poll Deadlines",
+        icon="mdi:clock-alert-outline",
+        state_class="total_increasing",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
+
+WEEKDAYS = (
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+)
+
+# Bulky workshop and brand contact details, excluded from the recorder but kept
+# in the state machine. Short identifying attributes are still recorded.
+WORKSHOP_UNRECORDED_ATTRIBUTES = frozenset(
+    {
+        "address",
+        "zip",
+        "city",
+        "phone",
+        "emergency_contact_phone",
+        "mobile_booking_url",
+        "timezone_offset",
+        *(f"opening_hours_{day}_{edge}" for day in WEEKDAYS for edge in ("from", "to")),
+    }
+)
+BRAND_CONTACT_UNRECORDED_ATTRIBUTES = frozenset(
+    {
+        "webshop_url",
+        "roadside_assistance_phone",
+        "roadside_assistance_url",
+        "roadside_emergency_assistance_url",
+    }
+)
+
+# Sensors added for every vehicle regardless of fuel type
+BASE_SENSORS = frozenset(
+    {
+        "id",
+        "fuelType",
+        "licensePlate",
+        "make",
+        "model",
+        "year",
+        "vin",
+        "odometer",
+        "ignition",
+        "rangeTotalKm",
+        "chargingStatus",
+        "highVoltageBatteryUsableCapacityKwh",
+        "workshop",
+        "brandContactInfo",
+        "data_age",
+    }
 )
 
 
@@ -126,70 +226,35 @@ async def async_setup_entry(
 ) -> None:
     """Set up the sensor platform."""
     coordinator = entry.runtime_data.coordinator
-    data = coordinator.data or {}
-    vehicles = data.get("data", {}).get("viewer", {}).get("vehicles", [])
-
-    entities = []
-    for vehicle in vehicles:
-        if not vehicle or not vehicle.get("vehicle"):
-            continue
 
+    def _vehicle_entities(vehicle: dict) -> list[VolkswagenGoConnectSensor]:
         vehicle_data = vehicle["vehicle"]
-        fuel_type = vehicle_data.get("fuelType", "").lower()
-        is_electric = fuel_type == "electric"
-
-        # Always add these sensors
-        base_sensors = {
-            "id",
-            "fuelType",
-            "licensePlate",
-            "make",
-            "model",
-            "year",
-            "vin",
-            "odometer",
-            "ignition",
-            "rangeTotalKm",
-            "chargingStatus",
-            "highVoltageBatteryUsableCapacityKwh",
-            "workshop",
-            "brandContactInfo",
-        }
+        fuel_type = (vehicle_data.get("fuelType") or "").lower()
+
+        # Add fuel/charge sensors based on fuel type
+        if fuel_type == "electric":
+            keys = BASE_SENSORS | {"chargePercentage"}
+        else:
+            keys = BASE_SENSORS | {"fuelPercentage", "fuelLevel"}
 
-        entities.extend(
-            VolkswagenGoConnectSensor(
+        return [
+            SENSOR_CLASSES.get(desc.key, VolkswagenGoConnectSensor)(
                 coordinator=coordinator,
                 entity_description=desc,
                 vehicle=vehicle,
             )
             for desc in ENTITY_DESCRIPTIONS
-            if desc.key in base_sensors
-        )
-
-        # Add fuel/charge sensors based on fuel type
-        if is_electric:
-            entities.extend(
-                VolkswagenGoConnectSensor(
-                    coordinator=coordinator,
-                    entity_description=desc,
-                    vehicle=vehicle,
-                )
-                for desc in ENTITY_DESCRIPTIONS
-                if desc.key == "chargePercentage"
-            )
-        else:
-            # For non-electric vehicles, add fuel percentage and level
-            entities.extend(
-                VolkswagenGoConnectSensor(
-                    coordinator=coordinator,
-                    entity_description=desc,
-                    vehicle=vehicle,
-                )
-                for desc in ENTITY_DESCRIPTIONS
-                if desc.key in {"fuelPercentage", "fuelLevel"}
-            )
+            if desc.key in keys
+        ]
 
-    async_add_entities(entities)
+    async_add_entities(
+        VolkswagenGoConnectAccountSensor(
+            coordinator=coordinator,
+            entity_description=entity_description,
+        )
+        for entity_description in ACCOUNT_ENTITY_DESCRIPTIONS
+    )
+    async_add_vehicle_entities(entry, async_add_entities, _vehicle_entities)
 
 
 class VolkswagenGoConnectSensor(VolkswagenGoConnectEntity, SensorEntity):
@@ -235,6 +300,9 @@ class VolkswagenGoConnectSensor(VolkswagenGoConnectEntity, SensorEntity):
         if not self.vehicle_id:
             return self.coordinator.data.get("body")
 
+        if self.entity_description.key == "data_age":
+            return self.coordinator.vehicle_data_age(self.vehicle_id)
+
         data = self.coordinator.data or {}
         vehicles = data.get("data", {}).get("viewer", {}).get("vehicles", [])
 
@@ -303,6 +371,12 @@ class VolkswagenGoConnectSensor(VolkswagenGoConnectEntity, SensorEntity):
         """Return extra state attributes."""
         key = self.entity_description.key
 
+        if key == "data_age":
+            # Age of the whole snapshot while it is served after failed polls;
+            # only here, as it changes on every poll
+            age = self.coordinator.data_age_seconds
+            return {"data_age_seconds": age} if age is not None else None
+
         if key == "workshop":
             data = self._get_vehicle_data_field("workshop", "_workshop_data")
             if not data or not isinstance(data, dict):
@@ -377,3 +451,66 @@ class VolkswagenGoConnectSensor(VolkswagenGoConnectEntity, SensorEntity):
             return filtered_attributes if filtered_attributes else None
 
         return None
+
+
+class VolkswagenGoConnectWorkshopSensor(VolkswagenGoConnectSensor):
+    """Workshop sensor whose address and opening hours are not recorded."""
+
+    _unrecorded_attributes = WORKSHOP_UNRECORDED_ATTRIBUTES
+
+
+class VolkswagenGoConnectBrandContactSensor(VolkswagenGoConnectSensor):
+    """Brand contact sensor whose links and phone numbers are not recorded."""
+
+    _unrecorded_attributes = BRAND_CONTACT_UNRECORDED_ATTRIBUTES
+
+
+# Unrecorded attributes are a class attribute in Home Assistant, so the entity
+# descriptions with bulky attributes get their own sensor class
+SENSOR_CLASSES: dict[str, type[VolkswagenGoConnectSensor]] = {
+    "workshop": VolkswagenGoConnectWorkshopSensor,
+    "brandContactInfo": VolkswagenGoConnectBrandContactSensor,
+}
+
+
+class VolkswagenGoConnectAccountSensor(VolkswagenGoConnectEntity, SensorEntity):
+    """Sensor reporting polling statistics of the account."""
+
+    def __init__(
+        self,
+        coordinator: VolkswagenGoConnectDataUpdateCoordinator,
+        entity_description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator)
+        self.entity_description = entity_description
+        name = entity_description.name
+        self._attr_name = name if isinstance(name, str) else None
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_{entity_description.key}"
+        )
+
+    @property
+    def native_value(self) -> Any:
+        """Return the value of the account statistic."""
+        key = self.entity_description.key
+        if key == "missed_deadlines":
+            return self.coordinator.missed_deadlines
+        budget = self.coordinator.budget
+        if key == "request_budget_used":
+            return budget.used
+        return budget.projected_exhaustion(dt_util.now())
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the budget the requests are counted against."""
+        if self.entity_description.key != "request_budget_used":
+            return None
+        budget = self.coordinator.budget
+        return {
+            "limit": budget.limit or None,
+            "period": budget.period,
+            "window_start": (
+                budget.window_start.isoformat() if budget.window_start else None
+            ),
+        }
@@ -0,0 +1,86 @@
+"""Services for volkswagen_goconnect."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import ServiceCall, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+
+from .const import DOMAIN
+from .coordinator import vehicle_ids
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import VolkswagenGoConnectDataUpdateCoordinator
+
+ATTR_VEHICLE_ID = "vehicle_id"
+SERVICE_REFRESH_VEHICLE = "refresh_vehicle"
+
+REFRESH_VEHICLE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_VEHICLE_ID): vol.All(cv.ensure_list, [cv.string]),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_DEVICE_ID, ATTR_VEHICLE_ID),
+)
+
+
+def _requested_vehicle_ids(hass: HomeAssistant, call: ServiceCall) -> set[str]:
+    """Return the vehicle ids referenced by a service call."""
+    requested = set(call.data.get(ATTR_VEHICLE_ID, []))
+    device_registry = dr.async_get(hass)
+    for device_id in call.data.get(ATTR_DEVICE_ID, []):
+        device = device_registry.async_get(device_id)
+        if device is None:
+            msg = f"Unknown device {device_id}"
+            raise ServiceValidationError(msg)
+        requested.update(
+            identifier for domain, identifier in device.identifiers if domain == DOMAIN
+        )
+    return requested
+
+
+def _coordinators_by_vehicle(
+    hass: HomeAssistant,
+) -> dict[str, VolkswagenGoConnectDataUpdateCoordinator]:
+    """Map every vehicle id of the loaded entries to its coordinator."""
+    coordinators = {}
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if entry.state is not ConfigEntryState.LOADED:
+            continue
+        coordinator = entry.runtime_data.coordinator
+        for vehicle_id in vehicle_ids(coordinator.data):
+            coordinators[vehicle_id] = coordinator
+    return coordinators
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def _async_refresh_vehicle(call: ServiceCall) -> None:
+        """Refresh only the requested vehicles."""
+        coordinators = _coordinators_by_vehicle(hass)
+        requested = _requested_vehicle_ids(hass, call)
+        if unknown := requested - coordinators.keys():
+            msg = f"Unknown vehicle(s): {', '.join(sorted(unknown))}"
+            raise ServiceValidationError(msg)
+
+        for vehicle_id in sorted(requested):
+            await coordinators[vehicle_id].async_request_vehicle_refresh(vehicle_id)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH_VEHICLE,
+        _async_refresh_vehicle,
+        schema=REFRESH_VEHICLE_SCHEMA,
+    )
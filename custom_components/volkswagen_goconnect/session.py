@@ -0,0 +1,60 @@
+"""HTTP session shared by all config entries of the integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import callback
+from homeassistant.util.ssl import client_context
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    import ssl
+
+    from homeassistant.core import Event, HomeAssistant
+
+DATA_SESSION = f"{DOMAIN}_session"
+
+# Idle connections are kept this long; longer gaps between polls are bridged
+# by pre-warming a connection shortly before the poll
+KEEPALIVE_TIMEOUT_SECONDS = 90
+# Resolved API hosts are reused this long instead of resolving every poll
+DNS_CACHE_TTL_SECONDS = 300
+CONNECTION_LIMIT = 20
+# Requests to one host are spaced by the limiter, so few connections suffice
+CONNECTION_LIMIT_PER_HOST = 4
+
+
+def create_connector(
+    ssl_context: ssl.SSLContext | None = None, **kwargs: Any
+) -> aiohttp.TCPConnector:
+    """Return a connector tuned for periodic polling of a few API hosts."""
+    return aiohttp.TCPConnector(
+        ssl=ssl_context or client_context(),
+        keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS,
+        use_dns_cache=True,
+        ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+        limit=CONNECTION_LIMIT,
+        limit_per_host=CONNECTION_LIMIT_PER_HOST,
+        **kwargs,
+    )
+
+
+@callback
+def async_get_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the session shared by all config entries, creating it on first use."""
+    if (session := hass.data.get(DATA_SESSION)) is not None:
+        return session
+
+    session = hass.data[DATA_SESSION] = aiohttp.ClientSession(
+        connector=create_connector()
+    )
+
+    async def _async_close(_: Event) -> None:
+        await session.close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+    return session
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 
-from .entity import VolkswagenGoConnectEntity
+from .entity import VolkswagenGoConnectEntity, async_add_vehicle_entities
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -18,9 +18,9 @@ if TYPE_CHECKING:
 
 ENTITY_DESCRIPTIONS = (
     SwitchEntityDescription(
-        key="volkswagen_goconnect",
-        name="Integration Switch",
-        icon="mdi:format-quote-close",
+        key="fast_tracking",
+        name="Fast Tracking",
+        icon="mdi:map-marker-radius",
     ),
 )
 
@@ -31,27 +31,37 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the switch platform."""
-    async_add_entities(
-        VolkswagenGoConnectSwitch(
-            coordinator=entry.runtime_data.coordinator,
-            entity_description=entity_description,
-        )
-        for entity_description in ENTITY_DESCRIPTIONS
+    coordinator = entry.runtime_data.coordinator
+
+    async_add_vehicle_entities(
+        entry,
+        async_add_entities,
+        lambda vehicle: [
+            VolkswagenGoConnectSwitch(
+                coordinator=coordinator,
+                entity_description=entity_description,
+                vehicle=vehicle,
+            )
+            for entity_description in ENTITY_DESCRIPTIONS
+        ],
     )
 
 
 class VolkswagenGoConnectSwitch(VolkswagenGoConnectEntity, SwitchEntity):
-    """volkswagen_goconnect switch class."""
+    """Switch that temporarily polls one vehicle at a high rate."""
 
     def __init__(
         self,
         coordinator: VolkswagenGoConnectDataUpdateCoordinator,
         entity_description: SwitchEntityDescription,
+        vehicle: dict,
     ) -> None:
         """Initialize the switch class."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, vehicle)
         self.entity_description = entity_description
-        plate = getattr(self, "_license_plate", coordinator.config_entry.title)
+        self.vehicle_id = vehicle["vehicle"]["id"]
+
+        plate = getattr(self, "_license_plate", self.vehicle_id)
         name = entity_description.name
         self._attr_name = name if isinstance(name, str) else None
         self._attr_unique_id = f"vwgc_{plate}_{entity_description.key}"
@@ -59,13 +69,19 @@ class VolkswagenGoConnectSwitch(VolkswagenGoConnectEntity, SwitchEntity):
 
     @property
     def is_on(self) -> bool:
-        """Return true if the switch is on."""
-        return False
+        """Return true while the vehicle is fast polled."""
+        return self.coordinator.fast_poll_ends_at(self.vehicle_id) is not None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return when fast polling switches itself off."""
+        ends_at = self.coordinator.fast_poll_ends_at(self.vehicle_id)
+        return {"ends_at": ends_at.isoformat()} if ends_at else None
 
     async def async_turn_on(self, **_: Any) -> None:
-        """Turn on the switch."""
-        await self.coordinator.async_request_refresh()
+        """Start fast polling this vehicle."""
+        self.coordinator.async_start_fast_poll(self.vehicle_id)
 
     async def async_turn_off(self, **_: Any) -> None:
-        """Turn off the switch."""
-        await self.coordinator.async_request_refresh()
+        """Return this vehicle to the normal polling interval."""
+        self.coordinator.async_stop_fast_poll(self.vehicle_id)
@@ -9,7 +9,9 @@ import pytest
 from custom_components.volkswagen_goconnect.api import (
     VolkswagenGoConnectApiClient,
     VolkswagenGoConnectApiClientAuthenticationError,
+    VolkswagenGoConnectApiClientCircuitOpenError,
     VolkswagenGoConnectApiClientCommunicationError,
+    VolkswagenGoConnectApiClientDeadlineError,
 )
 
 
@@ -384,6 +386,90 @@ async def test_async_get_data_with_details():
     assert "batteryStatus" in vehicle_data
 
 
+@pytest.mark.asyncio
+async def test_async_get_data_skips_vehicles():
+    """Test async_get_data does not fetch details of skipped vehicles."""
+    client = VolkswagenGoConnectApiClient(
+        session=AsyncMock(spec=aiohttp.ClientSession),
+        email="test@example.com",
+        password="password123",
+    )
+    entries = [{"vehicle": {"id": "vehicle-1"}}, {"vehicle": {"id": "vehicle-2"}}]
+    client.get_vehicles = AsyncMock(
+        return_value={"data": {"viewer": {"vehicles": entries}}}
+    )
+    client.async_get_vehicle = AsyncMock(
+        return_value={"id": "vehicle-2", "model": "ID.3"}
+    )
+
+    result = await client.async_get_data(
+        skip=lambda vehicle: vehicle["id"] == "vehicle-1"
+    )
+
+    client.async_get_vehicle.assert_awaited_once_with("vehicle-2", extras=True)
+    assert result["data"]["viewer"]["vehicles"] == [
+        {"vehicle": {"id": "vehicle-1"}},
+        {"vehicle": {"id": "vehicle-2", "model": "ID.3"}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_vehicle_data_yields_vehicles_as_they_complete():
+    """Test each vehicle is yielded before the next one is fetched."""
+    client = VolkswagenGoConnectApiClient(
+        session=AsyncMock(spec=aiohttp.ClientSession),
+        email="test@example.com",
+        password="password123",
+    )
+    entries = [{"vehicle": {"id": "vehicle-1"}}, {"vehicle": {"id": "vehicle-2"}}]
+    client.get_vehicles = AsyncMock(
+        return_value={"data": {"viewer": {"vehicles": entries}}}
+    )
+    client.async_get_vehicle = AsyncMock(
+        side_effect=lambda vehicle_id, **_: {"id": vehicle_id, "model": "ID.3"}
+    )
+
+    fetched = []
+    async for entry in client.stream_vehicle_data():
+        fetched.append(client.async_get_vehicle.await_count)
+        assert entry["vehicle"]["model"] == "ID.3"
+
+    assert fetched == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_stream_vehicle_data_skips_details_quietly(caplog):
+    """Test running out of time or an open circuit is not logged as an error."""
+    client = VolkswagenGoConnectApiClient(
+        session=AsyncMock(spec=aiohttp.ClientSession),
+        email="test@example.com",
+        password="password123",
+    )
+    entries = [
+        {"vehicle": {"id": "vehicle-1"}},
+        {"vehicle": {"id": "vehicle-2"}},
+        {"vehicle": {"id": "vehicle-3"}},
+    ]
+    client.get_vehicles = AsyncMock(
+        return_value={"data": {"viewer": {"vehicles": entries}}}
+    )
+    client.async_get_vehicle = AsyncMock(
+        side_effect=[
+            VolkswagenGoConnectApiClientDeadlineError("Poll deadline reached"),
+            VolkswagenGoConnectApiClientCircuitOpenError("Circuit open"),
+            VolkswagenGoConnectApiClientCommunicationError("Boom"),
+        ]
+    )
+
+    result = [entry async for entry in client.stream_vehicle_data()]
+
+    assert result == entries
+    errors = [record for record in caplog.records if record.levelname == "ERROR"]
+    assert [record.getMessage() for record in errors] == [
+        "Error fetching details for vehicle vehicle-3"
+    ]
+
+
 @pytest.mark.asyncio
 async def test_async_get_data_no_vehicle_id():
     """Test async_get_data skips vehicles without ID."""
@@ -1226,3 +1312,486 @@ def test_sanitize_url_exception():
         mock_parse.side_effect = Exception("Parse error")
         result = _sanitize_url("http://test.com?token=secret")
         assert result == "http://test.com?token=secret"
+
+
+@pytest.mark.asyncio
+async def test_async_get_vehicle_merges_system_overview():
+    """Test a single vehicle is fetched without listing the account."""
+    session = AsyncMock(spec=aiohttp.ClientSession)
+    client = VolkswagenGoConnectApiClient(session=session)
+    client.get_vehicles = AsyncMock()
+    client.get_vehicle_details = AsyncMock(
+        return_value={"data": {"vehicle": {"id": "vehicle-1", "model": "ID.4"}}}
+    )
+    client.get_vehicle_system_overview = AsyncMock(
+        return_value={"data": {"vehicle": {"isCharging": True}}}
+    )
+
+    vehicle = await client.async_get_vehicle("vehicle-1")
+
+    assert vehicle == {"id": "vehicle-1", "model": "ID.4", "isCharging": True}
+    client.get_vehicles.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_get_vehicle_missing_details():
+    """Test a vehicle without details returns None."""
+    session = AsyncMock(spec=aiohttp.ClientSession)
+    client = VolkswagenGoConnectApiClient(session=session)
+    client.get_vehicle_details = AsyncMock(return_value={"data": {}})
+    client.get_vehicle_system_overview = AsyncMock(return_value={})
+
+    assert await client.async_get_vehicle("vehicle-1") is None
+
+
+@pytest.mark.asyncio
+async def test_requests_are_counted_and_extras_passed():
+    """Test requests are counted and low-value fields can be left out."""
+    session = AsyncMock(spec=aiohttp.ClientSession)
+    client = VolkswagenGoConnectApiClient(
+        session=session,
+        email="test@example.com",
+        password="password123",
+    )
+    client._token = "test-token"
+
+    mock_response = MagicMock()
+    mock_response.status = 200
+    mock_response.text = AsyncMock(return_value='{"data": {}}')
+    session.request = AsyncMock(return_value=mock_response)
+
+    await client.get_vehicle_details("vehicle-1", extras=False)
+    await client.get_vehicle_system_overview("vehicle-1")
+
+    assert client.request_count == 2
+    first, second = session.request.call_args_list
+    assert first.kwargs["json"]["variables"]["extras"] is False
+    assert second.kwargs["json"]["variables"]["extras"] is True
+
+
+@pytest.mark.asyncio
+async def test_async_get_data_keeps_fleet_work_hours():
+    """Test the fleet work hours of the vehicle list survive the details merge."""
+    client = VolkswagenGoConnectApiClient(
+        session=AsyncMock(spec=aiohttp.ClientSession),
+        email="test@example.com",
+        password="password123",
+    )
+    listed = {
+        "id": "vehicle-1",
+        "primaryFleet": {"id": "fleet-1", "workHours": [{"day": "monday"}]},
+    }
+    client.get_vehicles = AsyncMock(
+        return_value={"data": {"viewer": {"vehicles": [{"vehicle": listed}]}}}
+    )
+    client.async_get_vehicle = AsyncMock(
+        return_value={"id": "vehicle-1", "primaryFleet": {"id": "fleet-1", "name": "F"}}
+    )
+
+    result = await client.async_get_data()
+
+    vehicle = result["data"]["viewer"]["vehicles"][0]["vehicle"]
+    assert vehicle["primaryFleet"] == {
+        "id": "fleet-1",
+        "name": "F",
+        "workHours": [{"day": "monday"}],
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_prewarm_opens_connection_without_counting():
+    """Pre-warming sends a request that is not counted as an API call."""
+    session = MagicMock(spec=aiohttp.ClientSession)
+    response = session.get.return_value.__aenter__.return_value
+    response.read = AsyncMock()
+    client = VolkswagenGoConnectApiClient(session=session)
+
+    await client.async_prewarm()
+
+    assert session.get.call_args[0][0] == "https://api.au1.connectedcars.io/"
+    response.read.assert_awaited_once()
+    assert client.request_count == 0
+
+    session.get.side_effect = aiohttp.ClientConnectionError("refused")
+    # Failures are left to the poll itself
+    await client.async_prewarm()
+
+
+@pytest.mark.asyncio
+async def test_poll_deadline_skips_requests_that_cannot_finish():
+    """No request is started once the poll deadline is (nearly) reached."""
+    import time
+
+    # Earlier tests reload the api module, so use its current classes
+    from custom_components.volkswagen_goconnect import api
+
+    session = AsyncMock(spec=aiohttp.ClientSession)
+    client = api.VolkswagenGoConnectApiClient(session=session)
+    client._token = "test-token"
+
+    with pytest.raises(api.VolkswagenGoConnectApiClientDeadlineError):
+        await client.async_get_data(deadline=time.monotonic() + 0.1)
+
+    session.request.assert_not_called()
+    assert client.request_count == 0
+
+
+@pytest.mark.asyncio
+async def test_poll_deadline_reached_while_queued_spares_the_breaker():
+    """Running out of poll time is a deadline error, not an API failure."""
+    import asyncio
+    import time
+
+    from custom_components.volkswagen_goconnect import api
+
+    session = AsyncMock(spec=aiohttp.ClientSession)
+    client = api.VolkswagenGoConnectApiClient(session=session)
+    client._token = "test-token"
+
+    async def _get_vehicles_by(deadline):
+        token = api._POLL_DEADLINE.set(deadline)
+        try:
+            return await client.get_vehicles()
+        finally:
+            api._POLL_DEADLINE.reset(token)
+
+    async def _wait(*_, **__):
+        await asyncio.sleep(1)
+
+    limiter = MagicMock()
+    limiter.acquire = AsyncMock(side_effect=_wait)
+    with (
+        patch.object(api, "get_limiter", return_value=limiter),
+        pytest.raises(api.VolkswagenGoConnectApiClientDeadlineError),
+    ):
+        await _get_vehicles_by(time.monotonic() + 0.6)
+    session.request.assert_not_called()
+
+    # The request itself is cut short by the deadline
+    limiter.acquire = AsyncMock()
+    session.request = AsyncMock(side_effect=_wait)
+    with (
+        patch.object(api, "get_limiter", return_value=limiter),
+        pytest.raises(api.VolkswagenGoConnectApiClientDeadlineError),
+    ):
+        await _get_vehicles_by(time.monotonic() + 0.6)
+
+    assert list(client.breaker._outcomes) == []
+
+
+@pytest.mark.asyncio
+async def test_poll_deadline_cuts_backoff_short():
+    """A backoff that would overrun the poll deadline fails instead of sleeping."""
+    import time
+
+    from custom_components.volkswagen_goconnect import api
+
+    session = AsyncMock(spec=aiohttp.ClientSession)
+    client = api.VolkswagenGoConnectApiClient(session=session)
+    client._token = "test-token"
+    response = MagicMock()
+    response.status = 429
+    response.headers = {"Retry-After": "30"}
+    response.release = AsyncMock()
+    session.request = AsyncMock(return_value=response)
+
+    with (
+        patch("custom_components.volkswagen_goconnect.api.asyncio.sleep") as sleep,
+        pytest.raises(api.VolkswagenGoConnectApiClientDeadlineError),
+    ):
+        await client.async_get_data(deadline=time.monotonic() + 5)
+
+    sleep.assert_not_called()
+    assert client.request_count == 1
+
+
+@pytest.mark.asyncio
+async def test_request_latency_adapts_timeouts():
+    """Latencies are recorded per operation, timed-out requests with the timeout."""
+    import asyncio
+
+    from custom_components.volkswagen_goconnect import api
+
+    session = AsyncMock(spec=aiohttp.ClientSession)
+    client = api.VolkswagenGoConnectApiClient(session=session)
+    client._token = "test-token"
+    response = MagicMock()
+    response.status = 200
+    response.text = AsyncMock(return_value='{"data": {"viewer": {"vehicles": []}}}')
+    session.request = AsyncMock(return_value=response)
+
+    with patch.object(client.timeouts, "observe") as observe:
+        await client.get_vehicles()
+    assert observe.call_args[0][0] == "VehiclesType"
+
+    client.timeouts.timeout = MagicMock(return_value=0.01)
+
+    async def _hang(**_):
+        await asyncio.sleep(1)
+
+    session.request = AsyncMock(side_effect=_hang)
+    with (
+        patch.object(client.timeouts, "observe") as observe,
+        pytest.raises(api.VolkswagenGoConnectApiClientCommunicationError),
+    ):
+        await client._api_wrapper(method="post", url=api.AUTH_URL, data={})
+    assert observe.call_args[0][0] == "login"
+    assert observe.call_args[0][1] >= 0.01
+
+
+@pytest.mark.asyncio
+async def test_queries_are_retried_on_network_errors():
+    """Queries that fail in transit are retried after a jittered backoff."""
+    from custom_components.volkswagen_goconnect import api
+
+    session = AsyncMock(spec=aiohttp.ClientSession)
+    client = api.VolkswagenGoConnectApiClient(session=session)
+    client._token = "test-token"
+    response = MagicMock()
+    response.status = 200
+    response.text = AsyncMock(return_value='{"data": {"viewer": {"vehicles": []}}}')
+    session.request = AsyncMock(
+        side_effect=[aiohttp.ServerDisconnectedError(), response]
+    )
+
+    with patch("custom_components.volkswagen_goconnect.api.asyncio.sleep") as sleep:
+        assert await client.get_vehicles() == {"data": {"viewer": {"vehicles": []}}}
+
+    assert session.request.call_count == 2
+    assert 0 <= sleep.call_args[0][0] <= api.NETWORK_BASE_DELAY_SECONDS
+
+    # Logins are not queries and fail straight away
+    session.request = AsyncMock(side_effect=aiohttp.ClientConnectionError())
+    with pytest.raises(api.VolkswagenGoConnectApiClientCommunicationError):
+        await client._api_wrapper(method="post", url=api.AUTH_URL, data={})
+    assert session.request.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_poll_retry_budget_limits_retries():
+    """The requests of a poll share one budget of retries."""
+    from custom_components.volkswagen_goconnect import api
+
+    session = AsyncMock(spec=aiohttp.ClientSession)
+    client = api.VolkswagenGoConnectApiClient(session=session)
+    client._token = "test-token"
+    vehicles = {
+        "data": {
+            "viewer": {"vehicles": [{"vehicle": {"id": str(i)}} for i in range(5)]}
+        }
+    }
+    client.get_vehicles = AsyncMock(return_value=vehicles)
+    session.request = AsyncMock(side_effect=aiohttp.ClientConnectionError())
+    # Keep the circuit breaker out of the way
+    client.breaker.allow = MagicMock(return_value=True)
+
+    with patch("custom_components.volkswagen_goconnect.api.asyncio.sleep"):
+        data = await client.async_get_data()
+
+    # Every vehicle fails, keeping its list entry
+    assert data == vehicles
+    # One first attempt per vehicle plus the retries of the poll budget
+    assert session.request.call_count == 5 + api.POLL_RETRY_BUDGET
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_stops_requests():
+    """Requests are not sent while the circuit breaker is open."""
+    import asyncio
+
+    from custom_components.volkswagen_goconnect import api
+    from custom_components.volkswagen_goconnect.breaker import BreakerState
+
+    session = AsyncMock(spec=aiohttp.ClientSession)
+    client = api.VolkswagenGoConnectApiClient(session=session)
+    session.request = AsyncMock(side_effect=asyncio.TimeoutError())
+
+    for _ in range(4):
+        with pytest.raises(api.VolkswagenGoConnectApiClientCommunicationError):
+            await client._api_wrapper(method="get", url="http://test.com")
+    assert client.breaker.state is BreakerState.OPEN
+
+    with pytest.raises(api.VolkswagenGoConnectApiClientCircuitOpenError):
+        await client._api_wrapper(method="get", url="http://test.com")
+    assert session.request.call_count == 4
+
+    # Authentication errors say nothing of the API's health
+    client.breaker = api.CircuitBreaker()
+    response = MagicMock()
+    response.status = 401
+    response.text = AsyncMock(return_value="")
+    session.request = AsyncMock(return_value=response)
+    for _ in range(4):
+        with pytest.raises(api.VolkswagenGoConnectApiClientAuthenticationError):
+            await client._api_wrapper(method="get", url="http://test.com")
+    assert client.breaker.state is BreakerState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_identical_queries_in_flight_are_coalesced():
+    """A query already in flight is awaited instead of being sent again."""
+    import asyncio
+
+    from custom_components.volkswagen_goconnect import api
+
+    session = AsyncMock(spec=aiohttp.ClientSession)
+    client = api.VolkswagenGoConnectApiClient(session=session)
+    client._token = "test-token"
+    release = asyncio.Event()
+    response = MagicMock()
+    response.status = 200
+    response.text = AsyncMock(
+        return_value='{"data": {"vehicle": {"id": "test-vehicle-id"}}}'
+    )
+
+    async def _respond(**_):
+        await release.wait()
+        return response
+
+    session.request = AsyncMock(side_effect=_respond)
+
+    calls = [
+        asyncio.create_task(client.get_vehicle_details("test-vehicle-id"))
+        for _ in range(3)
+    ]
+    other = asyncio.create_task(client.get_vehicle_details("other-vehicle-id"))
+    await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.gather(*calls, other)
+
+    assert session.request.call_count == 2
+    assert client.coalesced_count == 2
+    assert results[0] == results[1] == results[2]
+    # Every caller gets its own copy of the shared result
+    assert results[0] is not results[1]
+    assert results[1] is not results[2]
+    assert client._in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_coalesced_queries_survive_the_first_caller_being_cancelled():
+    """Waiting callers send their own request when the first one is cancelled."""
+    import asyncio
+
+    from custom_components.volkswagen_goconnect import api
+
+    session = AsyncMock(spec=aiohttp.ClientSession)
+    client = api.VolkswagenGoConnectApiClient(session=session)
+    client._token = "test-token"
+    response = MagicMock()
+    response.status = 200
+    response.text = AsyncMock(return_value='{"data": {"viewer": {"vehicles": []}}}')
+    hang = asyncio.Event()
+
+    async def _respond(**_):
+        if session.request.call_count == 1:
+            await hang.wait()
+        return response
+
+    session.request = AsyncMock(side_effect=_respond)
+
+    first = asyncio.create_task(client.get_vehicles())
+    await asyncio.sleep(0.01)
+    second = asyncio.create_task(client.get_vehicles())
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert await second == {"data": {"viewer": {"vehicles": []}}}
+    assert first.cancelled()
+    assert session.request.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_vehicle_requests_queue_as_telemetry():
+    """Vehicle details carry live state, so they queue with the telemetry."""
+    from custom_components.volkswagen_goconnect import api
+    from custom_components.volkswagen_goconnect.limiter import Priority
+
+    session = AsyncMock(spec=aiohttp.ClientSession)
+    client = api.VolkswagenGoConnectApiClient(session=session)
+    client._token = "test-token"
+    response = MagicMock()
+    response.status = 200
+    response.text = AsyncMock(return_value='{"data": {"vehicle": {"id": "v"}}}')
+    session.request = AsyncMock(return_value=response)
+    limiter = MagicMock()
+    limiter.acquire = AsyncMock()
+
+    with patch.object(api, "get_limiter", return_value=limiter):
+        await client.async_get_vehicle("v")
+        assert [call.args[1] for call in limiter.acquire.call_args_list] == [
+            Priority.TELEMETRY,
+            Priority.TELEMETRY,
+        ]
+
+        limiter.acquire.reset_mock()
+        await client.async_get_vehicle("v", priority=Priority.INTERACTIVE)
+        assert [call.args[1] for call in limiter.acquire.call_args_list] == [
+            Priority.INTERACTIVE,
+            Priority.INTERACTIVE,
+        ]
+
+
+@pytest.mark.asyncio
+async def test_coalescing_respects_priority_and_deadline():
+    """Callers only join requests as urgent as theirs and outlive their deadline."""
+    import asyncio
+    import time
+
+    from custom_components.volkswagen_goconnect import api
+    from custom_components.volkswagen_goconnect.limiter import Priority
+
+    session = AsyncMock(spec=aiohttp.ClientSession)
+    client = api.VolkswagenGoConnectApiClient(session=session)
+    client._token = "test-token"
+    response = MagicMock()
+    response.status = 200
+    response.text = AsyncMock(return_value='{"data": {"vehicle": {"id": "v"}}}')
+    release = asyncio.Event()
+
+    async def _respond(**_):
+        await release.wait()
+        return response
+
+    session.request = AsyncMock(side_effect=_respond)
+    limiter = MagicMock()
+    limiter.acquire = AsyncMock()
+
+    async def _details(priority=None, deadline=None):
+        priority_token = api._REQUEST_PRIORITY.set(priority)
+        deadline_token = api._POLL_DEADLINE.set(deadline)
+        try:
+            return await client.get_vehicle_details("v")
+        finally:
+            api._POLL_DEADLINE.reset(deadline_token)
+            api._REQUEST_PRIORITY.reset(priority_token)
+
+    with patch.object(api, "get_limiter", return_value=limiter):
+        background = asyncio.create_task(_details(Priority.ANALYTICS))
+        await asyncio.sleep(0.01)
+        # An interactive refresh does not wait on a background request
+        interactive = asyncio.create_task(_details(Priority.INTERACTIVE))
+        await asyncio.sleep(0.01)
+        # A poll joins the interactive request
+        poll = asyncio.create_task(_details())
+        await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.gather(background, interactive, poll)
+
+        assert session.request.call_count == 2
+        assert client.coalesced_count == 1
+
+        # The first caller runs out of its poll's time; the waiter carries on
+        release.clear()
+        first = asyncio.create_task(_details(deadline=time.monotonic() + 0.6))
+        await asyncio.sleep(0.01)
+        manual = asyncio.create_task(_details())
+        await asyncio.sleep(0.01)
+        with pytest.raises(api.VolkswagenGoConnectApiClientDeadlineError):
+            await first
+        release.set()
+
+        assert await manual == {"data": {"vehicle": {"id": "v"}}}
+        assert session.request.call_count == 4
+        # Only callers served by the shared result are counted
+        assert client.coalesced_count == 1
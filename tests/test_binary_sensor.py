@@ -6,7 +6,9 @@ import pytest
 from homeassistant.core import HomeAssistant
 
 from custom_components.volkswagen_goconnect.binary_sensor import (
+    ACCOUNT_ENTITY_DESCRIPTIONS,
     ENTITY_DESCRIPTIONS,
+    VolkswagenGoConnectAccountBinarySensor,
     VolkswagenGoConnectBinarySensor,
 )
 from custom_components.volkswagen_goconnect.coordinator import (
@@ -108,9 +110,14 @@ async def test_binary_sensor_setup_entry(hass: HomeAssistant, mock_api_data):
     mock_hass = MagicMock()
     await async_setup_entry(mock_hass, config_entry, capture_entities)  # type: ignore[arg-type]
 
-    # Verify entities were added
-    assert len(added_entities) > 0
-    assert all(isinstance(e, VolkswagenGoConnectBinarySensor) for e in added_entities)
+    # Verify entities were added, the account ones first
+    account_entities = added_entities[: len(ACCOUNT_ENTITY_DESCRIPTIONS)]
+    vehicle_entities = added_entities[len(ACCOUNT_ENTITY_DESCRIPTIONS) :]
+    assert all(
+        isinstance(e, VolkswagenGoConnectAccountBinarySensor) for e in account_entities
+    )
+    assert len(vehicle_entities) > 0
+    assert all(isinstance(e, VolkswagenGoConnectBinarySensor) for e in vehicle_entities)
 
 
 @pytest.mark.asyncio
@@ -182,3 +189,48 @@ async def test_binary_sensor_is_on_key_not_in_data(hass: HomeAssistant, mock_api
     )
 
     assert sensor.is_on is False
+
+
+def test_circuit_breaker_binary_sensor():
+    """Test the account binary sensor reports the circuit breaker state."""
+    from unittest.mock import MagicMock
+
+    from custom_components.volkswagen_goconnect.breaker import CircuitBreaker
+
+    coordinator = MagicMock()
+    coordinator.config_entry.entry_id = "entry-id"
+    coordinator.client.breaker = CircuitBreaker()
+
+    sensor = VolkswagenGoConnectAccountBinarySensor(
+        coordinator=coordinator, entity_description=ACCOUNT_ENTITY_DESCRIPTIONS[0]
+    )
+
+    assert sensor.unique_id == "entry-id_circuit_breaker"
+    assert sensor.is_on is False
+    assert sensor.extra_state_attributes == {"state": "closed", "failure_rate": 0.0}
+
+    for _ in range(4):
+        coordinator.client.breaker.record_failure(0)
+    assert sensor.is_on is True
+    assert sensor.extra_state_attributes == {"state": "open", "failure_rate": 1.0}
+
+
+def test_degraded_mode_binary_sensor():
+    """Test the account binary sensor reports degraded mode and its reason."""
+    from unittest.mock import MagicMock
+
+    coordinator = MagicMock()
+    coordinator.config_entry.entry_id = "entry-id"
+    coordinator.degraded_reason = None
+
+    sensor = VolkswagenGoConnectAccountBinarySensor(
+        coordinator=coordinator,
+        entity_description=next(
+            desc for desc in ACCOUNT_ENTITY_DESCRIPTIONS if desc.key == "degraded_mode"
+        ),
+    )
+
+    assert sensor.is_on is False
+    coordinator.degraded_reason = "throttling"
+    assert sensor.is_on is True
+    assert sensor.extra_state_attributes == {"reason": "throttling"}
@@ -0,0 +1,58 @@
+"""Tests for the circuit breaker."""
+
+from custom_components.volkswagen_goconnect.breaker import (
+    MIN_REQUESTS,
+    BreakerState,
+    CircuitBreaker,
+)
+
+
+def test_breaker_opens_on_failure_rate():
+    """The breaker opens once half of enough recent requests failed."""
+    breaker = CircuitBreaker(open_seconds=60)
+    for _ in range(MIN_REQUESTS - 1):
+        breaker.record_failure(0)
+        assert breaker.allow(0)
+    breaker.record_success()
+    breaker.record_failure(0)
+    assert breaker.state is BreakerState.OPEN
+    assert not breaker.allow(59)
+
+
+def test_breaker_probes_recovery():
+    """After the open period one probe is let through and decides the state."""
+    breaker = CircuitBreaker(open_seconds=60)
+    for _ in range(MIN_REQUESTS):
+        breaker.record_failure(0)
+
+    assert breaker.allow(60)
+    assert breaker.state is BreakerState.HALF_OPEN
+    # Only a single probe at a time
+    assert not breaker.allow(60)
+
+    breaker.record_failure(61)
+    assert breaker.state is BreakerState.OPEN
+    assert not breaker.allow(120)
+
+    assert breaker.allow(121)
+    breaker.release(probe=True)
+    # A probe that said nothing of the API is retried
+    assert breaker.allow(121)
+    breaker.record_success()
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.failure_rate == 0
+
+
+def test_breaker_keeps_probe_when_other_request_released():
+    """A request sent before the breaker opened does not free the probe slot."""
+    breaker = CircuitBreaker(open_seconds=60)
+    for _ in range(MIN_REQUESTS):
+        breaker.record_failure(0)
+
+    assert breaker.allow(60)
+    # A request sent while closed is cancelled during the probe
+    breaker.release(probe=False)
+    assert not breaker.allow(60)
+
+    breaker.release(probe=True)
+    assert breaker.allow(60)
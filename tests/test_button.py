@@ -0,0 +1,53 @@
+"""Tests for the button platform."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.volkswagen_goconnect.button import (
+    ENTITY_DESCRIPTIONS,
+    VolkswagenGoConnectButton,
+    async_setup_entry,
+)
+
+
+@pytest.mark.asyncio
+async def test_button_setup_entry(mock_api_data):
+    """Test a refresh button is created per vehicle."""
+    coordinator = MagicMock()
+    coordinator.data = mock_api_data
+
+    config_entry = MagicMock()
+    config_entry.runtime_data = MagicMock()
+    config_entry.runtime_data.coordinator = coordinator
+
+    added_entities = []
+
+    def capture_entities(entities):
+        added_entities.extend(list(entities))
+
+    hass = MagicMock()
+    await async_setup_entry(hass, config_entry, capture_entities)  # type: ignore[arg-type]
+
+    assert len(added_entities) == 1
+    button = added_entities[0]
+    assert isinstance(button, VolkswagenGoConnectButton)
+    assert button.unique_id == "vwgc_ABC123_refresh"
+
+
+@pytest.mark.asyncio
+async def test_button_press_refreshes_vehicle(mock_api_data):
+    """Test pressing the button refreshes only its vehicle."""
+    coordinator = MagicMock()
+    coordinator.data = mock_api_data
+    coordinator.async_request_vehicle_refresh = AsyncMock()
+
+    button = VolkswagenGoConnectButton(
+        coordinator=coordinator,
+        entity_description=ENTITY_DESCRIPTIONS[0],
+        vehicle=mock_api_data["data"]["viewer"]["vehicles"][0],
+    )
+
+    await button.async_press()
+
+    coordinator.async_request_vehicle_refresh.assert_called_once_with("test-vehicle-id")
@@ -7,15 +7,24 @@ import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from custom_components.volkswagen_goconnect.api import (
     VolkswagenGoConnectApiClient,
     VolkswagenGoConnectApiClientAuthenticationError,
+    VolkswagenGoConnectApiClientCircuitOpenError,
     VolkswagenGoConnectApiClientError,
 )
+from custom_components.volkswagen_goconnect.breaker import (
+    MIN_REQUESTS,
+    CircuitBreaker,
+)
 from custom_components.volkswagen_goconnect.coordinator import (
     VolkswagenGoConnectDataUpdateCoordinator,
+    patch_vehicles,
+    vehicles_by_id,
 )
+from custom_components.volkswagen_goconnect.limiter import Priority
 
 
 @pytest.mark.asyncio
@@ -64,6 +73,7 @@ async def test_coordinator_update_success(mock_api_data):
     """Test successful data update."""
     hass = MagicMock(spec=HomeAssistant)
     client = AsyncMock(spec=VolkswagenGoConnectApiClient)
+    client.request_count = 0
     client.async_get_data = AsyncMock(return_value=mock_api_data)
 
     with patch(
@@ -87,6 +97,7 @@ async def test_coordinator_update_authentication_error():
     """Test coordinator raises ConfigEntryAuthFailed on auth error."""
     hass = MagicMock(spec=HomeAssistant)
     client = AsyncMock(spec=VolkswagenGoConnectApiClient)
+    client.request_count = 0
     client.async_get_data = AsyncMock(
         side_effect=VolkswagenGoConnectApiClientAuthenticationError("Auth failed")
     )
@@ -110,6 +121,7 @@ async def test_coordinator_update_communication_error():
     """Test coordinator raises UpdateFailed on communication error."""
     hass = MagicMock(spec=HomeAssistant)
     client = AsyncMock(spec=VolkswagenGoConnectApiClient)
+    client.request_count = 0
     client.async_get_data = AsyncMock(
         side_effect=VolkswagenGoConnectApiClientError("Communication error")
     )
@@ -126,3 +138,777 @@ async def test_coordinator_update_communication_error():
 
         with pytest.raises(UpdateFailed):
             await coordinator._async_update_data()
+
+
+def _coordinator_with_registry(client):
+    """Create a coordinator wired to a mocked device registry."""
+    with patch(
+        "custom_components.volkswagen_goconnect.coordinator.DataUpdateCoordinator.__init__",
+        return_value=None,
+    ):
+        coordinator = VolkswagenGoConnectDataUpdateCoordinator(
+            hass=MagicMock(spec=HomeAssistant),
+            client=client,
+            update_interval=timedelta(seconds=60),
+        )
+    coordinator.hass = MagicMock()
+    coordinator.config_entry = MagicMock()
+    coordinator.config_entry.entry_id = "test-entry-id"
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_coordinator_removes_departed_vehicle(mock_api_data):
+    """A vehicle missing from the account has its device removed."""
+    from copy import deepcopy
+
+    fleet = deepcopy(mock_api_data)
+    second = deepcopy(fleet["data"]["viewer"]["vehicles"][0])
+    second["vehicle"]["id"] = "second-vehicle-id"
+    fleet["data"]["viewer"]["vehicles"].append(second)
+
+    client = AsyncMock(spec=VolkswagenGoConnectApiClient)
+    client.request_count = 0
+    client.async_get_data = AsyncMock(side_effect=[fleet, mock_api_data])
+    coordinator = _coordinator_with_registry(client)
+
+    registry = MagicMock()
+    registry.async_get_device.return_value = MagicMock(id="device-2")
+    with patch(
+        "custom_components.volkswagen_goconnect.coordinator.dr.async_get",
+        return_value=registry,
+    ):
+        await coordinator._async_update_data()
+        registry.async_update_device.assert_not_called()
+
+        await coordinator._async_update_data()
+
+    registry.async_get_device.assert_called_once_with(
+        identifiers={("volkswagen_goconnect", "second-vehicle-id")}
+    )
+    registry.async_update_device.assert_called_once_with(
+        "device-2", remove_config_entry_id="test-entry-id"
+    )
+
+
+@pytest.mark.asyncio
+async def test_coordinator_keeps_devices_on_empty_vehicle_list(mock_api_data):
+    """An empty vehicle list does not remove every device."""
+    client = AsyncMock(spec=VolkswagenGoConnectApiClient)
+    client.request_count = 0
+    client.async_get_data = AsyncMock(
+        side_effect=[mock_api_data, {"data": {"viewer": {"vehicles": []}}}]
+    )
+    coordinator = _coordinator_with_registry(client)
+
+    registry = MagicMock()
+    with patch(
+        "custom_components.volkswagen_goconnect.coordinator.dr.async_get",
+        return_value=registry,
+    ):
+        await coordinator._async_update_data()
+        await coordinator._async_update_data()
+
+    registry.async_update_device.assert_not_called()
+
+
+def test_coordinator_apply_options_reschedules():
+    """A new polling interval is applied without recreating the coordinator."""
+    from custom_components.volkswagen_goconnect.const import CONF_POLLING_INTERVAL
+
+    hass = MagicMock(spec=HomeAssistant)
+    client = MagicMock(spec=VolkswagenGoConnectApiClient)
+    entry = MagicMock()
+    entry.data = {CONF_POLLING_INTERVAL: 60}
+    entry.options = {}
+
+    coordinator = VolkswagenGoConnectDataUpdateCoordinator(
+        hass=hass,
+        client=client,
+        update_interval=timedelta(seconds=60),
+    )
+    coordinator.config_entry = entry
+    coordinator._listeners = {object(): (MagicMock(), None)}
+
+    with patch.object(coordinator, "_schedule_refresh") as schedule_refresh:
+        coordinator.async_apply_options()
+        schedule_refresh.assert_not_called()
+
+        entry.options = {CONF_POLLING_INTERVAL: 300}
+        coordinator.async_apply_options()
+
+    assert coordinator.update_interval == timedelta(seconds=300)
+    schedule_refresh.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_vehicle_refresh_coalesces(mock_api_data):
+    """Refresh requests are batched and patched into the snapshot."""
+    from copy import deepcopy
+
+    client = AsyncMock(spec=VolkswagenGoConnectApiClient)
+    client.request_count = 0
+    refreshed = deepcopy(mock_api_data["data"]["viewer"]["vehicles"][0]["vehicle"])
+    refreshed["odometer"]["odometer"] = 15100
+    client.async_get_vehicle = AsyncMock(return_value=refreshed)
+
+    with patch(
+        "custom_components.volkswagen_goconnect.coordinator.DataUpdateCoordinator.__init__",
+        return_value=None,
+    ):
+        coordinator = VolkswagenGoConnectDataUpdateCoordinator(
+            hass=MagicMock(spec=HomeAssistant),
+            client=client,
+            update_interval=timedelta(seconds=60),
+        )
+    coordinator.data = mock_api_data
+    coordinator.async_update_listeners = MagicMock()
+    coordinator.async_update_vehicle_listeners = MagicMock()
+    # A refresh the user asked for does not wait out the cooldown
+    assert coordinator._vehicle_refresh_debouncer.immediate
+    coordinator._vehicle_refresh_debouncer = MagicMock()
+    coordinator._vehicle_refresh_debouncer.async_call = AsyncMock()
+
+    await coordinator.async_request_vehicle_refresh("test-vehicle-id")
+    await coordinator.async_request_vehicle_refresh("test-vehicle-id")
+    await coordinator.async_request_vehicle_refresh("unknown-vehicle")
+    assert coordinator._vehicle_refresh_debouncer.async_call.call_count == 3
+
+    await coordinator._async_refresh_pending_vehicles()
+
+    client.async_get_vehicle.assert_called_once_with(
+        "test-vehicle-id", priority=Priority.INTERACTIVE
+    )
+    client.async_get_data.assert_not_called()
+    vehicle = coordinator.data["data"]["viewer"]["vehicles"][0]["vehicle"]
+    assert vehicle["odometer"]["odometer"] == 15100
+    # Only the entities of the refreshed vehicle are updated
+    coordinator.async_update_vehicle_listeners.assert_called_once_with(
+        "test-vehicle-id"
+    )
+    coordinator.async_update_listeners.assert_not_called()
+    assert coordinator._pending_vehicle_refresh == set()
+
+    # Background refreshes, such as fast polling, keep their normal priority
+    await coordinator.async_request_vehicle_refresh(
+        "test-vehicle-id", interactive=False
+    )
+    await coordinator._async_refresh_pending_vehicles()
+    client.async_get_vehicle.assert_called_with("test-vehicle-id", priority=None)
+
+
+@pytest.mark.asyncio
+async def test_coordinator_vehicle_refresh_error_keeps_snapshot(mock_api_data):
+    """A failed vehicle refresh leaves the snapshot untouched."""
+    client = AsyncMock(spec=VolkswagenGoConnectApiClient)
+    client.request_count = 0
+    client.async_get_vehicle = AsyncMock(
+        side_effect=VolkswagenGoConnectApiClientError("boom")
+    )
+
+    with patch(
+        "custom_components.volkswagen_goconnect.coordinator.DataUpdateCoordinator.__init__",
+        return_value=None,
+    ):
+        coordinator = VolkswagenGoConnectDataUpdateCoordinator(
+            hass=MagicMock(spec=HomeAssistant),
+            client=client,
+            update_interval=timedelta(seconds=60),
+        )
+    coordinator.data = mock_api_data
+    coordinator.async_update_listeners = MagicMock()
+    coordinator._pending_vehicle_refresh = {"test-vehicle-id"}
+
+    await coordinator._async_refresh_pending_vehicles()
+
+    assert coordinator.data is mock_api_data
+    coordinator.async_update_listeners.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_polls_only_due_vehicles(mock_api_data):
+    """Vehicles that are not due keep their previous data."""
+    from copy import deepcopy
+
+    from custom_components.volkswagen_goconnect.scheduler import (
+        DRIVING_INTERVAL,
+        PARKED_INTERVAL,
+    )
+
+    parked = mock_api_data["data"]["viewer"]["vehicles"][0]["vehicle"]
+    driving = deepcopy(parked)
+    driving["id"] = "driving-vehicle-id"
+    driving["ignition"]["on"] = True
+    listed = {
+        "test-vehicle-id": {"id": "test-vehicle-id", "ignition": {"on": False}},
+        "driving-vehicle-id": {"id": "driving-vehicle-id", "ignition": {"on": True}},
+    }
+    details = {"test-vehicle-id": parked, "driving-vehicle-id": driving}
+
+    async def _get_data(skip, extras, deadline=None, on_vehicle=None):
+        return {
+            "data": {
+                "viewer": {
+                    "vehicles": [
+                        {"vehicle": vehicle if skip(vehicle) else details[vehicle_id]}
+                        for vehicle_id, vehicle in listed.items()
+                    ]
+                }
+            }
+        }
+
+    client = AsyncMock(spec=VolkswagenGoConnectApiClient)
+    client.request_count = 0
+    client.async_get_data = AsyncMock(side_effect=_get_data)
+    coordinator = _coordinator_with_registry(client)
+
+    with patch("custom_components.volkswagen_goconnect.coordinator.dr.async_get"):
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.update_interval == DRIVING_INTERVAL
+
+        details["test-vehicle-id"] = {"id": "test-vehicle-id"}
+        details["driving-vehicle-id"] = deepcopy(driving)
+        details["driving-vehicle-id"]["odometer"]["odometer"] = 15100
+        with patch(
+            "custom_components.volkswagen_goconnect.coordinator.dt_util.now",
+            return_value=dt_util.now() + DRIVING_INTERVAL,
+        ):
+            data = await coordinator._async_update_data()
+
+        vehicles = data["data"]["viewer"]["vehicles"]
+        # The parked vehicle is served from the previous snapshot
+        assert vehicles[0]["vehicle"] == parked
+        assert vehicles[1]["vehicle"]["odometer"]["odometer"] == 15100
+        assert coordinator._scheduler.next_poll(
+            "test-vehicle-id"
+        ) > coordinator._scheduler.next_poll("driving-vehicle-id")
+        assert coordinator.update_interval < PARKED_INTERVAL
+
+        # A parked vehicle that starts driving is fetched straight away
+        coordinator.data = data
+        listed["test-vehicle-id"]["ignition"]["on"] = True
+        data = await coordinator._async_update_data()
+
+    assert data["data"]["viewer"]["vehicles"][0]["vehicle"] == {"id": "test-vehicle-id"}
+
+
+@pytest.mark.asyncio
+async def test_coordinator_keeps_vehicles_refreshed_during_poll(mock_api_data):
+    """A skipped vehicle refreshed while the poll runs keeps the refreshed data."""
+    parked = mock_api_data["data"]["viewer"]["vehicles"][0]["vehicle"]
+    refreshed = {**parked, "odometer": {"odometer": 15100}}
+
+    async def _get_data(skip, extras, deadline=None, on_vehicle=None):
+        listed = {"id": "test-vehicle-id", "ignition": {"on": False}}
+        assert skip(listed)
+        # A fast tracking refresh lands while the vehicle list is fetched
+        coordinator.data = patch_vehicles(
+            coordinator.data, {"test-vehicle-id": refreshed}
+        )
+        return {"data": {"viewer": {"vehicles": [{"vehicle": listed}]}}}
+
+    client = AsyncMock(spec=VolkswagenGoConnectApiClient)
+    client.request_count = 0
+    client.async_get_data = AsyncMock(side_effect=_get_data)
+    coordinator = _coordinator_with_registry(client)
+    coordinator.data = mock_api_data
+    coordinator._scheduler.record("test-vehicle-id", parked, dt_util.now())
+
+    with patch("custom_components.volkswagen_goconnect.coordinator.dr.async_get"):
+        data = await coordinator._async_update_data()
+
+    assert vehicles_by_id(data)["test-vehicle-id"] == refreshed
+
+
+@pytest.mark.asyncio
+async def test_coordinator_request_budget(mock_api_data):
+    """A nearly spent budget stretches polling and skips low-value fields."""
+    from copy import deepcopy
+
+    from custom_components.volkswagen_goconnect.const import (
+        CONF_REQUEST_BUDGET,
+        CONF_REQUEST_BUDGET_PERIOD,
+    )
+
+    previous = deepcopy(mock_api_data)
+    previous["data"]["viewer"]["vehicles"][0]["vehicle"]["workshop"] = {"name": "WS"}
+    client = AsyncMock(spec=VolkswagenGoConnectApiClient)
+    client.request_count = 0
+    fetched = deepcopy(mock_api_data)
+    del fetched["data"]["viewer"]["vehicles"][0]["vehicle"]["workshop"]
+    client.async_get_data = AsyncMock(return_value=fetched)
+    coordinator = _coordinator_with_registry(client)
+    coordinator.config_entry.data = {}
+    coordinator.config_entry.options = {
+        CONF_REQUEST_BUDGET: 100,
+        CONF_REQUEST_BUDGET_PERIOD: "hour",
+    }
+    coordinator.async_apply_options()
+    coordinator.data = previous
+
+    start = dt_util.now().replace(minute=50, second=0, microsecond=0)
+    with (
+        patch("custom_components.volkswagen_goconnect.coordinator.dr.async_get"),
+        patch(
+            "custom_components.volkswagen_goconnect.coordinator.dt_util.now",
+            return_value=start,
+        ),
+    ):
+        coordinator.budget.record(0, start)
+        client.request_count = 90
+        data = await coordinator._async_update_data()
+
+    assert client.async_get_data.call_args.kwargs["extras"] is False
+    # The skipped workshop is kept from the previous snapshot
+    vehicle = data["data"]["viewer"]["vehicles"][0]["vehicle"]
+    assert vehicle["workshop"] == {"name": "WS"}
+    assert coordinator.budget.used == 90
+    assert coordinator.update_interval > coordinator._scheduler.next_wakeup(start)
+
+
+@pytest.mark.asyncio
+async def test_coordinator_quiet_hours(mock_api_data):
+    """Nothing is fetched during the quiet hours."""
+    from custom_components.volkswagen_goconnect.const import (
+        CONF_QUIET_HOURS_END,
+        CONF_QUIET_HOURS_START,
+    )
+
+    client = AsyncMock(spec=VolkswagenGoConnectApiClient)
+    client.request_count = 0
+    client.async_get_data = AsyncMock(return_value=mock_api_data)
+    coordinator = _coordinator_with_registry(client)
+    coordinator.config_entry.data = {}
+    coordinator.config_entry.options = {
+        CONF_QUIET_HOURS_START: "22:00:00",
+        CONF_QUIET_HOURS_END: "06:00:00",
+    }
+    coordinator.async_apply_options()
+
+    night = dt_util.now().replace(hour=23, minute=0, second=0, microsecond=0)
+    with (
+        patch("custom_components.volkswagen_goconnect.coordinator.dr.async_get"),
+        patch(
+            "custom_components.volkswagen_goconnect.coordinator.dt_util.now",
+            return_value=night,
+        ),
+    ):
+        # The first refresh still fetches so entities can be set up
+        coordinator.data = await coordinator._async_update_data()
+        assert await coordinator._async_update_data() is coordinator.data
+
+    client.async_get_data.assert_called_once()
+    assert coordinator.update_interval == timedelta(hours=7)
+
+
+@pytest.mark.asyncio
+async def test_coordinator_rolls_due_vehicles_over(mock_api_data):
+    """Due vehicles beyond the poll capacity wait for the next poll."""
+    from copy import deepcopy
+
+    from custom_components.volkswagen_goconnect.scheduler import (
+        MIN_WAKEUP_INTERVAL,
+        PARKED_INTERVAL,
+    )
+
+    first = mock_api_data["data"]["viewer"]["vehicles"][0]["vehicle"]
+    second = deepcopy(first)
+    second["id"] = "second-vehicle-id"
+    details = {"test-vehicle-id": first, "second-vehicle-id": second}
+    fetched: list[str] = []
+
+    async def _get_data(skip, extras, deadline=None, on_vehicle=None):
+        vehicles = []
+        for vehicle_id, vehicle in details.items():
+            if skip({"id": vehicle_id}):
+                vehicles.append({"vehicle": {"id": vehicle_id}})
+            else:
+                fetched.append(vehicle_id)
+                vehicles.append({"vehicle": vehicle})
+        return {"data": {"viewer": {"vehicles": vehicles}}}
+
+    client = AsyncMock(spec=VolkswagenGoConnectApiClient)
+    client.request_count = 0
+    client.async_get_data = AsyncMock(side_effect=_get_data)
+    coordinator = _coordinator_with_registry(client)
+
+    start = dt_util.now()
+    with (
+        patch("custom_components.volkswagen_goconnect.coordinator.dr.async_get"),
+        patch(
+            "custom_components.volkswagen_goconnect.coordinator.MAX_VEHICLES_PER_POLL",
+            1,
+        ),
+        patch("custom_components.volkswagen_goconnect.coordinator.dt_util.now") as now,
+    ):
+        now.return_value = start
+        coordinator.data = await coordinator._async_update_data()
+        assert fetched == ["test-vehicle-id", "second-vehicle-id"]
+
+        fetched.clear()
+        now.return_value = start + PARKED_INTERVAL
+        coordinator.data = await coordinator._async_update_data()
+        assert fetched == ["second-vehicle-id"]
+        assert coordinator.update_interval == MIN_WAKEUP_INTERVAL
+
+        fetched.clear()
+        now.return_value = start + PARKED_INTERVAL + MIN_WAKEUP_INTERVAL
+        await coordinator._async_update_data()
+        assert fetched == ["test-vehicle-id"]
+        assert coordinator.vehicle_data_age("second-vehicle-id") == 15
+
+
+@pytest.mark.asyncio
+async def test_coordinator_poll_offset_delays_first_poll_only(mock_api_data):
+    """The stagger offset shifts the first scheduled poll, not the later ones."""
+    client = AsyncMock(spec=VolkswagenGoConnectApiClient)
+    client.request_count = 0
+    client.async_get_data = AsyncMock(return_value=mock_api_data)
+    with patch(
+        "custom_components.volkswagen_goconnect.coordinator.DataUpdateCoordinator.__init__",
+        return_value=None,
+    ):
+        coordinator = VolkswagenGoConnectDataUpdateCoordinator(
+            hass=MagicMock(spec=HomeAssistant),
+            client=client,
+            update_interval=timedelta(seconds=60),
+            poll_offset=timedelta(seconds=20),
+        )
+    coordinator.hass = MagicMock()
+    coordinator.config_entry = MagicMock()
+
+    with patch("custom_components.volkswagen_goconnect.coordinator.dr.async_get"):
+        coordinator.data = await coordinator._async_update_data()
+        first = coordinator.update_interval
+        await coordinator._async_update_data()
+
+    assert first - coordinator.update_interval == timedelta(seconds=20)
+
+
+def test_get_poll_offset_spreads_entries():
+    """Every account gets its own share of the polling interval."""
+    from custom_components.volkswagen_goconnect.coordinator import get_poll_offset
+
+    entries = [MagicMock(entry_id=entry_id, options={}, data={}) for entry_id in "bca"]
+    hass = MagicMock()
+    hass.config_entries.async_entries.return_value = entries
+
+    offsets = sorted(get_poll_offset(hass, entry) for entry in entries)
+
+    assert offsets == [timedelta(0), timedelta(seconds=20), timedelta(seconds=40)]
+    assert get_poll_offset(hass, MagicMock(entry_id="other")) == timedelta(0)
+
+
+def test_coordinator_prewarms_before_long_gaps_only():
+    """A connection is pre-warmed only when the pooled one will have expired."""
+    from custom_components.volkswagen_goconnect.coordinator import PREWARM_LEAD
+
+    coordinator = _coordinator_with_registry(
+        AsyncMock(spec=VolkswagenGoConnectApiClient)
+    )
+
+    with patch(
+        "custom_components.volkswagen_goconnect.coordinator.async_call_later"
+    ) as call_later:
+        coordinator.update_interval = timedelta(minutes=15)
+        coordinator._async_schedule_prewarm()
+        call_later.assert_called_once()
+        assert call_later.call_args[0][1] == timedelta(minutes=15) - PREWARM_LEAD
+
+        # A pooled connection outlives a short gap
+        coordinator.update_interval = timedelta(seconds=30)
+        coordinator._async_schedule_prewarm()
+        call_later.return_value.assert_called_once()
+        call_later.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_keeps_previous_data_past_deadline_or_on_failure(
+    mock_api_data,
+):
+    """Vehicles not fetched in time, or whose fetch failed, keep their data."""
+    from copy import deepcopy
+
+    first = mock_api_data["data"]["viewer"]["vehicles"][0]["vehicle"]
+    second = deepcopy(first)
+    second["id"] = "second-vehicle-id"
+    details = {"test-vehicle-id": first, "second-vehicle-id": second}
+    deadlines: list[float] = []
+
+    async def _get_data(skip, extras, deadline=None, on_vehicle=None):
+        deadlines.append(deadline)
+        vehicles = []
+        for vehicle_id, vehicle in details.items():
+            listed = {"id": vehicle_id}
+            # The second vehicle's details fail: the list entry comes back
+            fetch_ok = vehicle_id == "test-vehicle-id" or not deadlines[1:]
+            if skip(listed) or not fetch_ok:
+                vehicles.append({"vehicle": listed})
+            else:
+                vehicles.append({"vehicle": {**vehicle, "poll": len(deadlines)}})
+        return {"data": {"viewer": {"vehicles": vehicles}}}
+
+    client = AsyncMock(spec=VolkswagenGoConnectApiClient)
+    client.request_count = 0
+    client.async_get_data = AsyncMock(side_effect=_get_data)
+    coordinator = _coordinator_with_registry(client)
+
+    with (
+        patch("custom_components.volkswagen_goconnect.coordinator.dr.async_get"),
+        patch(
+            "custom_components.volkswagen_goconnect.coordinator.monotonic"
+        ) as monotonic,
+    ):
+        monotonic.return_value = 1000.0
+        coordinator.data = await coordinator._async_update_data()
+        # 80% of the 60 s polling interval
+        assert deadlines[0] == 1048.0
+
+        coordinator._scheduler.reset()
+        coordinator.data = await coordinator._async_update_data()
+        vehicles = vehicles_by_id(coordinator.data)
+        assert vehicles["test-vehicle-id"]["poll"] == 2
+        assert vehicles["second-vehicle-id"]["poll"] == 1
+
+        # Too little time is left to fetch anything
+        coordinator._scheduler.reset()
+        monotonic.side_effect = [2000.0, 2047.0, 2047.0]
+        data = await coordinator._async_update_data()
+        assert vehicles_by_id(data)["test-vehicle-id"]["poll"] == 2
+
+
+@pytest.mark.asyncio
+async def test_coordinator_updates_vehicle_entities_as_they_arrive(mock_api_data):
+    """Each fetched vehicle is patched in and only its entities are updated."""
+    from copy import deepcopy
+
+    first = mock_api_data["data"]["viewer"]["vehicles"][0]["vehicle"]
+    second = deepcopy(first)
+    second["id"] = "second-vehicle-id"
+    fleet = {
+        "data": {"viewer": {"vehicles": [{"vehicle": first}, {"vehicle": second}]}}
+    }
+    refreshed = {**first, "odometer": {"odometer": 15100}}
+    seen: list[int] = []
+
+    async def _get_data(skip, extras, deadline=None, on_vehicle=None):
+        on_vehicle({"vehicle": refreshed})
+        # The second vehicle is still being fetched
+        seen.append(
+            vehicles_by_id(coordinator.data)["test-vehicle-id"]["odometer"]["odometer"]
+        )
+        on_vehicle({"vehicle": second})
+        return {
+            "data": {
+                "viewer": {"vehicles": [{"vehicle": refreshed}, {"vehicle": second}]}
+            }
+        }
+
+    client = AsyncMock(spec=VolkswagenGoConnectApiClient)
+    client.request_count = 0
+    client.async_get_data = AsyncMock(side_effect=_get_data)
+    coordinator = _coordinator_with_registry(client)
+    coordinator.data = fleet
+    first_listener = MagicMock()
+    second_listener = MagicMock()
+    account_listener = MagicMock()
+    coordinator._listeners = {
+        MagicMock(): (first_listener, "test-vehicle-id"),
+        MagicMock(): (second_listener, "second-vehicle-id"),
+        MagicMock(): (account_listener, None),
+    }
+
+    with patch("custom_components.volkswagen_goconnect.coordinator.dr.async_get"):
+        data = await coordinator._async_update_data()
+
+    assert seen == [15100]
+    assert first_listener.call_count == 1
+    assert second_listener.call_count == 1
+    account_listener.assert_not_called()
+    assert vehicles_by_id(data)["test-vehicle-id"] == refreshed
+
+
+@pytest.mark.asyncio
+async def test_coordinator_waits_for_details_of_new_vehicles(mock_api_data):
+    """A new vehicle is left out until its details could be fetched in time."""
+    vehicle = mock_api_data["data"]["viewer"]["vehicles"][0]["vehicle"]
+    fetch_ok = [False, True]
+
+    async def _get_data(skip, extras, deadline=None, on_vehicle=None):
+        listed = {"id": "test-vehicle-id"}
+        if skip(listed) or not fetch_ok.pop(0):
+            entry = {"vehicle": listed}
+        else:
+            entry = {"vehicle": vehicle}
+        return {"data": {"viewer": {"vehicles": [entry]}}}
+
+    client = AsyncMock(spec=VolkswagenGoConnectApiClient)
+    client.request_count = 0
+    client.async_get_data = AsyncMock(side_effect=_get_data)
+    coordinator = _coordinator_with_registry(client)
+
+    with (
+        patch("custom_components.volkswagen_goconnect.coordinator.dr.async_get"),
+        patch(
+            "custom_components.volkswagen_goconnect.coordinator.monotonic"
+        ) as monotonic,
+    ):
+        # Too little time is left to fetch the new vehicle
+        monotonic.side_effect = [1000.0, 1047.0]
+        assert vehicles_by_id(await coordinator._async_update_data()) == {}
+
+        # Its details fail
+        monotonic.side_effect = None
+        monotonic.return_value = 2000.0
+        assert vehicles_by_id(await coordinator._async_update_data()) == {}
+
+        data = await coordinator._async_update_data()
+    assert vehicles_by_id(data) == {"test-vehicle-id": vehicle}
+
+
+@pytest.mark.asyncio
+async def test_coordinator_serves_stale_data_while_circuit_open(mock_api_data):
+    """With the circuit breaker open the last snapshot is kept, marked stale."""
+    client = AsyncMock(spec=VolkswagenGoConnectApiClient)
+    client.request_count = 0
+    client.async_get_data = AsyncMock(
+        side_effect=VolkswagenGoConnectApiClientCircuitOpenError("open")
+    )
+    coordinator = _coordinator_with_registry(client)
+
+    # Nothing to serve yet
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+
+    coordinator.data = mock_api_data
+    assert await coordinator._async_update_data() is mock_api_data
+    assert coordinator.stale
+
+    client.async_get_data = AsyncMock(return_value=mock_api_data)
+    with patch("custom_components.volkswagen_goconnect.coordinator.dr.async_get"):
+        await coordinator._async_update_data()
+    assert not coordinator.stale
+
+
+@pytest.mark.asyncio
+async def test_coordinator_serves_stale_data_on_failed_probe(mock_api_data):
+    """A failed half-open probe keeps the last snapshot, as while open."""
+    client = AsyncMock(spec=VolkswagenGoConnectApiClient)
+    client.request_count = 0
+    client.breaker = CircuitBreaker(open_seconds=60)
+    for _ in range(MIN_REQUESTS):
+        client.breaker.record_failure(0)
+    coordinator = _coordinator_with_registry(client)
+    coordinator.data = mock_api_data
+
+    def _probe(*_args, **_kwargs):
+        assert client.breaker.allow(60)
+        client.breaker.record_failure(60)
+        msg = "down"
+        raise VolkswagenGoConnectApiClientError(msg)
+
+    client.async_get_data = AsyncMock(side_effect=_probe)
+    assert await coordinator._async_update_data() is mock_api_data
+    assert coordinator.stale
+
+    # Once closed again, failures follow the maximum staleness
+    client.breaker = CircuitBreaker()
+    client.async_get_data = AsyncMock(
+        side_effect=VolkswagenGoConnectApiClientError("down")
+    )
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_serves_stale_data_up_to_max_staleness(mock_api_data):
+    """Failed polls keep the last snapshot available until it is too old."""
+    from datetime import datetime
+
+    from custom_components.volkswagen_goconnect.const import CONF_MAX_STALENESS
+
+    client = AsyncMock(spec=VolkswagenGoConnectApiClient)
+    client.request_count = 0
+    client.breaker = CircuitBreaker()
+    client.async_get_data = AsyncMock(return_value=mock_api_data)
+    coordinator = _coordinator_with_registry(client)
+    coordinator.config_entry.data = {}
+    coordinator.config_entry.options = {CONF_MAX_STALENESS: 30}
+    coordinator.async_apply_options()
+
+    start = datetime(2025, 12, 19, 10, 0, tzinfo=dt_util.UTC)
+    with (
+        patch("custom_components.volkswagen_goconnect.coordinator.dr.async_get"),
+        patch(
+            "custom_components.volkswagen_goconnect.coordinator.dt_util.now",
+            return_value=start,
+        ) as now,
+    ):
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.data_age_seconds is None
+
+        client.async_get_data.side_effect = VolkswagenGoConnectApiClientError("down")
+        now.return_value = start + timedelta(minutes=10)
+        assert await coordinator._async_update_data() is coordinator.data
+        assert coordinator.data_age_seconds == 600
+
+        now.return_value = start + timedelta(minutes=31)
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_backs_off_during_outage(mock_api_data, caplog):
+    """Failed polls stretch the interval; the first success restores it."""
+    caplog.set_level("INFO")
+    client = AsyncMock(spec=VolkswagenGoConnectApiClient)
+    client.request_count = 0
+    client.async_get_data = AsyncMock(
+        side_effect=VolkswagenGoConnectApiClientError("down")
+    )
+    coordinator = _coordinator_with_registry(client)
+
+    intervals = []
+    for _ in range(3):
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+        intervals.append(coordinator.update_interval)
+    assert intervals == [timedelta(seconds=seconds) for seconds in (120, 240, 480)]
+
+    client.async_get_data = AsyncMock(return_value=mock_api_data)
+    with patch("custom_components.volkswagen_goconnect.coordinator.dr.async_get"):
+        await coordinator._async_update_data()
+    assert coordinator.update_interval <= timedelta(seconds=60)
+
+    # Entering and leaving the outage is logged once each
+    assert caplog.text.count("backing off") == 1
+    assert caplog.text.count("recovered after 3 failed polls") == 1
+
+
+@pytest.mark.asyncio
+async def test_coordinator_degrades_under_sustained_throttling(mock_api_data):
+    """Sustained throttling skips low-value fields until it has passed."""
+    client = AsyncMock(spec=VolkswagenGoConnectApiClient)
+    client.request_count = 0
+    client.async_get_data = AsyncMock(return_value=mock_api_data)
+    coordinator = _coordinator_with_registry(client)
+    limiter = MagicMock()
+
+    with (
+        patch("custom_components.volkswagen_goconnect.coordinator.dr.async_get"),
+        patch(
+            "custom_components.volkswagen_goconnect.coordinator.get_limiter",
+            return_value=limiter,
+        ),
+    ):
+        extras = []
+        # A single 429 is not enough; three are, and one keeps it degraded
+        for throttled in (1, 3, 1, 0):
+            limiter.throttled.return_value = throttled
+            coordinator.data = await coordinator._async_update_data()
+            extras.append(client.async_get_data.call_args.kwargs["extras"])
+            if throttled == 3:
+                assert coordinator.degraded_reason == "throttling"
+
+    assert extras == [True, False, False, True]
+    assert coordinator.degraded_reason is None
@@ -83,3 +83,113 @@ async def test_device_tracker_attributes_update(mock_api_data):
 
     assert tracker.latitude == -38.0
     assert tracker.longitude == 145.0
+
+
+def _make_tracker(mock_api_data, options=None):
+    """Create a tracker whose state writes are captured."""
+    coordinator = MagicMock()
+    coordinator.data = mock_api_data
+    coordinator.config_entry.options = options or {}
+
+    tracker = VolkswagenGoConnectDeviceTracker(
+        coordinator=coordinator,
+        vehicle=mock_api_data["data"]["viewer"]["vehicles"][0],
+    )
+    tracker.async_write_ha_state = MagicMock()
+    return coordinator, tracker
+
+
+def _report(coordinator, latitude, longitude, *, ignition_on=False):
+    """Replace the coordinator snapshot with a new position report."""
+    data = deepcopy(coordinator.data)
+    vehicle = data["data"]["viewer"]["vehicles"][0]["vehicle"]
+    vehicle["position"]["latitude"] = latitude
+    vehicle["position"]["longitude"] = longitude
+    vehicle["ignition"]["on"] = ignition_on
+    coordinator.data = data
+
+
+def test_haversine_distance():
+    """Test haversine distance against known values."""
+    from custom_components.volkswagen_goconnect.device_tracker import (
+        haversine_distance,
+    )
+
+    assert haversine_distance(-37.8136, 144.9631, -37.8136, 144.9631) == 0
+    # One thousandth of a degree of latitude is roughly 111 metres
+    assert haversine_distance(0.0, 0.0, 0.001, 0.0) == pytest.approx(111.2, abs=0.1)
+    # Melbourne to Sydney
+    assert haversine_distance(-37.8136, 144.9631, -33.8688, 151.2093) == pytest.approx(
+        713_000, rel=0.01
+    )
+
+
+def test_device_tracker_suppresses_parked_jitter(mock_api_data):
+    """Small position changes with the ignition off keep the published position."""
+    coordinator, tracker = _make_tracker(mock_api_data)
+    tracker._handle_coordinator_update()
+
+    # About 10 metres north of the published position
+    _report(coordinator, -37.81351, 144.9631)
+    tracker._handle_coordinator_update()
+
+    assert tracker.latitude == -37.8136
+    assert tracker.longitude == 144.9631
+
+
+def test_device_tracker_parked_goes_unavailable(mock_api_data):
+    """A parked car's tracker still follows failed coordinator updates."""
+    coordinator, tracker = _make_tracker(mock_api_data)
+    coordinator.last_update_success = True
+    tracker._handle_coordinator_update()
+    assert tracker.available
+
+    # The coordinator keeps the old snapshot after a failed poll
+    coordinator.last_update_success = False
+    tracker._handle_coordinator_update()
+
+    assert tracker.async_write_ha_state.call_count == 2
+    assert not tracker.available
+    assert tracker.latitude == -37.8136
+
+
+def test_device_tracker_publishes_real_move_while_parked(mock_api_data):
+    """Moves beyond the threshold propagate even with the ignition off."""
+    coordinator, tracker = _make_tracker(mock_api_data)
+    tracker._handle_coordinator_update()
+
+    # About 110 metres north
+    _report(coordinator, -37.8126, 144.9631)
+    tracker._handle_coordinator_update()
+
+    assert tracker.async_write_ha_state.call_count == 2
+    assert tracker.latitude == -37.8126
+
+
+def test_device_tracker_publishes_every_move_with_ignition_on(mock_api_data):
+    """Any move is published while the ignition is on."""
+    coordinator, tracker = _make_tracker(mock_api_data)
+    tracker._handle_coordinator_update()
+
+    _report(coordinator, -37.81351, 144.9631, ignition_on=True)
+    tracker._handle_coordinator_update()
+
+    assert tracker.async_write_ha_state.call_count == 2
+    assert tracker.latitude == -37.81351
+
+
+def test_device_tracker_threshold_from_options(mock_api_data):
+    """The movement threshold comes from the config entry options."""
+    from custom_components.volkswagen_goconnect.const import (
+        CONF_TRACKER_MIN_DISTANCE,
+    )
+
+    coordinator, tracker = _make_tracker(
+        mock_api_data, options={CONF_TRACKER_MIN_DISTANCE: 0}
+    )
+    tracker._handle_coordinator_update()
+
+    _report(coordinator, -37.81351, 144.9631)
+    tracker._handle_coordinator_update()
+
+    assert tracker.async_write_ha_state.call_count == 2
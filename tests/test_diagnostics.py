@@ -0,0 +1,59 @@
+"""Tests for the diagnostics."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+
+from custom_components.volkswagen_goconnect.api import VolkswagenGoConnectApiClient
+from custom_components.volkswagen_goconnect.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+
+@pytest.mark.asyncio
+async def test_config_entry_diagnostics(hass: HomeAssistant, mock_api_data):
+    """Test the diagnostics report client and coordinator state, redacted."""
+    client = VolkswagenGoConnectApiClient(session=MagicMock())
+    client.request_count = 12
+    client.coalesced_count = 3
+    client.timeouts.observe("Vehicle", 0.2)
+    coordinator = MagicMock()
+    coordinator.data = mock_api_data
+    coordinator.stale = True
+    coordinator.data_age_seconds = 300
+    coordinator.degraded_reason = "throttling"
+    coordinator.missed_deadlines = 0
+    entry = MagicMock()
+    entry.data = {
+        CONF_EMAIL: "user@example.com",
+        CONF_PASSWORD: "secret",
+        "device_token": "token",
+    }
+    entry.options = {"polling_interval": 5}
+    entry.runtime_data.client = client
+    entry.runtime_data.coordinator = coordinator
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["entry"]["data"] == {
+        CONF_EMAIL: REDACTED,
+        CONF_PASSWORD: REDACTED,
+        "device_token": REDACTED,
+    }
+    assert diagnostics["entry"]["options"] == {"polling_interval": 5}
+    assert diagnostics["client"] == {
+        "requests": 12,
+        "coalesced_requests": 3,
+        "timeouts": {"Vehicle": 10.0},
+        "circuit_breaker": {"state": "closed", "failure_rate": 0.0},
+    }
+    assert diagnostics["coordinator"] == {
+        "vehicles": 1,
+        "stale": True,
+        "data_age_seconds": 300,
+        "degraded_reason": "throttling",
+        "missed_deadlines": 0,
+    }
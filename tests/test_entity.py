@@ -22,6 +22,8 @@ async def test_entity_unique_id(mock_api_data):
 
     # Verify unique_id
     assert entity._attr_unique_id == "test-vehicle-id"
+    # Vehicle entities listen for updates of their own vehicle
+    assert entity.coordinator_context == "test-vehicle-id"
 
 
 @pytest.mark.asyncio
@@ -37,3 +39,112 @@ async def test_entity_attribution():
 
     # Verify attribution
     assert entity._attr_attribution == ATTRIBUTION
+
+
+@pytest.mark.asyncio
+async def test_entity_device_info_serial_number(mock_api_data):
+    """Test the VIN is exposed through the device registry."""
+    coordinator = MagicMock()
+    vehicle_data = mock_api_data["data"]["viewer"]["vehicles"][0]
+
+    entity = VolkswagenGoConnectEntity(coordinator=coordinator, vehicle=vehicle_data)
+
+    assert entity._attr_device_info["serial_number"] == "TEST123VIN"
+    assert entity._attr_device_info["manufacturer"] == "Volkswagen"
+
+
+def _second_vehicle(mock_api_data, vehicle_id="second-vehicle-id", plate="XYZ789"):
+    """Return a copy of the fixture vehicle with a different identity."""
+    from copy import deepcopy
+
+    vehicle = deepcopy(mock_api_data["data"]["viewer"]["vehicles"][0])
+    vehicle["vehicle"]["id"] = vehicle_id
+    vehicle["vehicle"]["licensePlate"] = plate
+    return vehicle
+
+
+def test_add_vehicle_entities_adds_new_vehicles(mock_api_data):
+    """Entities are added for vehicles that appear after setup."""
+    from custom_components.volkswagen_goconnect.entity import (
+        async_add_vehicle_entities,
+    )
+
+    coordinator = MagicMock()
+    coordinator.data = mock_api_data
+    entry = MagicMock()
+    entry.runtime_data.coordinator = coordinator
+
+    added = []
+    async_add_vehicle_entities(
+        entry,
+        lambda entities: added.extend(entities),
+        lambda vehicle: [vehicle["vehicle"]["id"]],
+    )
+    assert added == ["test-vehicle-id"]
+    listener = coordinator.async_add_listener.call_args[0][0]
+    entry.async_on_unload.assert_called_once()
+
+    # An unchanged fleet adds nothing
+    listener()
+    assert added == ["test-vehicle-id"]
+
+    # A new vehicle only adds its own entities
+    coordinator.data["data"]["viewer"]["vehicles"].append(
+        _second_vehicle(mock_api_data)
+    )
+    listener()
+    assert added == ["test-vehicle-id", "second-vehicle-id"]
+
+
+def test_add_vehicle_entities_readds_returning_vehicle(mock_api_data):
+    """A vehicle that left and came back gets its entities again."""
+    from custom_components.volkswagen_goconnect.entity import (
+        async_add_vehicle_entities,
+    )
+
+    second = _second_vehicle(mock_api_data)
+    coordinator = MagicMock()
+    coordinator.data = mock_api_data
+    coordinator.data["data"]["viewer"]["vehicles"].append(second)
+    entry = MagicMock()
+    entry.runtime_data.coordinator = coordinator
+
+    added = []
+    async_add_vehicle_entities(
+        entry,
+        lambda entities: added.extend(entities),
+        lambda vehicle: [vehicle["vehicle"]["id"]],
+    )
+    listener = coordinator.async_add_listener.call_args[0][0]
+
+    coordinator.data["data"]["viewer"]["vehicles"].remove(second)
+    listener()
+    coordinator.data["data"]["viewer"]["vehicles"].append(second)
+    listener()
+
+    assert added == ["test-vehicle-id", "second-vehicle-id", "second-vehicle-id"]
+
+
+def test_add_vehicle_entities_retries_empty_factory(mock_api_data):
+    """A vehicle without entities yet is retried on the next update."""
+    from custom_components.volkswagen_goconnect.entity import (
+        async_add_vehicle_entities,
+    )
+
+    coordinator = MagicMock()
+    coordinator.data = mock_api_data
+    entry = MagicMock()
+    entry.runtime_data.coordinator = coordinator
+    ready = False
+
+    added = []
+    async_add_vehicle_entities(
+        entry,
+        lambda entities: added.extend(entities),
+        lambda vehicle: [vehicle["vehicle"]["id"]] if ready else [],
+    )
+    assert added == []
+
+    ready = True
+    coordinator.async_add_listener.call_args[0][0]()
+    assert added == ["test-vehicle-id"]
@@ -1,164 +1,146 @@
 """Tests for the hub."""
 
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.core import HomeAssistant
 
-from custom_components.volkswagen_goconnect.hub import VolkswagenGoConnectHub
-
-
-@pytest.mark.asyncio
-async def test_hub_initialization():
-    """Test hub initialization."""
-    hass = MagicMock(spec=HomeAssistant)
-
-    with (
-        patch(
-            "custom_components.volkswagen_goconnect.hub.async_get_clientsession"
-        ) as mock_session,
-        patch(
-            "custom_components.volkswagen_goconnect.hub.DataUpdateCoordinator"
-        ) as mock_coordinator,
-    ):
-        mock_session.return_value = MagicMock()
-        mock_coordinator.return_value = MagicMock()
-
-        hub = VolkswagenGoConnectHub(
-            hass=hass,
-            email="test@example.com",
-            password="password123",
-            polling_interval=60,
-        )
-
-        assert hub._email == "test@example.com"
-        assert hub._password == "password123"
-        assert hub._polling_interval == 60
-        assert hub._api_client is not None
-        assert hub.coordinator is not None
-
-
-@pytest.mark.asyncio
-async def test_hub_update():
-    """Test hub update method."""
-    hass = MagicMock(spec=HomeAssistant)
-
-    with (
-        patch(
-            "custom_components.volkswagen_goconnect.hub.async_get_clientsession"
-        ) as mock_session,
-        patch(
-            "custom_components.volkswagen_goconnect.hub.DataUpdateCoordinator"
-        ) as mock_coordinator,
-    ):
-        mock_session.return_value = MagicMock()
-        mock_coordinator.return_value = MagicMock()
-
-        hub = VolkswagenGoConnectHub(
-            hass=hass,
-            email="test@example.com",
-            password="password123",
-            polling_interval=60,
-        )
-
-        result = await hub.update()
-
-        assert result is not None
-        assert isinstance(result, dict)
-        assert "dummy" in result
-        assert result["dummy"] == "data"
-
-
-@pytest.mark.asyncio
-async def test_hub_authenticate():
-    """Test hub authenticate method."""
-    hass = MagicMock(spec=HomeAssistant)
-
-    with (
-        patch(
-            "custom_components.volkswagen_goconnect.hub.async_get_clientsession"
-        ) as mock_session,
-        patch(
-            "custom_components.volkswagen_goconnect.hub.DataUpdateCoordinator"
-        ) as mock_coordinator,
-    ):
-        mock_session.return_value = MagicMock()
-        mock_coordinator.return_value = MagicMock()
-
-        hub = VolkswagenGoConnectHub(
-            hass=hass,
-            email="test@example.com",
-            password="password123",
-            polling_interval=60,
-        )
-
-        # Mock the API client's login method
-        hub._api_client.login = AsyncMock()
-
-        await hub.authenticate()
-
-        hub._api_client.login.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_hub_coordinator_setup():
-    """Test hub coordinator is properly configured."""
-    hass = MagicMock(spec=HomeAssistant)
-
-    with (
-        patch(
-            "custom_components.volkswagen_goconnect.hub.async_get_clientsession"
-        ) as mock_session,
-        patch(
-            "custom_components.volkswagen_goconnect.hub.DataUpdateCoordinator"
-        ) as mock_coordinator_class,
+from custom_components.volkswagen_goconnect.api import VolkswagenGoConnectApiClient
+from custom_components.volkswagen_goconnect.coordinator import (
+    VolkswagenGoConnectDataUpdateCoordinator,
+)
+from custom_components.volkswagen_goconnect.hub import (
+    VolkswagenGoConnectHub,
+    async_get_hub,
+)
+
+NOW = datetime(2025, 12, 19, 10, 30, tzinfo=UTC)
+
+
+def _coordinator() -> MagicMock:
+    coordinator = MagicMock()
+    coordinator.budget.economy.return_value = False
+    return coordinator
+
+
+def test_async_get_hub_is_shared(hass: HomeAssistant):
+    """Test every config entry gets the same hub."""
+    assert async_get_hub(hass) is async_get_hub(hass)
+
+
+def test_hub_owner_hands_over():
+    """Test the first account listing a vehicle owns it until it drops it."""
+    hub = VolkswagenGoConnectHub()
+    unregister_a = hub.async_register("a", _coordinator())
+    unregister_b = hub.async_register("b", _coordinator())
+
+    hub.async_update_listing("a", {"shared", "own"})
+    hub.async_update_listing("b", {"shared"})
+    assert hub.owner("shared") == "a"
+    assert hub.owner("own") == "a"
+
+    hub.async_update_listing("a", {"own"})
+    assert hub.owner("shared") == "b"
+
+    unregister_a()
+    unregister_b()
+    assert hub.owner("shared") is None
+    assert hub.owner("own") is None
+
+
+def test_hub_fetcher_prefers_owner_with_budget():
+    """Test a shared vehicle is fetched by the owner unless its budget runs low."""
+    hub = VolkswagenGoConnectHub()
+    owner = _coordinator()
+    hub.async_register("a", owner)
+    hub.async_register("b", _coordinator())
+    hub.async_update_listing("a", {"shared", "own"})
+    hub.async_update_listing("b", {"shared"})
+
+    assert hub.fetcher("shared", "b", NOW) == "a"
+    assert hub.fetcher("own", "a", NOW) == "a"
+    # A vehicle only this account lists is always fetched by it
+    assert hub.fetcher("other", "b", NOW) == "b"
+
+    owner.budget.economy.return_value = True
+    assert hub.fetcher("shared", "b", NOW) == "b"
+
+
+def test_hub_publish_fans_out_shared_vehicles():
+    """Test fetched shared vehicles are handed to the other accounts."""
+    hub = VolkswagenGoConnectHub()
+    other = _coordinator()
+    hub.async_register("a", _coordinator())
+    hub.async_register("b", other)
+    hub.async_update_listing("a", {"shared", "own"})
+    hub.async_update_listing("b", {"shared"})
+
+    shared = {"id": "shared"}
+    hub.async_publish("a", {"shared": shared, "own": {"id": "own"}}, NOW)
+
+    other.async_receive_shared_vehicles.assert_called_once_with({"shared": shared}, NOW)
+    assert hub.snapshot("shared") == (shared, NOW)
+
+
+def _hub_coordinator(hub, entry_id, vehicles, fetched):
+    """Create a coordinator of an account listing the given vehicles."""
+
+    async def _get_data(skip, extras, deadline=None, on_vehicle=None):
+        entries = []
+        for vehicle in vehicles:
+            if skip({"id": vehicle["id"]}):
+                entries.append({"vehicle": {"id": vehicle["id"]}})
+            else:
+                fetched.append((entry_id, vehicle["id"]))
+                entries.append({"vehicle": vehicle})
+        return {"data": {"viewer": {"vehicles": entries}}}
+
+    client = AsyncMock(spec=VolkswagenGoConnectApiClient)
+    client.request_count = 0
+    client.async_get_data = AsyncMock(side_effect=_get_data)
+    with patch(
+        "custom_components.volkswagen_goconnect.coordinator.DataUpdateCoordinator.__init__",
+        return_value=None,
     ):
-        mock_session.return_value = MagicMock()
-        mock_coordinator = MagicMock()
-        mock_coordinator_class.return_value = mock_coordinator
-
-        hub = VolkswagenGoConnectHub(
-            hass=hass,
-            email="test@example.com",
-            password="password123",
-            polling_interval=120,
+        coordinator = VolkswagenGoConnectDataUpdateCoordinator(
+            hass=MagicMock(spec=HomeAssistant),
+            client=client,
+            update_interval=timedelta(seconds=60),
+            hub=hub,
         )
-
-        # Verify coordinator was created with correct params
-        assert hub.coordinator is not None
-        mock_coordinator_class.assert_called_once()
+    coordinator.hass = MagicMock()
+    coordinator.config_entry = MagicMock()
+    coordinator.config_entry.entry_id = entry_id
+    coordinator.async_update_listeners = MagicMock()
+    coordinator.async_update_vehicle_listeners = MagicMock()
+    hub.async_register(entry_id, coordinator)
+    return coordinator
 
 
 @pytest.mark.asyncio
-async def test_hub_with_different_polling_intervals():
-    """Test hub with different polling intervals."""
-    hass = MagicMock(spec=HomeAssistant)
-
-    with (
-        patch(
-            "custom_components.volkswagen_goconnect.hub.async_get_clientsession"
-        ) as mock_session,
-        patch(
-            "custom_components.volkswagen_goconnect.hub.DataUpdateCoordinator"
-        ) as mock_coordinator,
-    ):
-        mock_session.return_value = MagicMock()
-        mock_coordinator.return_value = MagicMock()
-
-        # Test with 10 seconds
-        hub1 = VolkswagenGoConnectHub(
-            hass=hass,
-            email="test@example.com",
-            password="password123",
-            polling_interval=10,
-        )
-        assert hub1._polling_interval == 10
-
-        # Test with 3600 seconds
-        hub2 = VolkswagenGoConnectHub(
-            hass=hass,
-            email="test2@example.com",
-            password="password456",
-            polling_interval=3600,
-        )
-        assert hub2._polling_interval == 3600
+async def test_shared_vehicle_is_fetched_once(mock_api_data):
+    """Test a vehicle listed by two accounts is fetched by one of them only."""
+    vehicle = mock_api_data["data"]["viewer"]["vehicles"][0]["vehicle"]
+    hub = VolkswagenGoConnectHub()
+    fetched: list[tuple[str, str]] = []
+    personal = _hub_coordinator(hub, "personal", [vehicle], fetched)
+    fleet = _hub_coordinator(hub, "fleet", [vehicle], fetched)
+
+    with patch("custom_components.volkswagen_goconnect.coordinator.dr.async_get"):
+        personal.data = await personal._async_update_data()
+        fleet.data = await fleet._async_update_data()
+
+    assert fetched == [("personal", vehicle["id"])]
+    assert fleet.data == personal.data
+    assert personal.owns(vehicle["id"])
+    assert not fleet.owns(vehicle["id"])
+
+    # A later refresh through the owner is handed to the other account
+    refreshed = {**vehicle, "odometer": {"odometer": 15100}}
+    personal.client.async_get_vehicle = AsyncMock(return_value=refreshed)
+    personal._pending_vehicle_refresh = {vehicle["id"]}
+    await personal._async_refresh_pending_vehicles()
+
+    assert fleet.data["data"]["viewer"]["vehicles"][0]["vehicle"] == refreshed
+    fleet.async_update_listeners.assert_called_once()
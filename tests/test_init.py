@@ -33,7 +33,7 @@ async def test_async_setup_entry_success(hass: HomeAssistant):
             "custom_components.volkswagen_goconnect.async_get_integration"
         ) as mock_integration,
         patch(
-            "custom_components.volkswagen_goconnect.async_get_clientsession"
+            "custom_components.volkswagen_goconnect.async_get_session"
         ) as mock_session,
         patch(
             "custom_components.volkswagen_goconnect.VolkswagenGoConnectApiClient"
@@ -51,6 +51,7 @@ async def test_async_setup_entry_success(hass: HomeAssistant):
 
         mock_coordinator = AsyncMock()
         mock_coordinator.async_config_entry_first_refresh = AsyncMock()
+        mock_coordinator.async_apply_options = MagicMock()
         mock_coordinator_class.return_value = mock_coordinator
 
         hass.config_entries = MagicMock()
@@ -80,7 +81,7 @@ async def test_async_setup_entry_with_options(hass: HomeAssistant):
 
     with (
         patch("custom_components.volkswagen_goconnect.async_get_integration"),
-        patch("custom_components.volkswagen_goconnect.async_get_clientsession"),
+        patch("custom_components.volkswagen_goconnect.async_get_session"),
         patch(
             "custom_components.volkswagen_goconnect.VolkswagenGoConnectApiClient"
         ) as mock_client_class,
@@ -94,6 +95,7 @@ async def test_async_setup_entry_with_options(hass: HomeAssistant):
 
         mock_coordinator = AsyncMock()
         mock_coordinator.async_config_entry_first_refresh = AsyncMock()
+        mock_coordinator.async_apply_options = MagicMock()
         mock_coordinator_class.return_value = mock_coordinator
 
         hass.config_entries = MagicMock()
@@ -121,7 +123,7 @@ async def test_async_setup_entry_login_failure(hass: HomeAssistant):
 
     with (
         patch("custom_components.volkswagen_goconnect.async_get_integration"),
-        patch("custom_components.volkswagen_goconnect.async_get_clientsession"),
+        patch("custom_components.volkswagen_goconnect.async_get_session"),
         patch(
             "custom_components.volkswagen_goconnect.VolkswagenGoConnectApiClient"
         ) as mock_client_class,
@@ -135,6 +137,7 @@ async def test_async_setup_entry_login_failure(hass: HomeAssistant):
 
         mock_coordinator = AsyncMock()
         mock_coordinator.async_config_entry_first_refresh = AsyncMock()
+        mock_coordinator.async_apply_options = MagicMock()
         mock_coordinator_class.return_value = mock_coordinator
 
         hass.config_entries = MagicMock()
@@ -175,3 +178,85 @@ async def test_async_reload_entry(hass: HomeAssistant):
     await async_reload_entry(hass, entry)
 
     hass.config_entries.async_reload.assert_called_once_with("test-entry-id")
+
+
+@pytest.mark.asyncio
+async def test_async_remove_config_entry_device(hass: HomeAssistant, mock_api_data):
+    """Only devices of vehicles that left the account can be removed."""
+    from custom_components.volkswagen_goconnect import (
+        async_remove_config_entry_device,
+    )
+
+    entry = MagicMock(spec=ConfigEntry)
+    entry.runtime_data = MagicMock()
+    entry.runtime_data.coordinator.data = mock_api_data
+
+    current = MagicMock()
+    current.identifiers = {("volkswagen_goconnect", "test-vehicle-id")}
+    departed = MagicMock()
+    departed.identifiers = {("volkswagen_goconnect", "old-vehicle-id")}
+
+    assert await async_remove_config_entry_device(hass, entry, current) is False
+    assert await async_remove_config_entry_device(hass, entry, departed) is True
+
+
+def _loaded_entry(options=None):
+    """Return an entry that looks set up with the given options."""
+    from custom_components.volkswagen_goconnect import _credentials
+
+    entry = MagicMock(spec=ConfigEntry)
+    entry.entry_id = "test-entry-id"
+    entry.data = {
+        CONF_EMAIL: "test@example.com",
+        "device_token": "test-token",
+        CONF_POLLING_INTERVAL: 60,
+    }
+    entry.options = options or {}
+    entry.runtime_data = MagicMock()
+    entry.runtime_data.credentials = _credentials(entry)
+    return entry
+
+
+@pytest.mark.asyncio
+async def test_update_listener_applies_options_live(hass: HomeAssistant):
+    """Option changes are applied to the running coordinator."""
+    from custom_components.volkswagen_goconnect import async_update_listener
+
+    entry = _loaded_entry()
+    entry.options = {CONF_POLLING_INTERVAL: 300}
+    hass.config_entries = MagicMock()
+    hass.config_entries.async_reload = AsyncMock()
+
+    await async_update_listener(hass, entry)
+
+    entry.runtime_data.coordinator.async_apply_options.assert_called_once()
+    hass.config_entries.async_reload.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_listener_reloads_on_credential_change(hass: HomeAssistant):
+    """A new device token reloads the entry."""
+    from custom_components.volkswagen_goconnect import async_update_listener
+
+    entry = _loaded_entry()
+    entry.data = {**entry.data, "device_token": "new-token"}
+    hass.config_entries = MagicMock()
+    hass.config_entries.async_reload = AsyncMock()
+
+    await async_update_listener(hass, entry)
+
+    hass.config_entries.async_reload.assert_called_once_with("test-entry-id")
+    entry.runtime_data.coordinator.async_apply_options.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_setup_registers_services(hass: HomeAssistant):
+    """Test the integration services are registered on setup."""
+    from custom_components.volkswagen_goconnect import async_setup
+
+    with patch(
+        "custom_components.volkswagen_goconnect.async_setup_services"
+    ) as mock_setup_services:
+        assert await async_setup(hass, {}) is True
+
+    mock_setup_services.assert_called_once_with(hass)
@@ -0,0 +1,56 @@
+"""Tests for the adaptive request timeouts."""
+
+import random
+
+import pytest
+
+from custom_components.volkswagen_goconnect.latency import (
+    DEFAULT_TIMEOUT_SECONDS,
+    MAX_TIMEOUT_SECONDS,
+    MIN_SAMPLES,
+    MIN_TIMEOUT_SECONDS,
+    TIMEOUT_FACTOR,
+    AdaptiveTimeouts,
+    P2Quantile,
+)
+
+
+def test_p2_quantile_tracks_exact_quantile():
+    """The P² estimate stays close to the exact quantile of the stream."""
+    rng = random.Random(42)  # noqa: S311
+    samples = [rng.lognormvariate(-1, 0.5) for _ in range(5000)]
+    estimator = P2Quantile(0.99)
+    for sample in samples:
+        estimator.observe(sample)
+
+    exact = sorted(samples)[int(0.99 * len(samples))]
+    assert estimator.count == len(samples)
+    assert estimator.value == pytest.approx(exact, rel=0.1)
+
+
+def test_p2_quantile_with_few_samples():
+    """Before five samples the estimate is taken from the sorted samples."""
+    estimator = P2Quantile(0.5)
+    assert estimator.value is None
+
+    for sample in (3.0, 1.0, 2.0):
+        estimator.observe(sample)
+    assert estimator.value == 2.0
+
+
+def test_adaptive_timeouts_follow_latency():
+    """Timeouts are a multiple of the p99 latency once enough samples exist."""
+    timeouts = AdaptiveTimeouts()
+    assert timeouts.timeout("Vehicle") == DEFAULT_TIMEOUT_SECONDS
+
+    for _ in range(MIN_SAMPLES):
+        timeouts.observe("Vehicle", 1.0)
+        timeouts.observe("VehiclesType", 0.1)
+        timeouts.observe("login", 20.0)
+
+    assert timeouts.timeout("Vehicle") == pytest.approx(1.0 * TIMEOUT_FACTOR)
+    # Clamped to the bounds
+    assert timeouts.timeout("VehiclesType") == MIN_TIMEOUT_SECONDS
+    assert timeouts.timeout("login") == MAX_TIMEOUT_SECONDS
+    # Other operations are unaffected
+    assert timeouts.timeout("VehicleSystemOverview") == DEFAULT_TIMEOUT_SECONDS
@@ -0,0 +1,103 @@
+"""Tests for the shared request limiter."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.volkswagen_goconnect.limiter import (
+    Priority,
+    RequestLimiter,
+    get_limiter,
+)
+
+
+def test_get_limiter_is_shared_per_host():
+    """Test every account gets the same limiter for the same host."""
+    assert get_limiter("api.example.com") is get_limiter("api.example.com")
+    assert get_limiter("api.example.com") is not get_limiter("auth.example.com")
+
+
+@pytest.mark.asyncio
+async def test_limiter_spaces_requests():
+    """Test consecutive requests are spaced by the minimum interval."""
+    limiter = RequestLimiter(min_interval=0.05)
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    for _ in range(3):
+        await limiter.acquire("account")
+
+    assert loop.time() - start >= 0.1
+
+
+@pytest.mark.asyncio
+async def test_limiter_round_robin_between_accounts():
+    """Test a busy account cannot starve the others."""
+    limiter = RequestLimiter(min_interval=0.01)
+    order: list[str] = []
+
+    async def request(account: str) -> None:
+        await limiter.acquire(account)
+        order.append(account)
+
+    # Take the free slot so every later request has to queue
+    await limiter.acquire("busy")
+    tasks = [asyncio.create_task(request("busy")) for _ in range(4)]
+    await asyncio.sleep(0)
+    tasks += [asyncio.create_task(request("quiet")) for _ in range(2)]
+    await asyncio.gather(*tasks)
+
+    assert order == ["busy", "quiet", "busy", "quiet", "busy", "busy"]
+    assert limiter.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_skips_cancelled_waiters():
+    """Test a cancelled request does not use up a slot."""
+    limiter = RequestLimiter(min_interval=0.01)
+    await limiter.acquire("a")
+    cancelled = asyncio.create_task(limiter.acquire("a"))
+    waiting = asyncio.create_task(limiter.acquire("b"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    await asyncio.wait_for(waiting, 1)
+
+    assert limiter.waiting == 0
+
+
+def test_limiter_counts_throttled_requests():
+    """Throttled requests are counted within a time window."""
+    limiter = RequestLimiter()
+    with patch(
+        "custom_components.volkswagen_goconnect.limiter.time.monotonic",
+        side_effect=[100.0, 500.0, 900.0, 1000.0],
+    ):
+        limiter.record_throttled()
+        limiter.record_throttled()
+        limiter.record_throttled()
+        assert limiter.throttled(600) == 2
+
+
+@pytest.mark.asyncio
+async def test_limiter_interactive_requests_go_first():
+    """Test an interactive request gets the next slot despite a busy queue."""
+    limiter = RequestLimiter(min_interval=0.01)
+    order: list[str] = []
+
+    async def request(account: str, priority: Priority, label: str) -> None:
+        await limiter.acquire(account, priority)
+        order.append(label)
+
+    await limiter.acquire("fleet")
+    tasks = [
+        asyncio.create_task(request("fleet", Priority.TELEMETRY, "poll"))
+        for _ in range(3)
+    ]
+    tasks.append(asyncio.create_task(request("fleet", Priority.ANALYTICS, "prewarm")))
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(request("user", Priority.INTERACTIVE, "refresh")))
+    await asyncio.gather(*tasks)
+
+    assert order == ["refresh", "poll", "poll", "poll", "prewarm"]
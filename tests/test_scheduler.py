@@ -0,0 +1,358 @@
+"""Tests for the poll scheduler."""
+
+from datetime import UTC, datetime, time, timedelta
+
+from custom_components.volkswagen_goconnect.scheduler import (
+    CHARGING_INTERVAL,
+    DRIVING_INTERVAL,
+    MAX_OUTAGE_INTERVAL,
+    MIN_WAKEUP_INTERVAL,
+    OFF_HOURS_INTERVAL,
+    PARKED_INTERVAL,
+    SNOOZE_RECHECK_INTERVAL,
+    PollScheduler,
+    RequestBudget,
+    UpstreamCadence,
+    in_quiet_hours,
+    jittered,
+    outage_backoff,
+    outside_work_hours,
+    quiet_hours_end,
+    snoozed_until,
+    stagger_offset,
+    telemetry_time,
+    vehicle_poll_interval,
+)
+
+BASE = timedelta(seconds=60)
+NOW = datetime(2025, 12, 19, 10, 30, tzinfo=UTC)
+
+
+def test_interval_driving():
+    """A vehicle with the ignition on is polled at the driving interval."""
+    vehicle = {"ignition": {"on": True}, "isCharging": True}
+
+    assert vehicle_poll_interval(vehicle, BASE) == DRIVING_INTERVAL
+    # A shorter configured interval wins while driving
+    assert vehicle_poll_interval(vehicle, timedelta(seconds=20)) == timedelta(
+        seconds=20
+    )
+
+
+def test_interval_parked():
+    """A parked vehicle is polled at the long interval."""
+    assert vehicle_poll_interval({"ignition": {"on": False}}, BASE) == PARKED_INTERVAL
+    assert vehicle_poll_interval({}, timedelta(hours=1)) == timedelta(hours=1)
+
+
+def test_interval_charging_tightens():
+    """A charging vehicle is polled more often as 80 percent approaches."""
+    charging = {"isCharging": True, "chargingStatus": {}}
+    assert vehicle_poll_interval(charging, BASE) == CHARGING_INTERVAL
+
+    charging["chargingStatus"]["timeUntil80PercentCharge"] = 120
+    assert vehicle_poll_interval(charging, BASE) == CHARGING_INTERVAL
+
+    charging["chargingStatus"]["timeUntil80PercentCharge"] = 8
+    assert vehicle_poll_interval(charging, BASE) == timedelta(minutes=2)
+
+    charging["chargingStatus"]["timeUntil80PercentCharge"] = 0
+    assert vehicle_poll_interval(charging, BASE) == DRIVING_INTERVAL
+
+
+def test_scheduler_due_and_wakeup():
+    """Only vehicles whose interval elapsed are due."""
+    scheduler = PollScheduler(BASE)
+    assert scheduler.due({"a", "b"}, NOW) == {"a", "b"}
+    assert scheduler.next_wakeup(NOW) == BASE
+
+    scheduler.record("a", {"ignition": {"on": True}}, NOW)
+    scheduler.record("b", {}, NOW)
+
+    assert scheduler.next_poll("a") == NOW + DRIVING_INTERVAL
+    assert scheduler.next_wakeup(NOW) == DRIVING_INTERVAL
+    assert scheduler.due({"a", "b"}, NOW) == set()
+    assert scheduler.due({"a", "b"}, NOW + DRIVING_INTERVAL) == {"a"}
+    assert scheduler.due({"a", "b"}, NOW + PARKED_INTERVAL) == {"a", "b"}
+    assert scheduler.next_wakeup(NOW + DRIVING_INTERVAL) == MIN_WAKEUP_INTERVAL
+
+
+def test_scheduler_retain_and_reset():
+    """Departed vehicles are forgotten and a reset makes everything due."""
+    scheduler = PollScheduler(BASE)
+    scheduler.record("a", {}, NOW)
+    scheduler.record("b", {}, NOW)
+
+    scheduler.retain({"a"})
+    assert scheduler.next_poll("b") is None
+    assert scheduler.due({"a"}, NOW) == set()
+
+    scheduler.reset()
+    assert scheduler.due({"a"}, NOW) == {"a"}
+
+
+def _telemetry(update: datetime, *, on: bool = True) -> dict:
+    """Return a vehicle whose telemetry was last updated at a given time."""
+    return {
+        "ignition": {"on": on, "time": update.isoformat()},
+        "odometer": {
+            "odometer": 1,
+            "time": (update - timedelta(minutes=1)).isoformat(),
+        },
+    }
+
+
+def test_telemetry_time():
+    """The latest telemetry time is the upstream update time."""
+    assert telemetry_time(_telemetry(NOW)) == NOW
+    assert telemetry_time({"odometer": {"time": "2025-12-19T10:30:00Z"}}) == NOW
+    assert telemetry_time({"odometer": {"time": "garbage"}, "ignition": None}) is None
+
+
+def test_cadence_period_and_phase_lock():
+    """Polls are moved to just after the expected upstream update."""
+    cadence = UpstreamCadence()
+    assert cadence.phase_lock(NOW, NOW + BASE) == NOW + BASE
+
+    for minute in (0, 2, 4, 6):
+        cadence.observe(NOW + timedelta(minutes=minute))
+    cadence.observe(NOW + timedelta(minutes=6))
+    assert cadence.period == timedelta(minutes=2)
+
+    now = NOW + timedelta(minutes=6, seconds=20)
+    # Nothing new arrives before 08:10, so a poll at 07:20 is pushed back
+    assert cadence.phase_lock(now, now + BASE) == NOW + timedelta(minutes=8, seconds=10)
+    # A poll planned after several updates lands just after the last of them
+    assert cadence.phase_lock(now, now + timedelta(minutes=5)) == NOW + timedelta(
+        minutes=10, seconds=10
+    )
+    # An overdue update leaves the plan alone
+    late = NOW + timedelta(minutes=8, seconds=30)
+    assert cadence.phase_lock(late, late + BASE) == late + BASE
+
+
+def test_cadence_ignores_outlier_gaps():
+    """Gaps from parked periods do not count towards the period."""
+    cadence = UpstreamCadence()
+    for update in (0, 1, 120):
+        cadence.observe(NOW + timedelta(minutes=update))
+    assert cadence.period is None
+
+    cadence.observe(NOW + timedelta(minutes=121))
+    assert cadence.period == timedelta(minutes=1)
+
+
+def test_scheduler_phase_locks_polls():
+    """The scheduler follows the upstream cadence of each vehicle."""
+    scheduler = PollScheduler(BASE)
+    for minute in (0, 1, 2):
+        update = NOW + timedelta(minutes=minute)
+        scheduler.record("a", _telemetry(update), update + timedelta(seconds=5))
+
+    assert scheduler.upstream_period("a") == timedelta(minutes=1)
+    assert scheduler.next_poll("a") == NOW + timedelta(minutes=3, seconds=10)
+
+    # Parking restarts the estimate
+    parked = NOW + timedelta(minutes=3)
+    scheduler.record("a", _telemetry(parked, on=False), parked)
+    assert scheduler.upstream_period("a") is None
+    assert scheduler.next_poll("a") == parked + PARKED_INTERVAL
+
+    scheduler.retain(set())
+    assert scheduler.upstream_period("a") is None
+
+
+def test_budget_counts_and_rolls_windows():
+    """Requests are counted per window from the running total."""
+    budget = RequestBudget(limit=100, period="hour")
+    budget.record(5, NOW)
+    assert budget.used == 0
+    assert budget.window_start == NOW.replace(minute=0)
+
+    budget.record(25, NOW + timedelta(minutes=10))
+    assert budget.used == 20
+
+    budget.record(30, NOW + timedelta(minutes=31))
+    assert budget.used == 5
+    assert budget.window_start == NOW.replace(hour=11, minute=0)
+
+
+def test_budget_stretches_and_economises():
+    """Polling slows down and skips extras when the budget runs short."""
+    budget = RequestBudget(limit=100, period="hour")
+    start = NOW.replace(minute=0)
+    budget.record(0, start)
+    budget.record(20, start + timedelta(minutes=30))
+
+    # 40 projected requests fit the budget
+    assert budget.stretch(BASE, start + timedelta(minutes=30)) == BASE
+    assert not budget.economy(start + timedelta(minutes=30))
+    assert budget.projected_exhaustion(start + timedelta(minutes=30)) is None
+
+    budget.record(80, start + timedelta(minutes=30))
+    # 160 projected requests: stretch by 1.6 and skip low-value fields
+    now = start + timedelta(minutes=30)
+    assert budget.stretch(BASE, now) == BASE * 1.6
+    assert budget.economy(now)
+    assert budget.projected_exhaustion(now) == now + timedelta(seconds=450)
+
+    budget.record(100, now)
+    assert budget.exhausted()
+    assert budget.projected_exhaustion(now) == now
+    assert budget.stretch(BASE, now) == timedelta(minutes=30)
+
+
+def test_budget_unlimited():
+    """Without a limit requests are only counted."""
+    budget = RequestBudget()
+    budget.record(0, NOW)
+    budget.record(5000, NOW)
+
+    assert budget.used == 5000
+    assert budget.stretch(BASE, NOW) == BASE
+    assert not budget.economy(NOW)
+    assert budget.projected_exhaustion(NOW) is None
+
+    budget.configure(10, "hour")
+    budget.record(5001, NOW)
+    assert budget.used == 1
+
+
+def test_outside_work_hours():
+    """Fleet work days are matched by name or ISO number."""
+    # NOW is a Friday
+    weekdays = {"primaryFleet": {"workHours": [{"day": "MONDAY"}, {"day": 5}]}}
+    weekend = {"primaryFleet": {"workHours": [{"day": "saturday"}, {"day": 7}]}}
+
+    assert not outside_work_hours(weekdays, NOW)
+    assert outside_work_hours(weekend, NOW)
+    assert not outside_work_hours({"primaryFleet": {"workHours": []}}, NOW)
+    assert not outside_work_hours({"primaryFleet": None}, NOW)
+
+
+def test_snoozed_until():
+    """Active snoozes pause polling until they end."""
+    end = NOW + timedelta(hours=3)
+    snoozed = {
+        "snoozes": [
+            {"start": (NOW - timedelta(hours=1)).isoformat(), "end": end.isoformat()}
+        ]
+    }
+    assert snoozed_until(snoozed, NOW) == end
+    assert snoozed_until(snoozed, end) is None
+
+    upcoming = {"snoozes": [{"start": end.isoformat(), "active": False}]}
+    assert snoozed_until(upcoming, NOW) is None
+
+    open_ended = {"snoozes": [{"active": True}]}
+    assert snoozed_until(open_ended, NOW) == NOW + SNOOZE_RECHECK_INTERVAL
+    assert snoozed_until({"snoozes": None}, NOW) is None
+
+
+def test_quiet_hours():
+    """Quiet hours may span midnight."""
+    overnight = (time(22), time(6))
+    assert in_quiet_hours(overnight, NOW.replace(hour=23))
+    assert in_quiet_hours(overnight, NOW.replace(hour=5))
+    assert not in_quiet_hours(overnight, NOW.replace(hour=6))
+    assert not in_quiet_hours(None, NOW)
+    assert in_quiet_hours((time(12), time(13)), NOW.replace(hour=12, minute=30))
+    assert quiet_hours_end(overnight, NOW.replace(hour=23)) == NOW.replace(
+        hour=6, minute=0
+    ) + timedelta(days=1)
+
+
+def test_scheduler_work_hours_snoozes_and_quiet_hours():
+    """Off-hours and snoozed vehicles are polled slowly and not watched."""
+    scheduler = PollScheduler(BASE)
+    scheduler.record("weekend", {"primaryFleet": {"workHours": [{"day": 6}]}}, NOW)
+    end = NOW + timedelta(hours=8)
+    scheduler.record(
+        "snoozed",
+        {
+            "ignition": {"on": True},
+            "snoozes": [{"active": True, "end": end.isoformat()}],
+        },
+        NOW,
+    )
+
+    assert scheduler.next_poll("weekend") == NOW + OFF_HOURS_INTERVAL
+    assert scheduler.next_poll("snoozed") == end
+    assert not scheduler.watched("weekend")
+    assert not scheduler.watched("snoozed")
+    # Nothing is watched, so the scheduler sleeps until the first vehicle is due
+    assert scheduler.next_wakeup(NOW) == OFF_HOURS_INTERVAL
+
+    scheduler.record("private", {}, NOW)
+    assert scheduler.watched("private")
+    assert scheduler.next_wakeup(NOW) == BASE
+
+    scheduler.quiet_hours = (time(10), time(18))
+    assert scheduler.due({"weekend", "private"}, NOW + PARKED_INTERVAL * 10) == set()
+    assert scheduler.next_wakeup(NOW) == timedelta(hours=7, minutes=30)
+
+
+def test_scheduler_select_earliest_deadline_first():
+    """Due vehicles are picked by deadline, boosted when active, up to capacity."""
+    scheduler = PollScheduler(timedelta(hours=1))
+    scheduler.record("parked-early", {}, NOW - timedelta(hours=2))
+    scheduler.record("parked-late", {}, NOW - timedelta(hours=1))
+    scheduler.record("charging", {"isCharging": True}, NOW - timedelta(hours=1))
+
+    now = NOW + timedelta(minutes=5)
+    ids = {"parked-early", "parked-late", "charging", "new"}
+    assert scheduler.select(ids, now, 10) == [
+        "new",
+        "parked-early",
+        "charging",
+        "parked-late",
+    ]
+    assert scheduler.select(ids, now, 2) == ["new", "parked-early"]
+    assert scheduler.select(ids, now, 0) == []
+
+
+def test_scheduler_missed_deadlines_and_data_age():
+    """Late fetches count as missed deadlines, except after quiet hours."""
+    scheduler = PollScheduler(BASE)
+    scheduler.record("a", {}, NOW)
+    assert scheduler.data_age("a", NOW + timedelta(minutes=1)) == timedelta(minutes=1)
+    assert scheduler.data_age("b", NOW) is None
+
+    # On time
+    scheduler.record("a", {}, NOW + PARKED_INTERVAL)
+    assert scheduler.missed_deadlines == 0
+
+    # Late
+    scheduler.record("a", {}, NOW + PARKED_INTERVAL * 3)
+    assert scheduler.missed_deadlines == 1
+
+    # Deferred by quiet hours
+    scheduler.quiet_hours = (time(11), time(12))
+    scheduler.record("a", {}, NOW + timedelta(hours=2))
+    assert scheduler.missed_deadlines == 1
+
+
+def test_stagger_offset_and_jitter():
+    """Offsets spread accounts over the interval; jitter only lengthens it."""
+    interval = timedelta(seconds=60)
+    assert stagger_offset(0, 1, interval) == timedelta(0)
+    assert [stagger_offset(position, 4, interval) for position in range(4)] == [
+        timedelta(seconds=seconds) for seconds in (0, 15, 30, 45)
+    ]
+    assert jittered(interval, timedelta(0)) == interval
+    assert (
+        interval
+        <= jittered(interval, timedelta(seconds=5))
+        <= interval + timedelta(seconds=5)
+    )
+
+
+def test_outage_backoff_doubles_up_to_cap():
+    """The interval doubles per failed poll and is capped."""
+    interval = timedelta(seconds=60)
+    assert outage_backoff(interval, 0) == interval
+    assert outage_backoff(interval, 1) == timedelta(seconds=120)
+    assert outage_backoff(interval, 3) == timedelta(seconds=480)
+    assert outage_backoff(interval, 100) == MAX_OUTAGE_INTERVAL
+    # A normal interval longer than the cap is kept
+    assert outage_backoff(timedelta(hours=1), 5) == timedelta(hours=1)
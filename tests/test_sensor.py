@@ -250,7 +250,7 @@ async def test_sensor_setup_entry_empty_data(hass):
     await async_setup_entry(hass, config_entry, capture_entities)  # type: ignore[arg-type]
 
     # Should handle empty data gracefully
-    assert len(added_entities) == 0
+    assert not [e for e in added_entities if isinstance(e, VolkswagenGoConnectSensor)]
 
 
 @pytest.mark.asyncio
@@ -272,7 +272,7 @@ async def test_sensor_setup_entry_no_vehicles(hass):
 
     await async_setup_entry(hass, config_entry, capture_entities)  # type: ignore[arg-type]
 
-    assert len(added_entities) == 0
+    assert not [e for e in added_entities if isinstance(e, VolkswagenGoConnectSensor)]
 
 
 @pytest.mark.asyncio
@@ -437,7 +437,7 @@ async def test_sensor_setup_entry_with_null_vehicle():
     await async_setup_entry(hass, config_entry, capture_entities)  # type: ignore[arg-type]
 
     # Should skip null vehicles gracefully
-    assert len(added_entities) == 0
+    assert not [e for e in added_entities if isinstance(e, VolkswagenGoConnectSensor)]
 
 
 @pytest.mark.asyncio
@@ -669,3 +669,146 @@ async def test_sensor_extra_state_attributes_charging_status_empty_dict(
 
     # Should return None when all attributes are None
     assert sensor.extra_state_attributes is None
+
+
+@pytest.mark.asyncio
+async def test_sensor_bulky_attributes_unrecorded(mock_api_data):
+    """Only bulky workshop and brand attributes are kept out of the recorder."""
+    from custom_components.volkswagen_goconnect.sensor import (
+        SENSOR_CLASSES,
+        WEEKDAYS,
+    )
+
+    coordinator = MagicMock()
+    coordinator.data = mock_api_data
+    vehicle_data = mock_api_data["data"]["viewer"]["vehicles"][0]
+
+    def _sensor(key):
+        desc = next(desc for desc in ENTITY_DESCRIPTIONS if desc.key == key)
+        return SENSOR_CLASSES.get(key, VolkswagenGoConnectSensor)(
+            coordinator=coordinator,
+            entity_description=desc,
+            vehicle=vehicle_data,
+        )
+
+    workshop = _sensor("workshop")
+    assert workshop.extra_state_attributes
+    for day in WEEKDAYS:
+        assert f"opening_hours_{day}_from" in workshop._unrecorded_attributes
+        assert f"opening_hours_{day}_to" in workshop._unrecorded_attributes
+    assert "address" in workshop._unrecorded_attributes
+    # Short identifying attributes are still recorded
+    for key in ("id", "name", "latitude", "longitude"):
+        assert key not in workshop._unrecorded_attributes
+
+    brand = _sensor("brandContactInfo")
+    assert brand.extra_state_attributes
+    assert "webshop_url" in brand._unrecorded_attributes
+    assert "roadside_assistance_name" not in brand._unrecorded_attributes
+
+    # Other sensors record all their attributes
+    assert "address" not in _sensor("odometer")._unrecorded_attributes
+
+
+@pytest.mark.asyncio
+async def test_sensor_charging_status_attributes_recorded(mock_api_data):
+    """Charging session attributes are still recorded."""
+    coordinator = MagicMock()
+    coordinator.data = mock_api_data
+    desc = next(desc for desc in ENTITY_DESCRIPTIONS if desc.key == "chargingStatus")
+    sensor = VolkswagenGoConnectSensor(
+        coordinator=coordinator,
+        entity_description=desc,
+        vehicle=mock_api_data["data"]["viewer"]["vehicles"][0],
+    )
+
+    attributes = sensor.extra_state_attributes
+    assert attributes
+    assert not set(attributes) & sensor._unrecorded_attributes
+
+
+def test_static_vehicle_sensors_are_diagnostic():
+    """Static vehicle facts are diagnostic entities."""
+    from homeassistant.const import EntityCategory
+
+    categories = {desc.key: desc.entity_category for desc in ENTITY_DESCRIPTIONS}
+    for key in ("id", "vin", "make", "model", "year"):
+        assert categories[key] == EntityCategory.DIAGNOSTIC
+    assert categories["odometer"] is None
+
+
+@pytest.mark.asyncio
+async def test_account_sensors_report_request_budget(hass):
+    """Test the account sensors report the request budget."""
+    from datetime import UTC, datetime, timedelta
+    from unittest.mock import patch
+
+    from custom_components.volkswagen_goconnect.scheduler import RequestBudget
+    from custom_components.volkswagen_goconnect.sensor import (
+        VolkswagenGoConnectAccountSensor,
+        async_setup_entry,
+    )
+
+    coordinator = MagicMock()
+    coordinator.data = {}
+    coordinator.config_entry.entry_id = "entry-id"
+    coordinator.budget = RequestBudget(limit=1000, period="hour")
+    start = datetime(2025, 12, 19, 10, 0, tzinfo=UTC)
+    now = start + timedelta(minutes=20)
+    coordinator.budget.record(0, start)
+    coordinator.budget.record(600, now)
+
+    config_entry = MagicMock()
+    config_entry.runtime_data.coordinator = coordinator
+    added_entities = []
+    await async_setup_entry(hass, config_entry, added_entities.extend)  # type: ignore[arg-type]
+
+    used, exhaustion, missed = added_entities
+    assert isinstance(used, VolkswagenGoConnectAccountSensor)
+    assert used.unique_id == "entry-id_request_budget_used"
+    assert used.native_value == 600
+    assert used.extra_state_attributes["limit"] == 1000
+    with patch(
+        "custom_components.volkswagen_goconnect.sensor.dt_util.now", return_value=now
+    ):
+        # 400 requests left at 1800 per hour
+        assert exhaustion.native_value == now + timedelta(seconds=800)
+    assert exhaustion.extra_state_attributes is None
+
+    coordinator.missed_deadlines = 3
+    assert missed.native_value == 3
+
+
+@pytest.mark.asyncio
+async def test_sensor_data_age(mock_api_data):
+    """Test the data age sensor reports when the vehicle was last fetched."""
+    from custom_components.volkswagen_goconnect.sensor import ENTITY_DESCRIPTIONS
+
+    coordinator = MagicMock()
+    coordinator.data = mock_api_data
+    coordinator.vehicle_data_age.return_value = 42
+
+    sensor = VolkswagenGoConnectSensor(
+        coordinator=coordinator,
+        entity_description=next(
+            desc for desc in ENTITY_DESCRIPTIONS if desc.key == "data_age"
+        ),
+        vehicle=mock_api_data["data"]["viewer"]["vehicles"][0],
+    )
+
+    assert sensor.native_value == 42
+    coordinator.vehicle_data_age.assert_called_once_with("test-vehicle-id")
+
+    # Only the data age sensor reports the age of a stale snapshot
+    coordinator.data_age_seconds = None
+    assert sensor.extra_state_attributes is None
+    coordinator.data_age_seconds = 300
+    assert sensor.extra_state_attributes == {"data_age_seconds": 300}
+    odometer = VolkswagenGoConnectSensor(
+        coordinator=coordinator,
+        entity_description=next(
+            desc for desc in ENTITY_DESCRIPTIONS if desc.key == "odometer"
+        ),
+        vehicle=mock_api_data["data"]["viewer"]["vehicles"][0],
+    )
+    assert odometer.extra_state_attributes is None
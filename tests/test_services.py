@@ -0,0 +1,97 @@
+"""Tests for the integration services."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.volkswagen_goconnect.const import DOMAIN
+from custom_components.volkswagen_goconnect.services import (
+    REFRESH_VEHICLE_SCHEMA,
+    SERVICE_REFRESH_VEHICLE,
+    async_setup_services,
+)
+
+
+def _register(hass, coordinator):
+    """Register the services and return the refresh handler."""
+    entry = MagicMock()
+    entry.state = ConfigEntryState.LOADED
+    entry.runtime_data.coordinator = coordinator
+    hass.config_entries.async_entries = MagicMock(return_value=[entry])
+    hass.services = MagicMock()
+
+    async_setup_services(hass)
+
+    domain, service, handler = hass.services.async_register.call_args[0]
+    assert (domain, service) == (DOMAIN, SERVICE_REFRESH_VEHICLE)
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_refresh_vehicle_by_vehicle_id(hass, mock_api_data):
+    """The service refreshes the requested vehicle through its coordinator."""
+    coordinator = MagicMock()
+    coordinator.data = mock_api_data
+    coordinator.async_request_vehicle_refresh = AsyncMock()
+    handler = _register(hass, coordinator)
+
+    call = MagicMock()
+    call.data = REFRESH_VEHICLE_SCHEMA({"vehicle_id": "test-vehicle-id"})
+    with patch("custom_components.volkswagen_goconnect.services.dr.async_get"):
+        await handler(call)
+
+    coordinator.async_request_vehicle_refresh.assert_called_once_with("test-vehicle-id")
+
+
+@pytest.mark.asyncio
+async def test_refresh_vehicle_by_device_id(hass, mock_api_data):
+    """Devices are resolved to their vehicle ids."""
+    coordinator = MagicMock()
+    coordinator.data = mock_api_data
+    coordinator.async_request_vehicle_refresh = AsyncMock()
+    handler = _register(hass, coordinator)
+
+    registry = MagicMock()
+    registry.async_get.return_value = MagicMock(
+        identifiers={(DOMAIN, "test-vehicle-id")}
+    )
+    call = MagicMock()
+    call.data = REFRESH_VEHICLE_SCHEMA({"device_id": "device-1"})
+    with patch(
+        "custom_components.volkswagen_goconnect.services.dr.async_get",
+        return_value=registry,
+    ):
+        await handler(call)
+
+    coordinator.async_request_vehicle_refresh.assert_called_once_with("test-vehicle-id")
+
+
+@pytest.mark.asyncio
+async def test_refresh_vehicle_unknown_vehicle(hass, mock_api_data):
+    """An unknown vehicle is rejected before anything is refreshed."""
+    coordinator = MagicMock()
+    coordinator.data = mock_api_data
+    coordinator.async_request_vehicle_refresh = AsyncMock()
+    handler = _register(hass, coordinator)
+
+    call = MagicMock()
+    call.data = REFRESH_VEHICLE_SCHEMA(
+        {"vehicle_id": ["test-vehicle-id", "other-vehicle"]}
+    )
+    with (
+        patch("custom_components.volkswagen_goconnect.services.dr.async_get"),
+        pytest.raises(ServiceValidationError),
+    ):
+        await handler(call)
+
+    coordinator.async_request_vehicle_refresh.assert_not_called()
+
+
+def test_refresh_vehicle_schema_requires_target():
+    """The service needs a device or a vehicle id."""
+    import voluptuous as vol
+
+    with pytest.raises(vol.Invalid):
+        REFRESH_VEHICLE_SCHEMA({})
@@ -0,0 +1,29 @@
+"""Tests for the shared HTTP session."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import HomeAssistant
+
+from custom_components.volkswagen_goconnect.session import (
+    CONNECTION_LIMIT_PER_HOST,
+    KEEPALIVE_TIMEOUT_SECONDS,
+    async_get_session,
+)
+
+
+@pytest.mark.asyncio
+async def test_async_get_session_is_shared_and_tuned(hass: HomeAssistant):
+    """Test all entries share one session with the tuned connector."""
+    hass.bus = MagicMock()
+    session = async_get_session(hass)
+    try:
+        assert async_get_session(hass) is session
+        assert session.connector.limit_per_host == CONNECTION_LIMIT_PER_HOST
+        assert session.connector.use_dns_cache
+        assert session.connector._keepalive_timeout == KEEPALIVE_TIMEOUT_SECONDS
+        hass.bus.async_listen_once.assert_called_once()
+        assert hass.bus.async_listen_once.call_args[0][0] == EVENT_HOMEASSISTANT_CLOSE
+    finally:
+        await session.close()
@@ -1,9 +1,16 @@
 """Tests for the switch platform."""
 
-from unittest.mock import AsyncMock, MagicMock
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from homeassistant.core import HomeAssistant
 
+from custom_components.volkswagen_goconnect.api import VolkswagenGoConnectApiClient
+from custom_components.volkswagen_goconnect.const import CONF_FAST_POLL_DURATION
+from custom_components.volkswagen_goconnect.coordinator import (
+    VolkswagenGoConnectDataUpdateCoordinator,
+)
 from custom_components.volkswagen_goconnect.switch import (
     ENTITY_DESCRIPTIONS,
     VolkswagenGoConnectSwitch,
@@ -11,9 +18,27 @@ from custom_components.volkswagen_goconnect.switch import (
 )
 
 
+def _coordinator(options=None):
+    """Create a coordinator with its timers mocked out."""
+    with patch(
+        "custom_components.volkswagen_goconnect.coordinator.DataUpdateCoordinator.__init__",
+        return_value=None,
+    ):
+        coordinator = VolkswagenGoConnectDataUpdateCoordinator(
+            hass=MagicMock(spec=HomeAssistant),
+            client=AsyncMock(spec=VolkswagenGoConnectApiClient),
+            update_interval=timedelta(seconds=60),
+        )
+    coordinator.hass = MagicMock()
+    coordinator.config_entry = MagicMock()
+    coordinator.config_entry.options = options or {}
+    coordinator.async_update_listeners = MagicMock()
+    return coordinator
+
+
 @pytest.mark.asyncio
 async def test_switch_setup_entry(mock_api_data):
-    """Test switch setup entry."""
+    """Test a fast tracking switch is created per vehicle."""
     coordinator = MagicMock()
     coordinator.data = mock_api_data
 
@@ -33,53 +58,80 @@ async def test_switch_setup_entry(mock_api_data):
     await async_setup_entry(hass, config_entry, capture_entities)  # type: ignore[arg-type]
 
     # Verify entities were added
-    assert len(added_entities) > 0
-    assert all(isinstance(e, VolkswagenGoConnectSwitch) for e in added_entities)
+    assert len(added_entities) == 1
+    assert isinstance(added_entities[0], VolkswagenGoConnectSwitch)
+    assert added_entities[0].unique_id == "vwgc_ABC123_fast_tracking"
 
 
 @pytest.mark.asyncio
-async def test_switch_is_on():
-    """Test switch is_on property."""
-    coordinator = MagicMock()
+async def test_switch_is_off_by_default(mock_api_data):
+    """Test the switch is off while the vehicle polls normally."""
+    coordinator = _coordinator()
 
     switch = VolkswagenGoConnectSwitch(
         coordinator=coordinator,
         entity_description=ENTITY_DESCRIPTIONS[0],
+        vehicle=mock_api_data["data"]["viewer"]["vehicles"][0],
     )
 
-    # Default should be False
     assert switch.is_on is False
+    assert switch.extra_state_attributes is None
 
 
 @pytest.mark.asyncio
-async def test_switch_turn_on():
-    """Test turning switch on."""
-    coordinator = MagicMock()
-    coordinator.async_request_refresh = AsyncMock()
+async def test_switch_turn_on_and_off(mock_api_data):
+    """Test turning the switch on starts fast polling for that vehicle only."""
+    coordinator = _coordinator({CONF_FAST_POLL_DURATION: 10})
 
     switch = VolkswagenGoConnectSwitch(
         coordinator=coordinator,
         entity_description=ENTITY_DESCRIPTIONS[0],
+        vehicle=mock_api_data["data"]["viewer"]["vehicles"][0],
     )
 
-    await switch.async_turn_on()
-
-    # Verify refresh was called
-    coordinator.async_request_refresh.assert_called_once()
+    cancel = MagicMock()
+    with patch(
+        "custom_components.volkswagen_goconnect.coordinator.async_track_time_interval",
+        return_value=cancel,
+    ) as track:
+        await switch.async_turn_on()
 
+    assert switch.is_on is True
+    assert "ends_at" in switch.extra_state_attributes
+    assert track.call_args[0][2] == timedelta(seconds=15)
+    assert coordinator.fast_poll_ends_at("other-vehicle") is None
+    coordinator.config_entry.async_create_background_task.assert_called_once()
+    coordinator.config_entry.async_create_background_task.call_args[0][1].close()
 
-@pytest.mark.asyncio
-async def test_switch_turn_off():
-    """Test turning switch off."""
-    coordinator = MagicMock()
-    coordinator.async_request_refresh = AsyncMock()
+    await switch.async_turn_off()
 
-    switch = VolkswagenGoConnectSwitch(
-        coordinator=coordinator,
-        entity_description=ENTITY_DESCRIPTIONS[0],
-    )
+    assert switch.is_on is False
+    cancel.assert_called_once()
+    assert coordinator.async_update_listeners.call_count == 2
 
-    await switch.async_turn_off()
 
-    # Verify refresh was called
-    coordinator.async_request_refresh.assert_called_once()
+@pytest.mark.asyncio
+async def test_switch_turns_itself_off(mock_api_data):
+    """Test fast polling ends once the configured duration elapsed."""
+    from homeassistant.util import dt as dt_util
+
+    coordinator = _coordinator({CONF_FAST_POLL_DURATION: 10})
+
+    with patch(
+        "custom_components.volkswagen_goconnect.coordinator.async_track_time_interval",
+        return_value=MagicMock(),
+    ) as track:
+        coordinator.async_start_fast_poll("test-vehicle-id")
+    tick = track.call_args[0][1]
+    coordinator.config_entry.async_create_background_task.call_args[0][1].close()
+
+    # A tick inside the window refreshes the vehicle
+    tick(dt_util.utcnow() + timedelta(minutes=5))
+    assert coordinator.config_entry.async_create_background_task.call_count == 2
+    coordinator.config_entry.async_create_background_task.call_args[0][1].close()
+    assert coordinator.fast_poll_ends_at("test-vehicle-id") is not None
+
+    # A tick after the window ends fast polling
+    tick(dt_util.utcnow() + timedelta(minutes=11))
+    assert coordinator.fast_poll_ends_at("test-vehicle-id") is None
+    assert coordinator.config_entry.async_create_background_task.call_count == 2